@@ -0,0 +1,154 @@
+import pygame
+from pygame import Surface
+from collections import OrderedDict
+from GameFrame.Globals import Globals
+
+
+class AssetCache:
+    """
+    A process-wide cache of loaded, converted and scaled image surfaces.
+
+    Surfaces are keyed by (path, width, height), so each image file is decoded
+    from disk once and each size it is shown at is scaled once. The cache keeps
+    to a memory budget by dropping the least recently used surfaces first.
+
+    Surfaces returned by the cache are shared between every object that asks
+    for the same key, so they should not be drawn on directly.
+
+    Attributes:
+        budget (int): Maximum number of bytes of surfaces to keep.
+        used (int): Number of bytes of surfaces currently kept.
+        hits (int): Number of requests answered from the cache.
+        misses (int): Number of requests that had to load or scale an image.
+        evictions (int): Number of surfaces dropped to stay within budget.
+    """
+
+    _shared = None
+
+    def __init__(self, budget: int):
+        """
+        Initializes an empty AssetCache.
+
+        Args:
+            budget (int): Maximum number of bytes of surfaces to keep.
+        """
+        self.budget = budget
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._images = OrderedDict()
+
+    @classmethod
+    def shared(cls) -> 'AssetCache':
+        """
+        Returns the cache shared by the whole game, creating it on first use.
+
+        Returns:
+            AssetCache: The shared cache, sized by Globals.IMAGE_CACHE_BUDGET.
+        """
+        if cls._shared is None:
+            cls._shared = cls(Globals.IMAGE_CACHE_BUDGET)
+        return cls._shared
+
+    def get_image(self, path: str, width: int = None, height: int = None) -> Surface:
+        """
+        Returns the image at path, converted for fast drawing and optionally scaled.
+
+        Args:
+            path (str): Path to the image file.
+            width (int, optional): Width to scale the image to. Defaults to the image's own size.
+            height (int, optional): Height to scale the image to. Defaults to the image's own size.
+
+        Returns:
+            Surface: The shared surface for this path and size.
+        """
+        key = (path, width, height)
+        surface = self._images.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        return self._load(path, width, height)
+
+    def _load(self, path: str, width: int = None, height: int = None) -> Surface:
+        """
+        Returns the image for a path and size, from the cache or loaded into it, without counting a hit or miss.
+
+        Args:
+            path (str): Path to the image file.
+            width (int, optional): Width to scale the image to. Defaults to the image's own size.
+            height (int, optional): Height to scale the image to. Defaults to the image's own size.
+
+        Returns:
+            Surface: The shared surface for this path and size.
+        """
+        key = (path, width, height)
+        surface = self._images.get(key)
+        if surface is not None:
+            self._images.move_to_end(key)
+            return surface
+
+        if width is None or height is None:
+            surface = pygame.image.load(path).convert_alpha()
+        else:
+            # - Scaled copies share the cached original, which is not counted as a request - #
+            surface = pygame.transform.scale(self._load(path), (width, height))
+        self._images[key] = surface
+        self.used += self._size_of(surface)
+        self._evict()
+        return surface
+
+    def _evict(self):
+        """
+        Drops least recently used surfaces until the cache is within budget.
+
+        The most recently added surface is always kept.
+        """
+        while self.used > self.budget and len(self._images) > 1:
+            key, surface = self._images.popitem(last=False)
+            self.used -= self._size_of(surface)
+            self.evictions += 1
+
+    @staticmethod
+    def _size_of(surface: Surface) -> int:
+        """
+        Returns the number of bytes of pixel data held by a surface.
+
+        Args:
+            surface (Surface): The surface to measure.
+
+        Returns:
+            int: Size of the surface's pixel data in bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters, for sizing the budget.
+
+        Returns:
+            dict: Entries, bytes used, budget, hits, misses, evictions and hit rate.
+        """
+        requests = self.hits + self.misses
+        return {
+            'entries': len(self._images),
+            'used': self.used,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / requests if requests else 0.0,
+        }
+
+    def clear(self):
+        """
+        Empties the cache and resets its counters.
+        """
+        self._images.clear()
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
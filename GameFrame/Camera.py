@@ -0,0 +1,116 @@
+import pygame
+from typing import Optional, Tuple
+
+
+class Camera:
+    """
+    Chooses which part of a room larger than the screen is shown.
+
+    The camera's view is a screen-sized rect in room coordinates. Objects
+    keep their room positions and are drawn shifted by the view's top left
+    corner, so moving the camera never touches the objects themselves. The
+    view can follow an object, keeping it in the middle of the screen, and
+    is kept inside the room's bounds so nothing beyond the edge is shown.
+
+    Attributes:
+        view (pygame.Rect): The part of the room shown on the screen, in room coordinates.
+        bounds (pygame.Rect): The area the view is kept inside, None to let it go anywhere.
+        target (RoomObject): The object kept in the middle of the view, None when not following one.
+        moved (bool): Whether the view moved in the last update.
+    """
+
+    def __init__(self, width: int, height: int, bounds: pygame.Rect = None):
+        """
+        Initializes the camera at the top left of the room.
+
+        Args:
+            width (int): Width of the view in pixels, usually the screen's.
+            height (int): Height of the view in pixels, usually the screen's.
+            bounds (pygame.Rect, optional): The area to keep the view inside. Defaults to no limit.
+        """
+        self.view = pygame.Rect(0, 0, width, height)
+        self.bounds = bounds
+        self.target = None
+        self.moved = False
+        self._last = self.view.topleft
+
+    def follow(self, target: Optional['RoomObject']):
+        """
+        Keeps an object in the middle of the view from now on.
+
+        Args:
+            target (RoomObject): The object to follow, None to stop following.
+        """
+        self.target = target
+        if target is not None:
+            self.center_on(*self._middle_of(target))
+
+    def move_to(self, x: float, y: float):
+        """
+        Moves the top left of the view to a point, as far as the bounds allow.
+
+        Args:
+            x (float): X-coordinate in the room.
+            y (float): Y-coordinate in the room.
+        """
+        self.view.topleft = (int(x), int(y))
+        if self.bounds is not None:
+            # - A room smaller than the view is centred in it - #
+            self.view.clamp_ip(self.bounds)
+
+    def center_on(self, x: float, y: float):
+        """
+        Moves the middle of the view to a point, as far as the bounds allow.
+
+        Args:
+            x (float): X-coordinate in the room.
+            y (float): Y-coordinate in the room.
+        """
+        self.move_to(x - self.view.width // 2, y - self.view.height // 2)
+
+    def update(self):
+        """
+        Follows the target and notes whether the view moved. Called by the Level every frame, before drawing.
+        """
+        if self.target is not None:
+            self.center_on(*self._middle_of(self.target))
+        topleft = self.view.topleft
+        self.moved = topleft != self._last
+        self._last = topleft
+
+    @staticmethod
+    def _middle_of(target) -> Tuple[float, float]:
+        """
+        Args:
+            target (RoomObject): The object.
+
+        Returns:
+            tuple: (x, y) of the middle of the object's image in the room.
+        """
+        return target.x + target.width / 2, target.y + target.height / 2
+
+    def to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Converts a point in the room to where it is drawn on the screen.
+
+        Args:
+            x (float): X-coordinate in the room.
+            y (float): Y-coordinate in the room.
+
+        Returns:
+            tuple: (x, y) on the screen.
+        """
+        return x - self.view.x, y - self.view.y
+
+    def to_room(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Converts a point on the screen, such as the mouse position, to the room.
+
+        Args:
+            x (float): X-coordinate on the screen.
+            y (float): Y-coordinate on the screen.
+
+        Returns:
+            tuple: (x, y) in the room.
+        """
+        return x + self.view.x, y + self.view.y
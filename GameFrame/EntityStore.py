@@ -0,0 +1,275 @@
+import numpy as np
+import pygame
+from array import array
+
+
+class EntityStore:
+    """
+    Keeps the motion state of a Level's objects in contiguous NumPy arrays.
+
+    Position, previous position, speed, gravity and size are stored as one
+    array per field ("struct of arrays"), so the level can move every stored
+    object with a handful of vectorized operations per frame instead of
+    calling RoomObject.update on each one. Each field is a Python array.array
+    with a NumPy view over the same memory: the view is used for whole-store
+    operations and the array.array for reading and writing single objects,
+    which is several times faster than indexing a NumPy array from Python.
+
+    When an object is added, its class is swapped for a generated subclass
+    with the same name whose x, y, prev_x, prev_y, x_speed, y_speed, gravity,
+    width and height attributes read and write the arrays. Existing game code
+    keeps working unchanged, and collision registration by class name is not
+    affected. Positions and speeds are stored as floats, sizes as integers.
+
+    Copying every position into its pygame.Rect would cost as much as the
+    update it replaces, so an object's rect is brought up to date when it is
+    next read instead. Objects nobody checks collisions against never pay for it.
+
+    Only objects that do not override update() are stored; the level still
+    calls update() on the others.
+
+    Attributes:
+        objects (list): The stored objects, in slot order.
+        x, y, prev_x, prev_y, x_speed, y_speed, gravity (numpy.ndarray): Float fields, one entry per slot.
+        width, height (numpy.ndarray): Integer fields, one entry per slot.
+        version (int): Counts integrate() calls; rects synced at an older version are out of date.
+    """
+
+    FLOAT_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'x_speed', 'y_speed', 'gravity')
+    INT_FIELDS = ('width', 'height')
+
+    _stored_classes = {}
+
+    def __init__(self, capacity: int = 256):
+        """
+        Initializes an empty EntityStore.
+
+        Args:
+            capacity (int, optional): The number of slots to allocate up front. Defaults to 256.
+        """
+        self.objects = []
+        self.version = 0
+        self._capacity = capacity
+        # - One array.array per field, in FLOAT_FIELDS + INT_FIELDS order - #
+        self._columns = [array('d', bytes(8 * capacity)) for _ in self.FLOAT_FIELDS]
+        self._columns += [array('q', bytes(8 * capacity)) for _ in self.INT_FIELDS]
+        # - Last position each object was filed under in the spatial hash - #
+        self._synced_x = np.zeros(capacity, dtype=np.float64)
+        self._synced_y = np.zeros(capacity, dtype=np.float64)
+        self._make_views()
+
+    def _make_views(self):
+        """
+        Points the NumPy field attributes (x, y, ...) at the current columns.
+        """
+        for field, column in zip(self.FLOAT_FIELDS + self.INT_FIELDS, self._columns):
+            setattr(self, field, np.frombuffer(column, dtype=np.float64 if column.typecode == 'd' else np.int64))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored objects.
+        """
+        return len(self.objects)
+
+    @staticmethod
+    def can_store(room_object) -> bool:
+        """
+        Checks whether an object's motion can be handled by the store.
+
+        Args:
+            room_object (RoomObject): The object to check.
+
+        Returns:
+            bool: True if the object's class uses the standard RoomObject.update.
+        """
+        from GameFrame.RoomObject import RoomObject
+        return type(room_object).update is RoomObject.update
+
+    def add(self, room_object):
+        """
+        Moves an object's motion state into the store and binds its attributes to it.
+
+        Args:
+            room_object (RoomObject): The object to store.
+        """
+        slot = len(self.objects)
+        if slot == self._capacity:
+            self._grow()
+        values = room_object.__dict__
+        for field in self.FLOAT_FIELDS + self.INT_FIELDS:
+            getattr(self, field)[slot] = values.pop(field)
+        self._synced_x[slot] = self.x[slot]
+        self._synced_y[slot] = self.y[slot]
+        self.objects.append(room_object)
+        room_object._entity_store = self
+        room_object._entity_slot = slot
+        room_object._rect = values.pop('rect')
+        room_object._rect_version = self.version
+        room_object.__class__ = self._stored_class(type(room_object))
+
+    def remove(self, room_object):
+        """
+        Copies an object's motion state back onto it and frees its slot.
+
+        The last stored object is moved into the freed slot, so removal is O(1).
+
+        Args:
+            room_object (RoomObject): The stored object to remove.
+        """
+        slot = room_object._entity_slot
+        values = {field: getattr(room_object, field) for field in self.FLOAT_FIELDS + self.INT_FIELDS}
+        values['rect'] = room_object.rect
+        room_object.__class__ = type(room_object)._store_origin
+        room_object.__dict__.update(values)
+        for attribute in ('_entity_store', '_entity_slot', '_rect', '_rect_version'):
+            del room_object.__dict__[attribute]
+
+        last = len(self.objects) - 1
+        moved = self.objects.pop()
+        if moved is not room_object:
+            for field in self.FLOAT_FIELDS + self.INT_FIELDS:
+                column = getattr(self, field)
+                column[slot] = column[last]
+            self._synced_x[slot] = self._synced_x[last]
+            self._synced_y[slot] = self._synced_y[last]
+            self.objects[slot] = moved
+            moved._entity_slot = slot
+
+    def save_positions(self):
+        """
+        Copies every stored object's position into its previous position.
+        """
+        count = len(self.objects)
+        self.prev_x[:count] = self.x[:count]
+        self.prev_y[:count] = self.y[:count]
+
+    def integrate(self):
+        """
+        Applies gravity and speed to every stored object, as RoomObject.update does.
+        """
+        count = len(self.objects)
+        self.y_speed[:count] += self.gravity[:count]
+        self.x[:count] += self.x_speed[:count]
+        self.y[:count] += self.y_speed[:count]
+        self.version += 1
+
+    def moved_objects(self) -> list:
+        """
+        Returns the stored objects whose position changed since the last call.
+
+        Used to refile only the objects that moved in the level's spatial hash.
+
+        Returns:
+            list: The moved objects.
+        """
+        count = len(self.objects)
+        x = self.x[:count]
+        y = self.y[:count]
+        moved = np.flatnonzero((x != self._synced_x[:count]) | (y != self._synced_y[:count]))
+        self._synced_x[moved] = x[moved]
+        self._synced_y[moved] = y[moved]
+        objects = self.objects
+        return [objects[slot] for slot in moved.tolist()]
+
+    def _grow(self):
+        """
+        Doubles the number of slots.
+        """
+        # - The NumPy views must be released before the columns can be resized - #
+        for field in self.FLOAT_FIELDS + self.INT_FIELDS:
+            setattr(self, field, None)
+        for column in self._columns:
+            column.extend(array(column.typecode, bytes(8 * self._capacity)))
+        self._capacity *= 2
+        self._make_views()
+        for field in ('_synced_x', '_synced_y'):
+            old = getattr(self, field)
+            new = np.zeros(self._capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, field, new)
+
+    @classmethod
+    def _stored_class(cls, origin: type) -> type:
+        """
+        Returns the subclass of origin whose motion attributes live in a store.
+
+        The subclass has the same name and module as origin, so it is found by
+        class-name lookups such as collision registration.
+
+        Args:
+            origin (type): The object's own class.
+
+        Returns:
+            type: The generated subclass, created once per class.
+        """
+        stored = cls._stored_classes.get(origin)
+        if stored is None:
+            namespace = {'__module__': origin.__module__, '__doc__': origin.__doc__,
+                         '_store_origin': origin}
+            for index, field in enumerate(cls.FLOAT_FIELDS):
+                namespace[field] = cls._field(index, float, field in ('x', 'y'))
+            for index, field in enumerate(cls.INT_FIELDS, len(cls.FLOAT_FIELDS)):
+                namespace[field] = cls._field(index, int, False)
+            namespace['rect'] = property(cls._get_rect, cls._set_rect)
+            stored = type(origin.__name__, (origin,), namespace)
+            stored.__qualname__ = origin.__qualname__
+            cls._stored_classes[origin] = stored
+        return stored
+
+    @staticmethod
+    def _field(index: int, cast: type, moves_rect: bool) -> property:
+        """
+        Returns a property that reads and writes one field of the object's store slot.
+
+        Args:
+            index (int): The field's column number.
+            cast (type): float or int, the type the column holds.
+            moves_rect (bool): Whether writing the field marks the object's rect as out of date.
+
+        Returns:
+            property: The attribute accessor.
+        """
+        def get(self):
+            return self._entity_store._columns[index][self._entity_slot]
+
+        if moves_rect:
+            def set(self, value):
+                self._entity_store._columns[index][self._entity_slot] = value
+                self._rect_version = -1
+        else:
+            def set(self, value):
+                self._entity_store._columns[index][self._entity_slot] = cast(value)
+
+        return property(get, set)
+
+    @staticmethod
+    def _get_rect(room_object):
+        """
+        Returns a stored object's rect, first moving it to the object's position if it is out of date.
+
+        Args:
+            room_object (RoomObject): The stored object.
+
+        Returns:
+            pygame.Rect: The object's rect.
+        """
+        rect = room_object._rect
+        store = room_object._entity_store
+        if room_object._rect_version != store.version and rect.__class__ is pygame.Rect:
+            slot = room_object._entity_slot
+            rect.x = store._columns[0][slot]
+            rect.y = store._columns[1][slot]
+            room_object._rect_version = store.version
+        return rect
+
+    @staticmethod
+    def _set_rect(room_object, rect):
+        """
+        Replaces a stored object's rect. The rect is taken as up to date.
+
+        Args:
+            room_object (RoomObject): The stored object.
+            rect (pygame.Rect): The new rect.
+        """
+        room_object._rect = rect
+        room_object._rect_version = room_object._entity_store.version
@@ -1,5 +1,12 @@
 import pygame
 from GameFrame import TextObject, Globals, Level
+from GameFrame.FontCache import FontCache
+
+# - Characters an entry accepts unless told otherwise - #
+DEFAULT_CHARACTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 '
+
+# - Width in pixels of the text cursor - #
+CURSOR_WIDTH = 2
 
 
 class EntryTextObject(TextObject):
@@ -9,14 +16,24 @@ class EntryTextObject(TextObject):
     Inherits from TextObject and allows for keyboard input, text editing,
     and focus management. Used for capturing player names or other short text entries.
 
+    Characters come from pygame TEXTINPUT events, so every character typed is
+    entered exactly once whatever the frame rate. Editing keys (backspace,
+    delete, left, right, home and end) come from key_down. Each character is
+    rendered once as a glyph and blitted into place, so typing only draws the
+    characters from the cursor onwards rather than the whole string.
+
     Attributes:
         max_len (int): Maximum allowed length of the input text.
+        allowed (str): The characters that can be typed, others are ignored.
+        uppercase (bool): Whether typed letters are turned into capitals.
+        cursor (int): Position in the text where the next character is inserted.
         handle_key_events (bool): Whether the object should handle key events.
         accepting_input (bool): Whether the object is currently accepting input.
         active (bool): Whether the object is currently focused and active.
     """
 
-    def __init__(self, room: Level, x: int, y: int, max_len=4):
+    def __init__(self, room: Level, x: int, y: int, max_len=4, allowed: str = DEFAULT_CHARACTERS,
+                 uppercase: bool = True):
         """
         Initializes the EntryTextObject.
 
@@ -25,158 +42,166 @@ class EntryTextObject(TextObject):
             x (int): The x-coordinate of the object.
             y (int): The y-coordinate of the object.
             max_len (int, optional): Maximum length of input text. Defaults to 4.
+            allowed (str, optional): The characters that can be typed. Defaults to A-Z, 0-9 and space.
+            uppercase (bool, optional): Turn typed letters into capitals. Defaults to True.
         """
-        TextObject.__init__(self, room, x, y, '')
-        self.max_len = max_len
-        self.handle_key_events = True
+        self.cursor = 0
+        self._glyphs = []
+        self._offsets = [0]
+        self._canvas = None
         self.accepting_input = True
         self.active = True
+        TextObject.__init__(self, room, x, y, '')
+        self.max_len = max_len
+        self.allowed = allowed
+        self.uppercase = uppercase
+        self.subscribe_key(pygame.K_BACKSPACE, pygame.K_DELETE, pygame.K_LEFT, pygame.K_RIGHT,
+                           pygame.K_HOME, pygame.K_END)
+        self.room.start_text_input(self)
 
     def accept_input(self):
         """
         Enables the object to accept input.
         """
         self.accepting_input = True
+        self._draw_from(self.cursor)
 
     def set_focus(self, in_focus: bool):
         """
         Sets the focus state of the object.
 
+        Text input is turned on while the object has focus, and off when it
+        loses focus, is deleted or the room ends, unless another object is
+        still reading text.
+
         Args:
             in_focus (bool): True if the object should be active, False otherwise.
         """
         self.active = in_focus
+        if in_focus:
+            self.room.start_text_input(self)
+        else:
+            self.room.stop_text_input(self)
+        self._draw_from(self.cursor)
 
-    def key_pressed(self, key):
+    def text_input(self, text: str):
         """
-        Handles key press events for text entry.
+        Inserts typed characters at the cursor.
 
         Args:
-            key: The pygame key state array.
+            text (str): The characters from a TEXTINPUT event.
         """
+        if not (self.accepting_input and self.active):
+            return
+        if self.uppercase:
+            text = text.upper()
+        text = ''.join(char for char in text if char in self.allowed)
+        text = text[:max(self.max_len - len(self.text), 0)]
+        if not text:
+            return
+        start = self.cursor
+        self.text = self.text[:start] + text + self.text[start:]
+        self._glyphs[start:start] = [self._glyph(char) for char in text]
+        self.cursor += len(text)
+        self._draw_from(start)
+        Globals.player_name = self.text
+
+    def key_down(self, key: int):
+        """
+        Edits the text or moves the cursor when an editing key is pressed.
+
+        Args:
+            key (int): The pygame key constant of the pressed key.
+        """
+        if not (self.accepting_input and self.active):
+            return
+        cursor = self.cursor
+        if key == pygame.K_BACKSPACE and cursor > 0:
+            self._delete(cursor - 1)
+        elif key == pygame.K_DELETE and cursor < len(self.text):
+            self._delete(cursor)
+        elif key == pygame.K_LEFT and cursor > 0:
+            self.cursor -= 1
+            self._draw_from(self.cursor)
+        elif key == pygame.K_RIGHT and cursor < len(self.text):
+            self.cursor += 1
+            self._draw_from(cursor)
+        elif key == pygame.K_HOME:
+            self.cursor = 0
+            self._draw_from(0)
+        elif key == pygame.K_END:
+            self.cursor = len(self.text)
+            self._draw_from(cursor)
+
+    def _delete(self, index: int):
+        """
+        Removes the character at index, moving the cursor back if it was after it.
+
+        Args:
+            index (int): Position of the character to remove.
+        """
+        self.text = self.text[:index] + self.text[index + 1:]
+        del self._glyphs[index]
+        if self.cursor > index:
+            self.cursor -= 1
+        self._draw_from(index)
+        Globals.player_name = self.text
+
+    def _glyph(self, char: str) -> pygame.Surface:
+        """
+        Returns a single character rendered in this object's font and colour.
+
+        Args:
+            char (str): The character.
+
+        Returns:
+            pygame.Surface: The shared rendered glyph.
+        """
+        return FontCache.shared().render(char, self.font, self.size, self.bold, self.colour)
+
+    def update_text(self):
+        """
+        Renders the whole text again, after text, font, size or colour were changed directly.
+        """
+        self.built_font = FontCache.shared().get_font(self.font, self.size, self.bold)
+        self._glyphs = [self._glyph(char) for char in self.text]
+        self.cursor = min(self.cursor, len(self.text))
+        self._canvas = None
+        self._draw_from(0)
+
+    def _draw_from(self, index: int):
+        """
+        Redraws the glyphs from index onwards and the cursor, leaving earlier glyphs untouched.
+
+        Args:
+            index (int): Position of the first character to redraw.
+        """
+        if self.built_font == 0:
+            return
+        offsets = self._offsets
+        del offsets[index + 1:]
+        for glyph in self._glyphs[index:]:
+            offsets.append(offsets[-1] + glyph.get_width())
+        height = self.built_font.get_height()
+        width = offsets[-1] + CURSOR_WIDTH
+
+        canvas = self._canvas
+        if canvas is None or canvas.get_width() < width or canvas.get_height() != height:
+            # - Grow to twice the needed width, so long strings rarely reallocate - #
+            canvas = pygame.Surface((max(width * 2, 64), height), pygame.SRCALPHA)
+            index = 0
+            self._canvas = canvas
+        else:
+            canvas.fill((0, 0, 0, 0), (offsets[index], 0, canvas.get_width() - offsets[index], height))
+        canvas.blits([(glyph, (offsets[index + i], 0)) for i, glyph in enumerate(self._glyphs[index:])],
+                     doreturn=False)
         if self.accepting_input and self.active:
+            canvas.fill(self.colour, (offsets[self.cursor], 0, CURSOR_WIDTH, height))
 
-            key_recognised = False
-            if key[pygame.K_a]:
-                self.text += 'A'
-                key_recognised = True
-            elif key[pygame.K_b]:
-                self.text += 'B'
-                key_recognised = True
-            elif key[pygame.K_c]:
-                self.text += 'C'
-                key_recognised = True
-            elif key[pygame.K_d]:
-                self.text += 'D'
-                key_recognised = True
-            elif key[pygame.K_e]:
-                self.text += 'E'
-                key_recognised = True
-            elif key[pygame.K_f]:
-                self.text += 'F'
-                key_recognised = True
-            elif key[pygame.K_g]:
-                self.text += 'G'
-                key_recognised = True
-            elif key[pygame.K_h]:
-                self.text += 'H'
-                key_recognised = True
-            elif key[pygame.K_i]:
-                self.text += 'I'
-                key_recognised = True
-            elif key[pygame.K_j]:
-                self.text += 'J'
-                key_recognised = True
-            elif key[pygame.K_k]:
-                self.text += 'K'
-                key_recognised = True
-            elif key[pygame.K_l]:
-                self.text += 'L'
-                key_recognised = True
-            elif key[pygame.K_m]:
-                self.text += 'M'
-                key_recognised = True
-            elif key[pygame.K_n]:
-                self.text += 'N'
-                key_recognised = True
-            elif key[pygame.K_o]:
-                self.text += 'O'
-                key_recognised = True
-            elif key[pygame.K_p]:
-                self.text += 'P'
-                key_recognised = True
-            elif key[pygame.K_q]:
-                self.text += 'Q'
-                key_recognised = True
-            elif key[pygame.K_r]:
-                self.text += 'R'
-                key_recognised = True
-            elif key[pygame.K_s]:
-                self.text += 'S'
-                key_recognised = True
-            elif key[pygame.K_t]:
-                self.text += 'T'
-                key_recognised = True
-            elif key[pygame.K_u]:
-                self.text += 'U'
-                key_recognised = True
-            elif key[pygame.K_v]:
-                self.text += 'V'
-                key_recognised = True
-            elif key[pygame.K_w]:
-                self.text += 'W'
-                key_recognised = True
-            elif key[pygame.K_x]:
-                self.text += 'X'
-                key_recognised = True
-            elif key[pygame.K_y]:
-                self.text += 'Y'
-                key_recognised = True
-            elif key[pygame.K_z]:
-                self.text += 'Z'
-                key_recognised = True
-            elif key[pygame.K_SPACE]:
-                self.text += ' '
-                key_recognised = True
-            elif key[pygame.K_1]:
-                self.text += '1'
-                key_recognised = True
-            elif key[pygame.K_2]:
-                self.text += '2'
-                key_recognised = True
-            elif key[pygame.K_3]:
-                self.text += '3'
-                key_recognised = True
-            elif key[pygame.K_4]:
-                self.text += '4'
-                key_recognised = True
-            elif key[pygame.K_5]:
-                self.text += '5'
-                key_recognised = True
-            elif key[pygame.K_6]:
-                self.text += '6'
-                key_recognised = True
-            elif key[pygame.K_7]:
-                self.text += '7'
-                key_recognised = True
-            elif key[pygame.K_8]:
-                self.text += '8'
-                key_recognised = True
-            elif key[pygame.K_9]:
-                self.text += '9'
-                key_recognised = True
-            elif key[pygame.K_0]:
-                self.text += '0'
-                key_recognised = True
-            elif key[pygame.K_BACKSPACE]:
-                if len(self.text) > 0:
-                    self.text = self.text[:-1]
-                    key_recognised = True
-
-            if key_recognised:
-                if len(self.text) > self.max_len:
-                    self.text = self.text[:-1]
-                self.update_text()
-                Globals.player_name = self.text
-                self.accepting_input = False
-                self.set_timer(5, self.accept_input)
+        # - A new subsurface each change, so dirty-rect rendering sees the change - #
+        self.rendered_text = canvas.subsurface((0, 0, width, height))
+        self.image = self.rendered_text
+        self.width, self.height = width, height
+        self.rect = pygame.Rect(self.x, self.y, width, height)
+        if self.room.spatial_hash is not None:
+            self.room.spatial_hash.move(self)
@@ -0,0 +1,284 @@
+import threading
+import numpy as np
+import pygame
+from typing import List, Optional, Tuple
+from GameFrame.PathFinder import PathFinder
+
+
+class Field:
+    """
+    One worked out flow field: how far, and which way, every cell is from the target.
+
+    Attributes:
+        target_cell (tuple): The cell the target was on when the field was worked out.
+        distances (array): Moves from each cell to the target, -1 where it cannot be reached, by cell number.
+        directions (list): Angle in degrees to move from each cell, as used by RoomObject.set_direction,
+            or -1 where there is no way to go, by cell number.
+    """
+
+    def __init__(self, target_cell: Tuple[int, int], distances, directions: List[int]):
+        """
+        Initializes the field.
+
+        Args:
+            target_cell (tuple): The cell the target was on.
+            distances (array): The integration field.
+            directions (list): The direction field.
+        """
+        self.target_cell = target_cell
+        self.distances = distances
+        self.directions = directions
+
+
+class FlowField:
+    """
+    Directions towards a moving target from every cell of a PathFinder's grid, shared by any number of followers.
+
+    One breadth-first search from the target gives every cell its distance,
+    and each cell then points at its neighbour closest to the target. Each
+    follower just reads the direction for its own cell, so a crowd of any
+    size costs one search rather than one per follower.
+
+    The field is only worked out again when the target reaches another cell,
+    and never holds up a frame for long: the search is spread over as many
+    frames as it needs, a budget of cells at a time, or run on a worker
+    thread. Followers use the previous field until the new one is ready.
+    When the target moves again during a search, that search is finished
+    first and the latest position is searched next. The first field is
+    worked out straight away.
+
+    A worker thread shares the interpreter with the game, so spreading the
+    search over frames usually gives steadier frame times; the thread suits
+    grids whose search takes longer than a few frames' budget.
+
+    Attributes:
+        path_finder (PathFinder): The grid the field covers.
+        target (RoomObject): The object the field leads to.
+        field (Field): The latest worked out field.
+        budget (int): Cells searched per frame, 0 to work out each field at once.
+        threaded (bool): Whether later fields are worked out on a worker thread.
+        recomputes (int): Number of fields worked out.
+    """
+
+    # - Direction angles for the neighbours right, above, left and below - #
+    ANGLES = np.array((0, 90, 180, 270))
+
+    def __init__(self, path_finder: PathFinder, target, budget: int = 4096, threaded: bool = False):
+        """
+        Initializes the field and works out the first one.
+
+        Args:
+            path_finder (PathFinder): The grid, sized for the followers' hitbox.
+            target (RoomObject): The object to lead followers to.
+            budget (int, optional): Cells searched per frame, 0 to work out each field at once. Defaults to 4096.
+            threaded (bool, optional): Work out later fields on a worker thread instead. Defaults to False.
+        """
+        self.path_finder = path_finder
+        self.target = target
+        self.budget = budget
+        self.threaded = threaded
+        self.field: Optional[Field] = None
+        self.recomputes = 0
+        self._requested = None
+        self._wanted = None
+        self._search = None
+        self._search_cell = None
+        self._closed = False
+        self._thread = None
+        self._condition = threading.Condition()
+        cell, rect = self._target_area()
+        self._requested = cell
+        self.field = self._compute(cell, rect)
+
+    def _target_area(self) -> Tuple[Tuple[int, int], pygame.Rect]:
+        """
+        Returns:
+            tuple: The cell of the target's top left corner, and a copy of its hitbox.
+        """
+        target = self.target
+        rect = target.hitbox_at(target.x, target.y)
+        return self.path_finder.cell_at(rect.x, rect.y), rect
+
+    def update(self):
+        """
+        Asks for a new field if the target has reached another cell. Called by the Level every frame.
+        """
+        cell, rect = self._target_area()
+        if cell != self._requested:
+            self._requested = cell
+            if self.threaded:
+                self._request_work(cell, rect)
+            elif not self.budget:
+                self.field = self._compute(cell, rect)
+            elif self._search is None:
+                self._start_search(cell, rect)
+            else:
+                self._wanted = (cell, rect)
+        if self._search is not None:
+            self._continue_search()
+
+    def _start_search(self, cell: Tuple[int, int], rect: pygame.Rect):
+        """
+        Starts a search to be spread over the next frames.
+
+        Args:
+            cell (tuple): The cell of the target's top left corner.
+            rect (pygame.Rect): The target's hitbox.
+        """
+        finder = self.path_finder
+        self._search = finder.distance_rings(finder.cells_overlapping(rect))
+        self._search_cell = cell
+
+    def _continue_search(self):
+        """
+        Searches up to budget more cells, swapping in the new field when the search is done.
+        """
+        searched = 0
+        for distances, reached in self._search:
+            searched += reached
+            if searched >= self.budget:
+                return
+        self.field = self._finish(self._search_cell, distances)
+        self._search = None
+        if self._wanted is not None:
+            self._start_search(*self._wanted)
+            self._wanted = None
+
+    def _request_work(self, cell: Tuple[int, int], rect: pygame.Rect):
+        """
+        Hands a target position to the worker thread, starting it on first use.
+
+        Args:
+            cell (tuple): The cell of the target's top left corner.
+            rect (pygame.Rect): The target's hitbox.
+        """
+        with self._condition:
+            # - Only the latest position matters, an older request not yet started is replaced - #
+            self._wanted = (cell, rect)
+            self._condition.notify()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name='FlowField', daemon=True)
+            self._thread.start()
+
+    def _work(self):
+        """
+        Works out each requested field on the worker thread until the flow field is closed.
+        """
+        while True:
+            with self._condition:
+                while self._wanted is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                cell, rect = self._wanted
+                self._wanted = None
+            # - Swapped in whole, so followers never see a half worked out field - #
+            self.field = self._compute(cell, rect)
+
+    def _compute(self, cell: Tuple[int, int], rect: pygame.Rect) -> Field:
+        """
+        Works out the distance and direction fields for a target area.
+
+        Args:
+            cell (tuple): The cell of the target's top left corner.
+            rect (pygame.Rect): The target's hitbox.
+
+        Returns:
+            Field: The new field.
+        """
+        finder = self.path_finder
+        return self._finish(cell, finder.distances_from(finder.cells_overlapping(rect)))
+
+    def _finish(self, cell: Tuple[int, int], distances) -> Field:
+        """
+        Works out the direction field from a finished search.
+
+        Args:
+            cell (tuple): The cell of the target's top left corner.
+            distances (array): The distances from the search.
+
+        Returns:
+            Field: The new field.
+        """
+        finder = self.path_finder
+        # - Each cell points at whichever neighbour is fewest moves from the target - #
+        grid = np.frombuffer(distances, dtype=np.int32).reshape(finder.columns + 2, finder.rows + 2)
+        far = np.where(grid < 0, np.iinfo(np.int32).max, grid)
+        inner = far[1:-1, 1:-1]
+        neighbours = np.stack((far[2:, 1:-1], far[1:-1, :-2], far[:-2, 1:-1], far[1:-1, 2:]))
+        closest = neighbours.argmin(axis=0)
+        downhill = (grid[1:-1, 1:-1] > 0) & (neighbours.min(axis=0) < inner)
+        directions = np.full(grid.shape, -1, dtype=np.int32)
+        directions[1:-1, 1:-1] = np.where(downhill, self.ANGLES[closest], -1)
+
+        self.recomputes += 1
+        return Field(cell, distances, directions.ravel().tolist())
+
+    def cell_at(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """
+        Returns the cell a follower counts as standing on: the open cell whose corner is nearest a point.
+
+        Args:
+            x (float): X-coordinate of the follower's hitbox top left corner.
+            y (float): Y-coordinate of the follower's hitbox top left corner.
+
+        Returns:
+            tuple: (column, row) of the cell, or None if there is no open cell nearby.
+        """
+        finder = self.path_finder
+        half = finder.cell_size / 2
+        return finder.nearest_open(finder.cell_at(x + half, y + half))
+
+    def direction_from(self, cell: Tuple[int, int]) -> Optional[int]:
+        """
+        Returns the way to go from a cell towards the target.
+
+        Args:
+            cell (tuple): (column, row) of the cell.
+
+        Returns:
+            int: Angle in degrees for RoomObject.set_direction, or None at the target or when it cannot be reached.
+        """
+        angle = self.field.directions[self.path_finder.index_of(cell)]
+        return angle if angle >= 0 else None
+
+    def direction_at(self, x: float, y: float) -> Optional[int]:
+        """
+        Returns the way to go from a point towards the target.
+
+        Args:
+            x (float): X-coordinate of the follower's hitbox top left corner.
+            y (float): Y-coordinate of the follower's hitbox top left corner.
+
+        Returns:
+            int: Angle in degrees for RoomObject.set_direction, or None at the target or when it cannot be reached.
+        """
+        cell = self.cell_at(x, y)
+        if cell is None:
+            return None
+        return self.direction_from(cell)
+
+    def distance_at(self, x: float, y: float) -> int:
+        """
+        Returns the number of cells between a point and the target.
+
+        Args:
+            x (float): X-coordinate in pixels.
+            y (float): Y-coordinate in pixels.
+
+        Returns:
+            int: The number of moves, or -1 if the target cannot be reached.
+        """
+        finder = self.path_finder
+        return self.field.distances[finder.index_of(finder.cell_at(x, y))]
+
+    def close(self):
+        """
+        Stops the worker thread. Called by the Level when it ends.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,138 @@
+import pygame
+from pygame import Surface
+from pygame.font import Font
+from collections import OrderedDict
+from GameFrame.Globals import Globals
+
+
+class FontCache:
+    """
+    A process-wide cache of fonts and rendered text surfaces.
+
+    Building a system font scans the installed font list, so each
+    (name, size, bold) font is built once and kept. Rendered text is kept in a
+    bounded cache keyed by (text, font, colour), so redrawing the same text,
+    such as a HUD counter returning to an earlier value, costs nothing.
+
+    Rendered surfaces are shared, so they should not be drawn on directly.
+
+    Attributes:
+        max_rendered (int): Maximum number of rendered text surfaces to keep.
+        font_hits (int): Number of font requests answered from the cache.
+        font_misses (int): Number of fonts that had to be built.
+        text_hits (int): Number of render requests answered from the cache.
+        text_misses (int): Number of render requests that had to render text.
+        evictions (int): Number of rendered surfaces dropped to stay within size.
+    """
+
+    _shared = None
+
+    def __init__(self, max_rendered: int):
+        """
+        Initializes an empty FontCache.
+
+        Args:
+            max_rendered (int): Maximum number of rendered text surfaces to keep.
+        """
+        self.max_rendered = max_rendered
+        self.font_hits = 0
+        self.font_misses = 0
+        self.text_hits = 0
+        self.text_misses = 0
+        self.evictions = 0
+        self._fonts = {}
+        self._rendered = OrderedDict()
+
+    @classmethod
+    def shared(cls) -> 'FontCache':
+        """
+        Returns the cache shared by the whole game, creating it on first use.
+
+        Returns:
+            FontCache: The shared cache, sized by Globals.TEXT_CACHE_SIZE.
+        """
+        if cls._shared is None:
+            cls._shared = cls(Globals.TEXT_CACHE_SIZE)
+        return cls._shared
+
+    def get_font(self, name: str, size: int, bold: bool = False) -> Font:
+        """
+        Returns the system font with the given name, size and weight.
+
+        Args:
+            name (str): Font name.
+            size (int): Font size.
+            bold (bool, optional): Whether the font is bold. Defaults to False.
+
+        Returns:
+            Font: The shared pygame Font object.
+        """
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.font_hits += 1
+            return font
+        self.font_misses += 1
+        font = pygame.font.SysFont(name, size, bold)
+        self._fonts[key] = font
+        return font
+
+    def render(self, text: str, name: str, size: int, bold: bool, colour: tuple) -> Surface:
+        """
+        Returns text rendered in the given font and colour.
+
+        Args:
+            text (str): The text to render.
+            name (str): Font name.
+            size (int): Font size.
+            bold (bool): Whether the font is bold.
+            colour (tuple): RGB color of the text.
+
+        Returns:
+            Surface: The shared surface holding the rendered text.
+        """
+        key = (text, name, size, bold, tuple(colour))
+        surface = self._rendered.get(key)
+        if surface is not None:
+            self.text_hits += 1
+            self._rendered.move_to_end(key)
+            return surface
+        self.text_misses += 1
+        surface = self.get_font(name, size, bold).render(text, False, colour)
+        self._rendered[key] = surface
+        if len(self._rendered) > self.max_rendered:
+            self._rendered.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters, for sizing the cache.
+
+        Returns:
+            dict: Font and rendered text counts, hits, misses, evictions and hit rate.
+        """
+        requests = self.text_hits + self.text_misses
+        return {
+            'fonts': len(self._fonts),
+            'font_hits': self.font_hits,
+            'font_misses': self.font_misses,
+            'rendered': len(self._rendered),
+            'max_rendered': self.max_rendered,
+            'text_hits': self.text_hits,
+            'text_misses': self.text_misses,
+            'evictions': self.evictions,
+            'text_hit_rate': self.text_hits / requests if requests else 0.0,
+        }
+
+    def clear(self):
+        """
+        Empties the cache and resets its counters.
+        """
+        self._fonts.clear()
+        self._rendered.clear()
+        self.font_hits = 0
+        self.font_misses = 0
+        self.text_hits = 0
+        self.text_misses = 0
+        self.evictions = 0
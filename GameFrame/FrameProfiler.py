@@ -0,0 +1,179 @@
+import os
+import json
+import pygame
+from array import array
+from time import perf_counter
+from pygame import Surface
+from typing import Dict, Tuple
+from GameFrame.FontCache import FontCache
+
+
+class FrameProfiler:
+    """
+    Times each phase of a Level's frame and keeps the most recent frames.
+
+    The level calls start_frame at the top of each frame, mark after each
+    phase and end_frame at the bottom. Timings go into a fixed-size ring
+    buffer per phase, so memory use does not grow however long the level runs.
+    Percentiles can be shown in an on-screen overlay and all kept frames
+    written out as CSV or JSON lines.
+
+    Attributes:
+        size (int): The number of frames kept.
+        count (int): The number of frames recorded so far.
+        overlay_visible (bool): Whether the overlay is drawn.
+        overlay_key (int): The key that toggles the overlay.
+    """
+
+    PHASES = ('pump', 'timers', 'prestep', 'events', 'joystick', 'input', 'background',
+              'update', 'collisions', 'blit', 'flip')
+
+    def __init__(self, size: int = 600, overlay_key: int = pygame.K_F3):
+        """
+        Initializes a FrameProfiler.
+
+        Args:
+            size (int, optional): The number of frames to keep. Defaults to 600.
+            overlay_key (int, optional): The key that toggles the overlay. Defaults to F3.
+        """
+        self.size = size
+        self.count = 0
+        self.overlay_visible = False
+        self.overlay_key = overlay_key
+        self._index = 0
+        self._last = 0.0
+        self._frame_start = 0.0
+        self._timing = False
+        self._samples = {phase: array('d', bytes(8 * size)) for phase in self.PHASES + ('frame',)}
+        self._overlay = None
+
+    def start_frame(self):
+        """
+        Starts timing a frame, unless a frame is already being timed.
+
+        Level.run starts the frame before reading the devices, so the frame
+        that step then starts is the same one.
+        """
+        if not self._timing:
+            self._timing = True
+            self._frame_start = self._last = perf_counter()
+
+    def mark(self, phase: str):
+        """
+        Records the time since the previous mark against a phase.
+
+        Args:
+            phase (str): One of PHASES.
+        """
+        now = perf_counter()
+        self._samples[phase][self._index] = now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """
+        Records the whole frame's time and moves on to the next slot of the ring buffer.
+        """
+        self._samples['frame'][self._index] = perf_counter() - self._frame_start
+        self._timing = False
+        self._index = (self._index + 1) % self.size
+        self.count += 1
+
+    def toggle_overlay(self):
+        """
+        Shows or hides the on-screen overlay.
+        """
+        self.overlay_visible = not self.overlay_visible
+        self._overlay = None
+
+    def _recent(self, phase: str) -> list:
+        """
+        Returns the kept samples for a phase, oldest first.
+
+        Args:
+            phase (str): A phase name, or 'frame' for whole frames.
+
+        Returns:
+            list: Times in seconds.
+        """
+        samples = self._samples[phase]
+        if self.count < self.size:
+            return samples[:self.count].tolist()
+        return samples[self._index:].tolist() + samples[:self._index].tolist()
+
+    def percentiles(self, phase: str) -> Tuple[float, float, float]:
+        """
+        Returns the 50th, 95th and 99th percentile times for a phase over the kept frames.
+
+        Args:
+            phase (str): A phase name, or 'frame' for whole frames.
+
+        Returns:
+            Tuple[float, float, float]: p50, p95 and p99 in seconds, or zeros if no frames were recorded.
+        """
+        values = sorted(self._recent(phase))
+        if not values:
+            return 0.0, 0.0, 0.0
+        last = len(values) - 1
+        return (values[round(last * 0.50)], values[round(last * 0.95)], values[round(last * 0.99)])
+
+    def summary(self) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Returns the percentiles of every phase and of whole frames.
+
+        Returns:
+            Dict[str, Tuple[float, float, float]]: p50, p95 and p99 in seconds, keyed by phase.
+        """
+        return {phase: self.percentiles(phase) for phase in self.PHASES + ('frame',)}
+
+    def draw_overlay(self, screen: Surface):
+        """
+        Draws the percentile table in the top left corner of the screen.
+
+        The table is re-rendered every 15 frames rather than every frame, so the
+        overlay costs little more than one blit.
+
+        Args:
+            screen (Surface): The surface to draw on.
+        """
+        if self._overlay is None or self.count % 15 == 0:
+            font_cache = FontCache.shared()
+            lines = ['phase          p50 ms  p95 ms  p99 ms']
+            for phase, (p50, p95, p99) in self.summary().items():
+                lines.append(f'{phase:<12} {p50 * 1000:7.2f} {p95 * 1000:7.2f} {p99 * 1000:7.2f}')
+            font = font_cache.get_font('Courier New', 14)
+            line_height = font.get_linesize()
+            rendered = [font.render(line, False, (255, 255, 255)) for line in lines]
+            width = max(text.get_width() for text in rendered) + 12
+            self._overlay = Surface((width, line_height * len(lines) + 12), pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 180))
+            for row, text in enumerate(rendered):
+                self._overlay.blit(text, (6, 6 + row * line_height))
+        screen.blit(self._overlay, (0, 0))
+
+    def dump(self, path: str):
+        """
+        Writes every kept frame to a file, one row per frame, times in milliseconds.
+
+        Files ending in .csv are written as CSV; anything else is written as JSON lines.
+
+        Args:
+            path (str): The file to write.
+        """
+        columns = self.PHASES + ('frame',)
+        recent = {phase: self._recent(phase) for phase in columns}
+        first = self.count - len(recent['frame'])
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as out:
+            if path.endswith('.csv'):
+                out.write('frame_number,' + ','.join(columns) + '\n')
+                for row in range(len(recent['frame'])):
+                    values = ','.join(f'{recent[phase][row] * 1000:.4f}' for phase in columns)
+                    out.write(f'{first + row},{values}\n')
+            else:
+                for row in range(len(recent['frame'])):
+                    record = {'frame_number': first + row}
+                    for phase in columns:
+                        record[phase] = round(recent[phase][row] * 1000, 4)
+                    out.write(json.dumps(record) + '\n')
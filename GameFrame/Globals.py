@@ -15,6 +15,15 @@ class Globals:
         end_game_level (int): The index of the level to jump to when the game ends.
         next_level (int): The index of the next level to load.
         exiting (bool): Indicates if the game is exiting.
+        headless (bool): Run without a window or frame rate limit, drawing nothing.
+        max_room_frames (int): If set, end each room after this many frames.
+        profile_frames (bool): Time each phase of every frame in every room.
+        profile_output (str): File each room's frame timings are written to, {room} is the room name.
+        maze_seed (int): Seed of the generated maze room, None for a new maze each game.
+        IMAGE_CACHE_BUDGET (int): Memory budget in bytes for cached image surfaces.
+        TEXT_CACHE_SIZE (int): Number of rendered text surfaces to keep cached.
+        SLEEP_STATIC_OBJECTS (bool): Skip the per-frame update of objects that are not moving.
+        WALL_MAP_CACHE (str): Directory where the walls found in room images are saved.
         total_count (int): User-defined global variable for total count.
         destroyed_count (int): User-defined global variable for destroyed count.
     """
@@ -49,6 +58,33 @@ class Globals:
     # - Change variable to True to exit the program - #
     exiting = False
 
+    # - Run without drawing or waiting between frames (set by MainController --headless) - #
+    headless = False
+
+    # - End each room after this many frames, 0 for no limit (set by MainController --frames) - #
+    max_room_frames = 0
+
+    # - Time every phase of each frame (set by MainController --profile) - #
+    profile_frames = False
+    profile_output = None
+
+    # - Seed of the GeneratedMaze room, None for a new maze each game (set by MainController --maze) - #
+    maze_seed = None
+
+    # - Memory (in bytes) that loaded and scaled images may use before - #
+    # - the least recently used ones are dropped from the cache - #
+    IMAGE_CACHE_BUDGET = 64 * 1024 * 1024
+
+    # - Number of rendered pieces of text kept for reuse - #
+    TEXT_CACHE_SIZE = 256
+
+    # - Let objects that never move sleep until their position or speed changes - #
+    SLEEP_STATIC_OBJECTS = True
+
+    # - Directory the walls found in background images are saved in, - #
+    # - so they are only worked out again when an image changes - #
+    WALL_MAP_CACHE = 'Cache'
+
 # ############################################################# #
 # ###### User Defined Global Variables below this line ######## #
 # ############################################################# #
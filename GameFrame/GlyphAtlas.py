@@ -0,0 +1,148 @@
+import string
+import pygame
+from pygame import Surface
+from typing import Dict, Tuple
+from GameFrame.FontCache import FontCache
+
+
+class GlyphAtlas:
+    """
+    Every printable character of one font, size and colour, rendered once onto a single surface.
+
+    Text is drawn by blitting each character's area of the atlas, so showing
+    a new number or short string never rasterises text, and the ever-changing
+    strings of HUD counters do not push other text out of the FontCache.
+
+    Characters outside the atlas are rendered on first use and kept.
+    Characters are placed by their advance widths without kerning, which
+    suits digits and short labels.
+
+    Attributes:
+        font: The pygame Font the glyphs were rendered with.
+        colour (tuple): RGB colour of the glyphs.
+        height (int): Height of a line of text.
+        surface (Surface): The atlas, holding one copy of every character.
+    """
+
+    # - Characters put in the atlas when it is built - #
+    CHARACTERS = string.digits + string.ascii_letters + string.punctuation + ' '
+
+    _atlases: Dict[tuple, 'GlyphAtlas'] = {}
+
+    def __init__(self, name: str, size: int, bold: bool, colour: tuple):
+        """
+        Renders the atlas for a font, size, weight and colour.
+
+        Args:
+            name (str): Font name.
+            size (int): Font size.
+            bold (bool): Whether the font is bold.
+            colour (tuple): RGB colour of the text.
+        """
+        font_cache = FontCache.shared()
+        self.font = font_cache.get_font(name, size, bold)
+        self.colour = colour
+        self.height = self.font.get_height()
+        glyphs = [(char, self.font.render(char, False, colour)) for char in self.CHARACTERS]
+        self.surface = pygame.Surface((sum(glyph.get_width() for char, glyph in glyphs), self.height),
+                                      pygame.SRCALPHA)
+        self._glyphs: Dict[str, Tuple[Surface, pygame.Rect, int]] = {}
+        x = 0
+        for char, glyph in glyphs:
+            self.surface.blit(glyph, (x, 0))
+            self._glyphs[char] = (self.surface, pygame.Rect(x, 0, glyph.get_width(), self.height),
+                                  self._advance(char, glyph))
+            x += glyph.get_width()
+
+    @classmethod
+    def get(cls, name: str, size: int, bold: bool, colour: tuple) -> 'GlyphAtlas':
+        """
+        Returns the atlas for a font, size, weight and colour, building it on first use.
+
+        Args:
+            name (str): Font name.
+            size (int): Font size.
+            bold (bool): Whether the font is bold.
+            colour (tuple): RGB colour of the text.
+
+        Returns:
+            GlyphAtlas: The shared atlas.
+        """
+        key = (name, size, bold, tuple(colour))
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            atlas = cls._atlases[key] = cls(name, size, bold, tuple(colour))
+        return atlas
+
+    def _advance(self, char: str, glyph: Surface) -> int:
+        """
+        Returns how far along the next character starts after a character.
+
+        Args:
+            char (str): The character.
+            glyph (Surface): The character rendered on its own.
+
+        Returns:
+            int: The advance in pixels.
+        """
+        metrics = self.font.metrics(char)
+        if metrics and metrics[0] is not None:
+            return metrics[0][4]
+        return glyph.get_width()
+
+    def _glyph(self, char: str) -> Tuple[Surface, pygame.Rect, int]:
+        """
+        Returns the surface and area holding a character, and its advance.
+
+        Args:
+            char (str): The character.
+
+        Returns:
+            tuple: (surface, area, advance) to blit the character from.
+        """
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            surface = self.font.render(char, False, self.colour)
+            glyph = self._glyphs[char] = (surface, pygame.Rect(0, 0, surface.get_width(), self.height),
+                                          self._advance(char, surface))
+        return glyph
+
+    def size(self, text: str) -> Tuple[int, int]:
+        """
+        Returns the width and height text would be drawn at.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            tuple: (width, height) in pixels.
+        """
+        width = 0
+        x = 0
+        for char in text:
+            surface, area, advance = self._glyph(char)
+            width = max(width, x + area.width)
+            x += advance
+        return width, self.height
+
+    def render(self, text: str) -> Surface:
+        """
+        Draws text onto a new surface by blitting glyphs from the atlas.
+
+        Args:
+            text (str): The text to draw.
+
+        Returns:
+            Surface: A new surface with a transparent background.
+        """
+        blits = []
+        width = 0
+        x = 0
+        for char in text:
+            surface, area, advance = self._glyph(char)
+            blits.append((surface, (x, 0), area))
+            width = max(width, x + area.width)
+            x += advance
+        rendered = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        rendered.blits(blits, doreturn=False)
+        return rendered
@@ -0,0 +1,80 @@
+import pygame
+from typing import Iterable, List, Tuple
+
+
+class KeyState:
+    """
+    A read-only view of which keys are held, indexed like pygame.key.get_pressed().
+
+    Lets supplied input be passed to key_pressed handlers, which look keys up
+    with expressions such as key[pygame.K_SPACE].
+
+    Attributes:
+        held (frozenset): The key codes that are held down.
+    """
+
+    def __init__(self, held: Iterable[int] = ()):
+        """
+        Initializes a KeyState.
+
+        Args:
+            held (Iterable[int], optional): The key codes that are held down. Defaults to none.
+        """
+        self.held = frozenset(held)
+
+    def __getitem__(self, key: int) -> bool:
+        """
+        Returns True if the key is held down.
+        """
+        return key in self.held
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys held down.
+        """
+        return len(self.held)
+
+
+class InputState:
+    """
+    The input for one frame of a Level: the event queue, held keys and mouse state.
+
+    Level.run builds one from the real devices each frame with poll(). Tests,
+    benchmarks and bots can build their own and pass it to Level.step to drive
+    a level without a window or real devices.
+
+    Attributes:
+        events (list): The pygame events for the frame.
+        keys: The held keys, indexable by pygame key constant.
+        mouse_pos (tuple): The mouse (x, y) position.
+        mouse_buttons (tuple): The (left, middle, right) mouse button states.
+    """
+
+    def __init__(self, events: List = None, keys=(), mouse_pos: Tuple[int, int] = (0, 0),
+                 mouse_buttons: Tuple[bool, bool, bool] = (False, False, False)):
+        """
+        Initializes an InputState.
+
+        Args:
+            events (List, optional): The pygame events for the frame. Defaults to no events.
+            keys (optional): Held key codes, or a key state indexable by key code. Defaults to none.
+            mouse_pos (Tuple[int, int], optional): The mouse position. Defaults to (0, 0).
+            mouse_buttons (Tuple[bool, bool, bool], optional): Mouse button states. Defaults to all up.
+        """
+        self.events = events if events is not None else []
+        if isinstance(keys, (set, frozenset, list, tuple)):
+            keys = KeyState(keys)
+        self.keys = keys
+        self.mouse_pos = mouse_pos
+        self.mouse_buttons = mouse_buttons
+
+    @classmethod
+    def poll(cls) -> 'InputState':
+        """
+        Reads the current input from pygame's event queue, keyboard and mouse.
+
+        Returns:
+            InputState: The input for this frame.
+        """
+        return cls(pygame.event.get(), pygame.key.get_pressed(),
+                   pygame.mouse.get_pos(), pygame.mouse.get_pressed())
@@ -0,0 +1,153 @@
+import pygame
+from array import array
+from pygame.joystick import Joystick
+from typing import Dict, List
+
+
+class JoystickInput:
+    """
+    Keeps the state of every connected joystick up to date from pygame events.
+
+    Rather than reading every button and axis each frame, the state of each
+    pad is changed only when a button, axis or hat event arrives, so frames
+    with no joystick activity do no joystick work at all. Pads can be plugged
+    in and removed while the game runs.
+
+    Each pad's state is a flat array of numbers in the layout the game loop
+    has always passed to joy_pad_signal: the buttons first (1 when held),
+    then two entries (x, y) per hat, with axis i stored at index -(i + 1).
+
+    Attributes:
+        joysticks (dict): Maps each pad's instance id to its open Joystick.
+        pads (dict): Maps each pad's instance id to its state array.
+        order (list): Instance ids of the connected pads, player 1 first.
+    """
+
+    # - The pygame events that change joystick state - #
+    EVENT_TYPES = frozenset((pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYAXISMOTION,
+                             pygame.JOYHATMOTION, pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED))
+
+    _shared = None
+
+    def __init__(self, joysticks: List[Joystick] = ()):
+        """
+        Initializes the input with some already opened joysticks.
+
+        Args:
+            joysticks (List[Joystick], optional): Joysticks to track from the start.
+        """
+        self.joysticks: Dict[int, Joystick] = {}
+        self.pads: Dict[int, array] = {}
+        self.order: List[int] = []
+        self._hat_start: Dict[int, int] = {}
+        for joystick in joysticks:
+            self.add_joystick(joystick)
+
+    @classmethod
+    def shared(cls) -> 'JoystickInput':
+        """
+        Returns the joystick input shared by every room, creating it on first use.
+
+        Returns:
+            JoystickInput: The shared joystick input.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def add_joystick(self, joystick: Joystick):
+        """
+        Starts tracking a joystick, reading its current state once.
+
+        Joysticks that are already tracked are ignored.
+
+        Args:
+            joystick (Joystick): The joystick to track.
+        """
+        if not joystick.get_init():
+            joystick.init()
+        instance_id = joystick.get_instance_id()
+        if instance_id in self.pads:
+            return
+        buttons = joystick.get_numbuttons()
+        hats = joystick.get_numhats()
+        axes = joystick.get_numaxes()
+        state = array('d', [0.0]) * (buttons + 2 * hats + axes)
+        for i in range(buttons):
+            state[i] = joystick.get_button(i)
+        for i in range(hats):
+            state[buttons + 2 * i], state[buttons + 2 * i + 1] = joystick.get_hat(i)
+        for i in range(axes):
+            state[-(i + 1)] = joystick.get_axis(i)
+        self.joysticks[instance_id] = joystick
+        self.pads[instance_id] = state
+        self._hat_start[instance_id] = buttons
+        self.order.append(instance_id)
+
+    def remove_joystick(self, instance_id: int):
+        """
+        Stops tracking a joystick. Later pads move up a player.
+
+        Args:
+            instance_id (int): The instance id of the removed joystick.
+        """
+        if self.pads.pop(instance_id, None) is None:
+            return
+        del self.joysticks[instance_id]
+        del self._hat_start[instance_id]
+        self.order.remove(instance_id)
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Applies a joystick event to the pad states.
+
+        Args:
+            event (pygame.event.Event): Any event from EVENT_TYPES.
+
+        Returns:
+            bool: True if a pad's state changed or a pad was added or removed.
+        """
+        event_type = event.type
+        if event_type == pygame.JOYDEVICEADDED:
+            count = len(self.pads)
+            self.add_joystick(Joystick(event.device_index))
+            return len(self.pads) != count
+        if event_type == pygame.JOYDEVICEREMOVED:
+            count = len(self.pads)
+            self.remove_joystick(event.instance_id)
+            return len(self.pads) != count
+
+        state = self.pads.get(event.instance_id)
+        if state is None:
+            return False
+        if event_type == pygame.JOYAXISMOTION:
+            index = -(event.axis + 1)
+            value = event.value
+        elif event_type == pygame.JOYHATMOTION:
+            index = self._hat_start[event.instance_id] + 2 * event.hat
+            x, y = event.value
+            changed = state[index] != x or state[index + 1] != y
+            state[index] = x
+            state[index + 1] = y
+            return changed
+        else:
+            index = event.button
+            value = 1 if event_type == pygame.JOYBUTTONDOWN else 0
+        if state[index] == value:
+            return False
+        state[index] = value
+        return True
+
+    def player(self, number: int) -> array:
+        """
+        Returns the state of a player's pad.
+
+        Args:
+            number (int): The player, starting from 0 for player 1.
+
+        Returns:
+            array: The pad's state, or an empty array if no pad is connected for the player.
+        """
+        if number < len(self.order):
+            return self.pads[self.order[number]]
+        return array('d')
@@ -7,6 +7,19 @@ from pygame.mixer import Sound
 from pygame.joystick import Joystick
 from GameFrame.Globals import Globals
 from GameFrame.RoomObject import RoomObject
+from GameFrame.SpatialHash import SpatialHash
+from GameFrame.RenderList import RenderList
+from GameFrame.WallMap import WallMap
+from GameFrame.MazeGenerator import MazeGenerator
+from GameFrame.TileMap import TileMap
+from GameFrame.Camera import Camera
+from GameFrame.PathFinder import PathFinder
+from GameFrame.FlowField import FlowField
+from GameFrame.AssetCache import AssetCache
+from GameFrame.Scheduler import Scheduler, TimerHandle
+from GameFrame.InputState import InputState, KeyState
+from GameFrame.JoystickInput import JoystickInput
+from GameFrame.FrameProfiler import FrameProfiler
 
 class Level:
     """
@@ -17,11 +30,16 @@ class Level:
 
     Attributes:
         screen (Surface): The pygame surface to render the level on.
-        objects (list): List of all RoomObject instances in the level.
-        keyboard_objects (list): Objects that handle keyboard events.
-        mouse_objects (list): Objects that handle mouse events.
+        objects (dict): All RoomObject instances in the level, as dictionary keys in the order they
+            were added, so removing one does not shift the others.
+        render_list (RenderList): The objects in drawing order, by depth.
+        keyboard_objects (dict): Objects that handle keyboard events, as dictionary keys.
+        held_keys (set): Keys held down, kept up to date from KEYDOWN and KEYUP events, and
+            seeded with the subscribed keys already held when the level begins.
+        mouse_objects (dict): Objects that handle mouse events, as dictionary keys.
         _clock (pygame.time.Clock): Clock for managing frame rate.
         running (bool): Indicates if the level is currently running.
+        frame_count (int): Number of frames the level has run.
         quitting (bool): Indicates if the level is quitting.
         background_color (tuple): RGB color for the background.
         background_set (bool): Whether a background image is set.
@@ -29,16 +47,37 @@ class Level:
         background_y (int): Y position for background scrolling.
         background_scroll_speed (int): Speed of background scrolling.
         background_scrolling (bool): Whether background scrolling is enabled.
-        user_events (list): List of timed user events.
+        scheduler (Scheduler): Timed function calls set with set_timer.
         joysticks (Joystick): List of connected joystick devices.
-        p1_btns (list): State of player 1's joystick buttons/axes.
-        p2_btns (list): State of player 2's joystick buttons/axes.
-        has_buttons_1 (bool): Whether player 1's joystick has buttons.
-        has_buttons_2 (bool): Whether player 2's joystick has buttons.
-        has_hat_1 (bool): Whether player 1's joystick has axes.
-        has_hat_2 (bool): Whether player 2's joystick has axes.
+        joystick_input (JoystickInput): The state of every connected pad, kept up to date from events.
+        p1_btns (array): State of player 1's joystick buttons/hats/axes.
+        p2_btns (array): State of player 2's joystick buttons/hats/axes.
+        spatial_hash (SpatialHash): Optional collision broad phase, None when disabled.
+        wall_map (WallMap): The walls objects cannot move through, None when the room has none.
+        maze (MazeGenerator): The generated maze the room is built on, None when it has none.
+        tile_map (TileMap): The background of a room larger than the screen, drawn in chunks, None when unused.
+        camera (Camera): Which part of the room is shown, None to show the room from its top left corner.
+        path_finder (PathFinder): Routes around the walls, None unless path finding is enabled.
+        flow_fields (list): FlowFields kept up to date with their target each frame.
+        dirty_rect_rendering (bool): Whether only changed screen regions are redrawn.
+        viewport (pygame.Rect): The area of the room shown on screen, objects outside it are not drawn.
+            The camera's view when there is a camera.
+        drawn_objects (int): Number of objects drawn in the last frame.
+        culled_objects (int): Number of objects skipped in the last frame for being outside the viewport.
+        profiler (FrameProfiler): Per-phase frame timings, None unless profiling is enabled.
+        profile_output (str): File the timings are written to when the level ends, None for Globals.profile_output.
+        entity_store (EntityStore): Vectorized motion state of objects, None when disabled.
+        collision_backend (VectorCollisions): Tests all registered pairs at once, None when disabled.
+        HOOKS (tuple): The RoomObject methods the game loop only calls on objects that override them.
+        sleeping_enabled (bool): Whether static objects are put to sleep, from Globals.SLEEP_STATIC_OBJECTS.
+        skipped_objects (int): Number of sleeping objects whose update was skipped in the last frame.
+        woken_objects (int): Number of times a sleeping object has been woken.
     """
 
+    # - RoomObject methods that do nothing unless overridden - #
+    HOOKS = ('prestep', 'step', 'check_collisions', 'key_pressed', 'key_down', 'key_up',
+             'text_input', 'joy_pad_signal', 'mouse_event', 'clicked')
+
     def __init__(self, screen: Surface, joysticks: Joystick):
         """
         Initializes the Level with the given screen and joysticks.
@@ -48,9 +87,13 @@ class Level:
             joysticks (Joystick): List of connected joystick devices.
         """
         self.screen = screen
-        self.objects = []
-        self.keyboard_objects = []
-        self.mouse_objects = []
+        self.objects = {}
+        self.render_list = RenderList()
+        self.keyboard_objects = {}
+        self.held_keys = set()
+        self._key_subscribers = {}
+        self._text_input_objects = {}
+        self.mouse_objects = {}
         self._clock = pygame.time.Clock()
         self.running = False
         self.quitting = False
@@ -60,36 +103,50 @@ class Level:
         self.background_y = 0
         self.background_scroll_speed = 0
         self.background_scrolling = False
-        self.user_events = []
+        self.scheduler = Scheduler()
+        self.profiler = FrameProfiler() if Globals.profile_frames else None
+        self.profile_output = None
+        self._started = False
+        self.frame_count = 0
+        self._defer_object_changes = False
+        self._pending_adds = {}
+        self._pending_deletes = {}
+        self._collision_watchers = {}
+        self._by_type = {}
+        self._by_tag = {}
+        self._collision_interest = {}
         self.joysticks = joysticks
-        self.p1_btns = []
-        self.p2_btns = []
-        self.has_buttons_1 = False
-        self.has_buttons_2 = False
-        self.has_hat_1 = False
-        self.has_hat_2 = False
-        if len(self.joysticks) > 0:
-            buttons = self.joysticks[0].get_numbuttons()
-            if buttons > 0:
-                self.has_buttons_1 = True
-            for i in range(buttons):
-                self.p1_btns.append(self.joysticks[0].get_button(i))
-            axes = self.joysticks[0].get_numaxes()
-            if axes > 0:
-                self.has_hat_1 = True
-            for i in range(axes):
-                self.p1_btns.append(self.joysticks[0].get_axis(i))
-            if len(self.joysticks) > 1:
-                buttons = self.joysticks[1].get_numbuttons()
-                if buttons > 0:
-                    self.has_buttons_2 = True
-                for i in range(buttons):
-                    self.p2_btns.append(self.joysticks[1].get_button(i))
-                axes = self.joysticks[1].get_numaxes()
-                if axes > 0:
-                    self.has_hat_2 = True
-                for i in range(axes):
-                    self.p1_btns.append(self.joysticks[1].get_axis(i))
+        self.joystick_input = JoystickInput.shared()
+        for joystick in joysticks:
+            self.joystick_input.add_joystick(joystick)
+        self.p1_btns = self.joystick_input.player(0)
+        self.p2_btns = self.joystick_input.player(1)
+        self.spatial_hash = None
+        self.wall_map = None
+        self.maze = None
+        self.tile_map = None
+        self.camera = None
+        self.path_finder = None
+        self.flow_fields = []
+        self.entity_store = None
+        self.collision_backend = None
+        self.sleeping_enabled = Globals.SLEEP_STATIC_OBJECTS
+        self.skipped_objects = 0
+        self.woken_objects = 0
+        self._sleeping = {}
+        self._sleeping_watchers = {}
+        self._sleeping_rects = {}
+        self._class_hooks = {}
+        self._dispatch = {}
+        self._dispatch_dirty = True
+        self._key_order_next = 0
+        self.dirty_rect_rendering = False
+        self.viewport = screen.get_rect()
+        self.drawn_objects = 0
+        self.culled_objects = 0
+        self._background_cache = None
+        self._drawn_rects = {}
+        self._full_redraw = True
 
     def run(self) -> bool:
         """
@@ -98,111 +155,362 @@ class Level:
         Returns:
             bool: True if the level is quitting, False otherwise.
         """
+        self.begin()
+        while self.running:
+            if not Globals.headless:
+                self._clock.tick(Globals.FRAMES_PER_SECOND)
+            # - Reading the devices is timed as part of the frame - #
+            profiler = self.profiler
+            if profiler:
+                profiler.start_frame()
+            inputs = InputState.poll()
+            if profiler:
+                profiler.mark('pump')
+            self.step(inputs)
+            if Globals.max_room_frames and self.frame_count >= Globals.max_room_frames:
+                self.running = False
+        self.end()
+        return self.quitting
+
+    def __enter__(self) -> 'Level':
+        """
+        Begins the level for driving it with step, as in `with room: room.step()`.
+
+        Returns:
+            Level: The level.
+        """
+        if not self._started:
+            self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Ends the level when the with block finishes, even if a frame raised an error.
+        """
+        self.end()
+
+    def begin(self):
+        """
+        Prepares the level to start running: builds collision lists, notes the
+        subscribed keys already held and starts queueing object changes.
+        Called by run, and by step on its first call.
+        """
         self.running = True
+        self._started = True
         for obj in self.objects:
             self.init_collision_list(obj)
+        # - Keys held since before the level began, such as one held through a room change, - #
+        # - have no KEYDOWN event of their own - #
+        if self._key_subscribers and pygame.display.get_init():
+            pressed = pygame.key.get_pressed()
+            self.held_keys.update(key for key in self._key_subscribers if pressed[key])
+        if self._text_input_objects:
+            pygame.key.start_text_input()
+        self._defer_object_changes = True
 
-        while self.running:
-            self._clock.tick(Globals.FRAMES_PER_SECOND)
+    def end(self):
+        """
+        Finishes running the level, applying any object changes still queued.
+
+        Also stops text input started by its objects, stops flow field worker
+        threads and writes the profiler's timings when an output is set. Called by run; code that drives the level with
+        step must call it when done, or use the level in a with block.
+        """
+        self.apply_object_changes()
+        self._defer_object_changes = False
+        if self._text_input_objects:
+            pygame.key.stop_text_input()
+        for flow_field in self.flow_fields:
+            flow_field.close()
+        output = self.profile_output or Globals.profile_output
+        if self.profiler is not None and output:
+            self.profiler.dump(output.format(room=type(self).__name__))
+
+    def enable_profiler(self, size: int = 600, output: str = None):
+        """
+        Starts timing each phase of every frame.
+
+        Press F3 while the level runs to show the timings on screen. The
+        timings are written to output, or Globals.profile_output, when the
+        level ends.
 
-            for obj in self.objects:
+        Args:
+            size (int, optional): The number of recent frames to keep. Defaults to 600.
+            output (str, optional): File to write the timings to (.csv or .jsonl), {room} is
+                replaced by the room name. Defaults to Globals.profile_output.
+        """
+        self.profiler = FrameProfiler(size)
+        self.profile_output = output
+
+    def step(self, inputs: InputState = None) -> bool:
+        """
+        Advances the level by exactly one frame using the given input.
+
+        Does not wait for the frame rate or read real devices, so a level can
+        be run faster than real time, in tests, benchmarks or by a bot. When
+        Globals.headless is set nothing is drawn. Call end when done, or step
+        the level inside a with block, which ends it.
+
+        Args:
+            inputs (InputState, optional): The input for the frame. Defaults to no input.
+
+        Returns:
+            bool: True while the level is still running.
+        """
+        if not self._started:
+            self.begin()
+        if inputs is None:
+            inputs = InputState()
+        self.frame_count += 1
+        if self._dispatch_dirty:
+            self._build_dispatch()
+        dispatch = self._dispatch
+        profiler = self.profiler
+        if profiler:
+            profiler.start_frame()
+
+        store = self.entity_store
+        if store is not None:
+            store.save_positions()
+        for obj in self.objects:
+            if obj._entity_store is None:
                 obj.prev_x = obj.x
                 obj.prev_y = obj.y
 
-            # - Process user events - #
-            self.process_user_events()
-            
-            # Call Pre step on all objects
-            for item in self.objects:
-                item.prestep()
-
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    self.quitting = True
-                    Globals.exiting = True
-                    pass
-                # - Check for mouse click and pass to objects registered for mouse events - #
-                if event.type == pygame.MOUSEBUTTONUP:
-                    mouse_pos = pygame.mouse.get_pos()
-                    for obj in self.mouse_objects:
-                        if obj.rect.collidepoint(mouse_pos):
-                            obj.clicked(event.button)
-
-            # -  Check for joystick events and pass  - #
-            # - to objects registered for key events - #
-            signals = False
-            if self.has_buttons_1:
-                for i in range(self.joysticks[0].get_numbuttons()):
-                    self.p1_btns[i] = self.joysticks[0].get_button(i)
-                    if self.p1_btns[i] == 1:
-                        signals = True
-            if self.has_hat_1:
-                for i in range(self.joysticks[0].get_numaxes()):
-                    self.p1_btns[-(i+1)] = self.joysticks[0].get_axis(i)
-                    if self.p1_btns[-(i+1)] > 0 or self.p1_btns[-(i+1)] < 0:
-                        signals = True
-            if self.has_buttons_2:
-                for i in range(self.joysticks[1].get_numbuttons()):
-                    self.p2_btns[i] = self.joysticks[1].get_button(i)
-                    if self.p2_btns[i] == 1:
-                        signals = True
-            if self.has_hat_2:
-                for i in range(self.joysticks[1].get_numaxes()):
-                    self.p1_btns[-i] = self.joysticks[1].get_axis(i)
-                    if self.p2_btns[-i] > 0 or self.p2_btns[-i] < 0:
-                        signals = True
-
-            if signals:
-                for obj in self.keyboard_objects:
-                    obj.joy_pad_signal(self.p1_btns, self.p2_btns)
-
-            # - Check for a keyboard event and pass - #
-            # - to objects registered for key events - #
-            keys = pygame.key.get_pressed()
-            if len(keys):
-                for obj in self.keyboard_objects:
-                    obj.key_pressed(keys)
-
-            # - Check for a mouse event and pass - #
-            # - to objects registered for mouse events - #
-            (mouse_x, mouse_y) = pygame.mouse.get_pos()
-            (button_left, button_middle, button_right) = pygame.mouse.get_pressed()
-            for obj in self.mouse_objects:
-                    obj.mouse_event(mouse_x, mouse_y, button_left, button_middle, button_right)
-
-            # - Handle all other events - #
-            self.catch_events(events)
-
-            # - Clear the screen - #
+        # - Process user events - #
+        self.process_user_events()
+        if profiler:
+            profiler.mark('timers')
+
+        # Call Pre step on all objects
+        sleeping = self._sleeping
+        if sleeping and not self.sleeping_enabled:
+            for item in list(sleeping):
+                self._wake_object(item)
+        for item in dispatch['prestep']:
+            item.prestep()
+        if profiler:
+            profiler.mark('prestep')
+
+        events = inputs.events
+        joystick_input = self.joystick_input
+        joystick_events = JoystickInput.EVENT_TYPES
+        signals = False
+        for event in events:
+            # - Update the pad states from joystick events - #
+            if event.type in joystick_events:
+                if joystick_input.handle_event(event):
+                    signals = True
+                continue
+            if event.type == pygame.QUIT:
+                self.running = False
+                self.quitting = True
+                Globals.exiting = True
+                pass
+            # - Track held keys and pass presses and releases on - #
+            if event.type == pygame.KEYDOWN:
+                self.held_keys.add(event.key)
+                self._key_edge(event.key, 'key_down')
+            elif event.type == pygame.KEYUP:
+                self.held_keys.discard(event.key)
+                self._key_edge(event.key, 'key_up')
+            elif event.type == pygame.TEXTINPUT:
+                for obj in dispatch['text_input']:
+                    obj.text_input(event.text)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # - Key releases are not reported while the window is unfocused - #
+                for key in list(self.held_keys):
+                    self.held_keys.discard(key)
+                    self._key_edge(key, 'key_up')
+            # - Check for mouse click and pass to objects registered for mouse events - #
+            if event.type == pygame.MOUSEBUTTONUP:
+                mouse_pos = getattr(event, 'pos', inputs.mouse_pos)
+                room_pos = self.camera.to_room(*mouse_pos) if self.camera is not None else mouse_pos
+                for obj in dispatch['clicked']:
+                    if obj.rect.collidepoint(mouse_pos if obj.fixed else room_pos):
+                        obj.clicked(event.button)
+            # - Show or hide the profiler overlay - #
+            if profiler and event.type == pygame.KEYDOWN and event.key == profiler.overlay_key:
+                profiler.toggle_overlay()
+                self.redraw_screen()
+        if profiler:
+            profiler.mark('events')
+
+        # - Pass changed joystick states to - #
+        # - objects registered for key events - #
+        if signals:
+            self.p1_btns = joystick_input.player(0)
+            self.p2_btns = joystick_input.player(1)
+            for obj in dispatch['joy_pad_signal']:
+                obj.joy_pad_signal(self.p1_btns, self.p2_btns)
+        if profiler:
+            profiler.mark('joystick')
+
+        # - Check for a keyboard event and pass - #
+        # - to objects registered for key events - #
+        if self._dispatch_dirty:
+            self._build_dispatch()
+            dispatch = self._dispatch
+        keys = inputs.keys
+        key_objects = dispatch['key_pressed']
+        held = keys.held if isinstance(keys, KeyState) else self.held_keys
+        if held and self._key_subscribers:
+            # - Objects subscribed to a held key, in keyboard order - #
+            subscribed = {}
+            for key in held:
+                subscribers = self._key_subscribers.get(key)
+                if subscribers:
+                    subscribed.update(subscribers)
+            if subscribed:
+                key_objects = sorted([*key_objects, *subscribed],
+                                     key=dispatch['key_order'].__getitem__)
+        for obj in key_objects:
+            obj.key_pressed(keys)
+
+        # - Check for a mouse event and pass - #
+        # - to objects registered for mouse events - #
+        (mouse_x, mouse_y) = inputs.mouse_pos
+        (button_left, button_middle, button_right) = inputs.mouse_buttons
+        (room_x, room_y) = self.camera.to_room(mouse_x, mouse_y) if self.camera is not None else (mouse_x, mouse_y)
+        for obj in dispatch['mouse_event']:
+            if obj.fixed:
+                obj.mouse_event(mouse_x, mouse_y, button_left, button_middle, button_right)
+            else:
+                obj.mouse_event(room_x, room_y, button_left, button_middle, button_right)
+
+        # - Handle all other events - #
+        self.catch_events(events)
+        if profiler:
+            profiler.mark('input')
+
+        rendering = not Globals.headless
+        overlay = profiler and profiler.overlay_visible and rendering
+        # - Clear the screen - #
+        dirty_rendering = self.dirty_rect_rendering and not self.background_scrolling and not overlay
+        if rendering and not dirty_rendering:
             self.screen.fill(self.background_color)
-            # - Add Background if set - #
-            if self.background_set:
-                # - Scrolling if set - #
-                if self.background_scrolling:
-                    self.background_y += self.background_scroll_speed
-                    if self.background_y >= Globals.SCREEN_HEIGHT:
-                        self.background_y = 0
+        # - Add Background if set - #
+        if self.background_set and not dirty_rendering:
+            # - Scrolling if set - #
+            if self.background_scrolling:
+                self.background_y += self.background_scroll_speed
+                if self.background_y >= Globals.SCREEN_HEIGHT:
+                    self.background_y = 0
+                if rendering:
                     self.screen.blit(self.background_image, (0, self.background_y))
                     self.screen.blit(self.background_image, (0, self.background_y - Globals.SCREEN_HEIGHT))
-                else:
-                    self.screen.blit(self.background_image, (0, 0))
-            # Call Update on all objects
-            for item in self.objects:
+            elif rendering:
+                self.screen.blit(self.background_image, (0, 0))
+        if profiler:
+            profiler.mark('background')
+
+        # - Ask for new flow fields for targets that moved to another cell - #
+        for flow_field in self.flow_fields:
+            flow_field.update()
+
+        # Call Update on all objects
+        if store is not None:
+            # - Move every stored object at once, then update the rest - #
+            store.integrate()
+            if self.spatial_hash is not None:
+                for item in store.moved_objects():
+                    self.spatial_hash.move(item)
+        awake = []
+        skipped = 0
+        stepping = dispatch['step']
+        for item in self.objects:
+            if sleeping and item in sleeping:
+                # - Sleeping objects stay asleep until moved, resized, given a new image or given speed - #
+                x, y, image, rect, area = sleeping[item]
+                if (item.x == x and item.y == y and not item.x_speed
+                        and not item.y_speed and not item.gravity
+                        and item.image is image and item.rect is rect and rect == area):
+                    skipped += 1
+                    continue
+                self._wake_object(item)
+            if item._entity_store is None:
                 item.update()
+            if item in stepping:
                 item.step()
+            awake.append(item)
+        self.skipped_objects = skipped
+        if profiler:
+            profiler.mark('update')
 
-            # Check collisions
-            for item in self.objects:
+        # Check collisions
+        if self._dispatch_dirty:
+            self._build_dispatch()
+            dispatch = self._dispatch
+        pending_deletes = self._pending_deletes
+        if self.collision_backend is not None:
+            self.collision_backend.check(self.objects, dispatch['check_collisions'],
+                                         self._collision_interest, self._by_type, pending_deletes)
+        elif not sleeping:
+            for item in dispatch['check_collisions']:
+                if pending_deletes and item in pending_deletes:
+                    continue
                 item.check_collisions()
+        else:
+            # - Sleeping objects only collide with objects that are awake - #
+            sleeping_watchers = self._sleeping_watchers
+            colliding = dispatch['check_collisions']
+            for item in awake:
+                if pending_deletes and item in pending_deletes:
+                    continue
+                if item in colliding:
+                    item.check_collisions()
+                item_type = type(item).__name__
+                if item_type in sleeping_watchers:
+                    self._passive_collisions(item, item_type)
+        if self.sleeping_enabled:
+            for item in awake:
+                if not (pending_deletes and item in pending_deletes):
+                    self._try_sleep(item)
+
+        # - Add and remove objects queued during the frame - #
+        self.apply_object_changes()
+        if profiler:
+            profiler.mark('collisions')
 
-            for item in self.objects:
-                self.screen.blit(item.image, (item.x, item.y))
+        # - Move the camera to where its target ended up - #
+        camera = self.camera
+        if camera is not None:
+            camera.update()
+            if camera.moved and dirty_rendering:
+                # - Everything on screen shifts while the camera scrolls, so the frame is drawn in full - #
+                dirty_rendering = False
+                self.redraw_screen()
+                if rendering:
+                    self.screen.fill(self.background_color)
+                    if self.background_set:
+                        self.screen.blit(self.background_image, (0, 0))
+
+        if not rendering:
+            pass
+        elif dirty_rendering:
+            dirty = self.render_dirty_rects()
+            if profiler:
+                profiler.mark('blit')
+            if dirty:
+                pygame.display.update(dirty)
+        else:
+            if self.tile_map is not None:
+                self.tile_map.draw(self.screen, self.viewport)
+            self.render_objects()
+            if overlay:
+                profiler.draw_overlay(self.screen)
+            if profiler:
+                profiler.mark('blit')
 
             pygame.display.update()
 
-        return self.quitting
+        if profiler:
+            if not rendering:
+                profiler.mark('blit')
+            profiler.mark('flip')
+            profiler.end_frame()
+
+        return self.running
 
     def set_background_image(self, image_file: str):
         """
@@ -212,7 +520,112 @@ class Level:
             image_file (str): Filename of the background image.
         """
         self.background_set = True
-        self.background_image = pygame.image.load(os.path.join('Images', image_file)).convert_alpha()
+        self.background_image = AssetCache.shared().get_image(os.path.join('Images', image_file))
+        self.redraw_screen()
+
+    def set_wall_map(self, image_file: str, mask_file: str = None, cell_size: int = 8):
+        """
+        Sets the walls of the level from the dark pixels of an image, usually the background.
+
+        Objects can then test their hitbox against the walls with RoomObject.hits_wall_at.
+
+        Args:
+            image_file (str): Filename of the background image in the Images directory.
+            mask_file (str, optional): Filename of an image marking the walls, used instead of the background.
+            cell_size (int, optional): Width and height of each cell of the walkability grid. Defaults to 8.
+        """
+        mask_path = os.path.join('Images', mask_file) if mask_file else None
+        self.wall_map = WallMap.load(os.path.join('Images', image_file), mask_path, cell_size)
+
+    def set_maze(self, maze: MazeGenerator, cell_size: int = 8):
+        """
+        Builds the level on a generated maze, drawn as its tile map and used as its walls.
+
+        Only the chunks of the maze on screen are drawn, so the maze can be
+        larger than the screen when the level has a camera (see enable_camera).
+
+        Args:
+            maze (MazeGenerator): The maze.
+            cell_size (int, optional): Width and height of each cell of the walkability grid. Defaults to 8.
+        """
+        self.maze = maze
+        self.background_color = maze.floor_color
+        self.wall_map = maze.wall_map(cell_size)
+        self.set_tile_map(TileMap(maze.width, maze.height, maze.render_chunk))
+
+    def set_tile_map(self, tile_map: TileMap):
+        """
+        Draws a TileMap behind the objects, scrolled with the camera.
+
+        A background image, if set, is still drawn first and stays put on the screen.
+
+        Args:
+            tile_map (TileMap): The map.
+        """
+        self.tile_map = tile_map
+        if self.camera is not None and self.camera.bounds is None:
+            self.camera.bounds = pygame.Rect(0, 0, tile_map.width, tile_map.height)
+        self.redraw_screen()
+
+    def enable_camera(self, target: RoomObject = None) -> Camera:
+        """
+        Turns on a Camera the size of the screen, so the level can be larger than the screen.
+
+        Objects are drawn where the camera shows them, objects with fixed set
+        are drawn at their screen position, and mouse positions passed to
+        objects are in room coordinates. The camera is kept inside the tile
+        map, when there is one. With dirty-rectangle rendering on, frames
+        where the camera moves are drawn in full.
+
+        Args:
+            target (RoomObject, optional): The object to keep in the middle of the screen.
+
+        Returns:
+            Camera: The camera, also kept as camera.
+        """
+        width, height = self.screen.get_size()
+        bounds = None
+        if self.tile_map is not None:
+            bounds = pygame.Rect(0, 0, self.tile_map.width, self.tile_map.height)
+        self.camera = Camera(width, height, bounds)
+        self.viewport = self.camera.view
+        if target is not None:
+            self.camera.follow(target)
+        self.redraw_screen()
+        return self.camera
+
+    def enable_path_finding(self, width: int, height: int, max_paths: int = 256):
+        """
+        Turns on routes around the walls for objects with a hitbox of a given size.
+
+        Call set_wall_map first. Goals such as the exit can then be added to
+        path_finder, so routes to them are read off a distance field.
+
+        Args:
+            width (int): Width in pixels of the hitbox of the objects that follow routes.
+            height (int): Height in pixels of the hitbox of the objects that follow routes.
+            max_paths (int, optional): Maximum number of routes to cache. Defaults to 256.
+        """
+        self.path_finder = PathFinder.from_wall_map(self.wall_map, width, height, max_paths)
+
+    def add_flow_field(self, target: RoomObject, budget: int = 4096, threaded: bool = False) -> FlowField:
+        """
+        Creates a FlowField leading to an object, kept up to date as the object moves.
+
+        Call enable_path_finding first, with the hitbox size of the followers.
+        Followers move along it with RoomObject.follow_flow_field.
+
+        Args:
+            target (RoomObject): The object to lead followers to.
+            budget (int, optional): Cells searched per frame when the target moves. Defaults to 4096.
+            threaded (bool, optional): Work out new fields on a worker thread instead. Defaults to False.
+
+        Returns:
+            FlowField: The new field.
+        """
+        flow_field = FlowField(self.path_finder, target, budget, threaded)
+        self.flow_fields.append(flow_field)
+        return flow_field
 
     def set_background_scroll(self, speed: int):
         """
@@ -224,35 +637,614 @@ class Level:
         self.background_scrolling = True
         self.background_scroll_speed = speed
 
+    def enable_spatial_hash(self, cell_size: int = 128):
+        """
+        Turns on the spatial hash broad phase for collision checks.
+
+        Once enabled, objects only test for collisions against objects in the
+        grid cells they overlap. Choose a cell size a little larger than the
+        typical object in the room.
+
+        Args:
+            cell_size (int, optional): Width and height of each grid cell in pixels. Defaults to 128.
+        """
+        self.spatial_hash = SpatialHash(cell_size)
+        for obj in self.objects:
+            self.spatial_hash.insert(obj)
+
+    def enable_entity_store(self):
+        """
+        Moves the motion state of the level's objects into NumPy arrays.
+
+        Every object that uses the standard RoomObject.update then has its
+        gravity, speed and position applied by a few vectorized operations per
+        frame. Rects follow the new positions when they are next read. All
+        objects are moved before any step() is called.
+
+        This pays off for rooms with many objects moved by speed and gravity
+        alone. Reading and writing x, y and the other stored attributes from
+        Python is slower than for a plain object, so rooms whose objects do a
+        lot of work in step() may run slower with it.
+        """
+        from GameFrame.EntityStore import EntityStore
+        self.entity_store = EntityStore()
+        for obj in self.objects:
+            if self.entity_store.can_store(obj):
+                self.entity_store.add(obj)
+
+    def enable_vectorized_collisions(self):
+        """
+        Replaces the per-object collision loop with one NumPy pass over all registered pairs.
+
+        Suits rooms with many colliding objects, such as lots of bullets or
+        pickups. handle_collision is called with the same arguments as before,
+        though hits within a frame may come in a different order. Objects that
+        override check_collisions still have it called.
+        """
+        from GameFrame.VectorCollisions import VectorCollisions
+        self.collision_backend = VectorCollisions()
+
+    def _can_sleep(self, room_object: RoomObject) -> bool:
+        """
+        Checks whether an object is static and can skip its per-frame update.
+
+        An object is static when its class does not override update, step,
+        prestep or check_collisions, it has no speed or gravity, and it did
+        not move this frame.
+
+        Args:
+            room_object (RoomObject): The object to check.
+
+        Returns:
+            bool: True if the object can be put to sleep.
+        """
+        return (not room_object.x_speed and not room_object.y_speed and not room_object.gravity
+                and room_object.x == room_object.prev_x and room_object.y == room_object.prev_y
+                and room_object._entity_store is None
+                and isinstance(room_object.rect, pygame.Rect)
+                and type(room_object).update is RoomObject.update
+                and not self._hooks_of(room_object) & {'prestep', 'step', 'check_collisions'})
+
+    def _hooks_of(self, room_object: RoomObject) -> frozenset:
+        """
+        Returns the HOOKS an object's class overrides.
+
+        Args:
+            room_object (RoomObject): The object to check.
+
+        Returns:
+            frozenset: The names of the overridden hooks.
+        """
+        cls = type(room_object)
+        hooks = self._class_hooks.get(cls)
+        if hooks is None:
+            hooks = self._class_hooks[cls] = frozenset(
+                name for name in self.HOOKS if getattr(cls, name) is not getattr(RoomObject, name))
+        return hooks
+
+    def _build_dispatch(self):
+        """
+        Rebuilds the per-hook lists of objects the game loop calls.
+
+        Each list holds only the objects that override that hook, in the order
+        the loop visits them, so the loop makes no calls to methods that do
+        nothing. check_collisions is also called on objects that have
+        registered collision types. The lists are dictionaries keyed by
+        object, so objects added and deleted are put in and taken out one at
+        a time; they are only rebuilt when an object's collision types or key
+        subscriptions change.
+        """
+        self._dispatch = {name: {} for name in self.HOOKS}
+        self._dispatch['key_order'] = {}
+        self._key_order_next = 0
+        self._dispatch_dirty = False
+        for obj in self.objects:
+            self._dispatch_object(obj)
+        for obj in self.keyboard_objects:
+            self._dispatch_keyboard(obj)
+        for obj in self.mouse_objects:
+            self._dispatch_mouse(obj)
+
+    def _dispatch_object(self, room_object: RoomObject):
+        """
+        Appends an object to the per-frame hook lists it belongs to.
+
+        Args:
+            room_object (RoomObject): The object.
+        """
+        dispatch = self._dispatch
+        hooks = self._class_hooks.get(type(room_object))
+        if hooks is None:
+            hooks = self._hooks_of(room_object)
+        if 'prestep' in hooks:
+            dispatch['prestep'][room_object] = None
+        if 'step' in hooks:
+            dispatch['step'][room_object] = None
+        if room_object.collision_object_types or 'check_collisions' in hooks:
+            dispatch['check_collisions'][room_object] = None
+
+    def _dispatch_keyboard(self, room_object: RoomObject):
+        """
+        Appends an object to the keyboard and joystick hook lists it belongs to.
+
+        Args:
+            room_object (RoomObject): The object, one of the keyboard objects.
+        """
+        dispatch = self._dispatch
+        dispatch['key_order'][room_object] = self._key_order_next
+        self._key_order_next += 1
+        hooks = self._hooks_of(room_object)
+        for name in ('text_input', 'joy_pad_signal'):
+            if name in hooks:
+                dispatch[name][room_object] = None
+        # - Objects subscribed to keys are reached through the subscriptions - #
+        if not room_object.key_subscriptions:
+            for name in ('key_pressed', 'key_down', 'key_up'):
+                if name in hooks:
+                    dispatch[name][room_object] = None
+
+    def _dispatch_mouse(self, room_object: RoomObject):
+        """
+        Appends an object to the mouse hook lists it belongs to.
+
+        Args:
+            room_object (RoomObject): The object, one of the mouse objects.
+        """
+        hooks = self._hooks_of(room_object)
+        for name in ('mouse_event', 'clicked'):
+            if name in hooks:
+                self._dispatch[name][room_object] = None
+
+    def _undispatch(self, room_object: RoomObject):
+        """
+        Takes an object out of every hook list.
+
+        Args:
+            room_object (RoomObject): The object.
+        """
+        for entry in self._dispatch.values():
+            entry.pop(room_object, None)
+
+    def _try_sleep(self, room_object: RoomObject):
+        """
+        Puts a static object to sleep, unless it overlaps an object it collides with.
+
+        An object that is touching a collision partner stays awake, so the
+        collision is still reported every frame.
+
+        Args:
+            room_object (RoomObject): The object to put to sleep.
+        """
+        if not self._can_sleep(room_object):
+            return
+        rect = room_object.rect
+        for other in room_object.collision_objects:
+            if rect.colliderect(other.rect):
+                return
+        for other in self._collision_interest.get(type(room_object).__name__, ()):
+            if other is not room_object and rect.colliderect(other.rect):
+                return
+        # - The rect's value is kept too, so changing it in place also wakes the object - #
+        self._sleeping[room_object] = (room_object.x, room_object.y, room_object.image, rect, rect.copy())
+        for obj_name in room_object.collision_object_types:
+            self._index(self._sleeping_watchers, obj_name, room_object)
+            self._sleeping_rects.pop(obj_name, None)
+
+    def _wake_object(self, room_object: RoomObject):
+        """
+        Wakes a sleeping object, so it is updated every frame again.
+
+        Args:
+            room_object (RoomObject): The sleeping object.
+        """
+        if self._sleeping.pop(room_object, None) is None:
+            return
+        self.woken_objects += 1
+        self._forget_sleeper(room_object)
+
+    def _forget_sleeper(self, room_object: RoomObject):
+        """
+        Removes an object from the sleeping collision watchers.
+
+        Args:
+            room_object (RoomObject): The object that is no longer asleep.
+        """
+        for obj_name in room_object.collision_object_types:
+            self._unindex(self._sleeping_watchers, obj_name, room_object)
+            self._sleeping_rects.pop(obj_name, None)
+
+    def _passive_collisions(self, room_object: RoomObject, item_type: str):
+        """
+        Reports collisions between an awake object and sleeping objects registered for its type.
+
+        Sleeping objects do not move or change, as any change to their
+        position, rect or image wakes them and clears the cache, so their
+        rects are gathered once per type and tested together.
+
+        Args:
+            room_object (RoomObject): The awake object.
+            item_type (str): The awake object's class name.
+        """
+        cached = self._sleeping_rects.get(item_type)
+        if cached is None:
+            watchers = list(self._sleeping_watchers[item_type])
+            cached = self._sleeping_rects[item_type] = (watchers, [obj.rect for obj in watchers])
+        watchers, rects = cached
+        pending_deletes = self._pending_deletes
+        for index in room_object.rect.collidelistall(rects):
+            watcher = watchers[index]
+            if pending_deletes and (watcher in pending_deletes or room_object in pending_deletes):
+                continue
+            watcher.handle_collision(room_object, item_type)
+
+    def sleep_stats(self) -> dict:
+        """
+        Returns how many objects are sleeping and how much work that saved.
+
+        Returns:
+            dict: sleeping, skipped (in the last frame) and woken counts.
+        """
+        return {
+            'sleeping': len(self._sleeping),
+            'skipped': self.skipped_objects,
+            'woken': self.woken_objects,
+        }
+
+    def set_dirty_rect_rendering(self, enabled: bool = True):
+        """
+        Turns dirty-rectangle rendering on or off.
+
+        When on, each frame only the areas where objects moved, changed image,
+        appeared or were deleted are restored from the background and redrawn,
+        and only those areas are sent to the display. This suits rooms where
+        most of the screen stays still. Rooms with a scrolling background are
+        always drawn in full.
+
+        Objects that draw onto their image or onto the screen directly should
+        call redraw_screen() so the change is shown.
+
+        Args:
+            enabled (bool, optional): True to draw only changed areas. Defaults to True.
+        """
+        self.dirty_rect_rendering = enabled
+        self.redraw_screen()
+
+    def redraw_screen(self):
+        """
+        Forces the next frame to redraw and update the whole screen.
+        """
+        self._background_cache = None
+        self._full_redraw = True
+
+    def render_objects(self):
+        """
+        Draws every object inside the viewport in depth order, with one Surface.blits call.
+
+        With a camera, objects are drawn shifted by the camera's position, except fixed ones.
+        """
+        left, top, right, bottom = (self.viewport.left, self.viewport.top,
+                                    self.viewport.right, self.viewport.bottom)
+        batch = []
+        append = batch.append
+        culled = 0
+        shifted = self.camera is not None
+        for item in self.render_list.ordered():
+            x = item.x
+            y = item.y
+            if shifted and item.fixed:
+                append((item.image, (x, y)))
+                continue
+            if x >= right or y >= bottom:
+                culled += 1
+                continue
+            image = item.image
+            # - The image size is only needed for objects starting before the viewport - #
+            if x < left or y < top:
+                width, height = image.get_size()
+                if x + width <= left or y + height <= top:
+                    culled += 1
+                    continue
+            if shifted:
+                append((image, (x - left, y - top)))
+            else:
+                append((image, (x, y)))
+        self.screen.blits(batch, doreturn=False)
+        self.drawn_objects = len(batch)
+        self.culled_objects = culled
+
+    def render_dirty_rects(self):
+        """
+        Draws the frame by redrawing only the screen areas that have changed.
+
+        Each object's drawn rect and image are remembered between frames. The
+        previous and current rects of anything that changed are restored from a
+        cached copy of the background, every object touching those areas is
+        redrawn in depth order, clipped to the area.
+
+        Returns:
+            list: The screen areas that changed, for pygame.display.update, empty when nothing changed.
+        """
+        screen = self.screen
+        if self._background_cache is None:
+            self._background_cache = Surface(screen.get_size()).convert()
+            self._background_cache.fill(self.background_color)
+            if self.background_set:
+                self._background_cache.blit(self.background_image, (0, 0))
+            if self.tile_map is not None:
+                self.tile_map.draw(self._background_cache, self.viewport)
+
+        previous = self._drawn_rects
+        current = {}
+        dirty = []
+        viewport = self.viewport
+        # - With a camera, rects are kept in screen coordinates - #
+        shifted = self.camera is not None
+        screen_area = screen.get_rect()
+        culled = 0
+        for item in self.render_list.ordered():
+            image = item.image
+            rect = pygame.Rect(item.x, item.y, image.get_width(), image.get_height())
+            fixed = shifted and item.fixed
+            if not rect.colliderect(screen_area if fixed else viewport):
+                # - Treated as removed, so the area it left is restored - #
+                culled += 1
+                continue
+            if shifted and not fixed:
+                rect.move_ip(-viewport.x, -viewport.y)
+            current[item] = (rect, image)
+            drawn = previous.pop(item, None)
+            if drawn is None:
+                dirty.append(rect)
+            elif drawn[1] is not image or drawn[0] != rect:
+                if drawn[0].colliderect(rect):
+                    dirty.append(drawn[0].union(rect))
+                else:
+                    dirty.append(drawn[0])
+                    dirty.append(rect)
+        # - Anything left was deleted since the last frame - #
+        for rect, image in previous.values():
+            dirty.append(rect)
+        self._drawn_rects = current
+        self.drawn_objects = len(current)
+        self.culled_objects = culled
+
+        if self._full_redraw:
+            self._full_redraw = False
+            screen.blit(self._background_cache, (0, 0))
+            screen.blits([(image, rect) for rect, image in current.values()], doreturn=False)
+            return [screen.get_rect()]
+
+        if not dirty:
+            return dirty
+        # - Redraw each area clipped to itself so that overlapping areas - #
+        # - never blend the same translucent pixels twice - #
+        for dirty_rect in dirty:
+            screen.set_clip(dirty_rect)
+            screen.blit(self._background_cache, dirty_rect, dirty_rect)
+            screen.blits([(image, rect) for rect, image in current.values()
+                          if rect.colliderect(dirty_rect)], doreturn=False)
+        screen.set_clip(None)
+        return dirty
+
     def add_room_object(self, room_object: RoomObject):
         """
         Adds a RoomObject to the level and registers it for events as needed.
 
+        While the level is running, the object is queued and joins the level
+        when the frame's object changes are applied, after collisions and
+        before drawing.
+
         Args:
             room_object (RoomObject): The object to add.
         """
-        # - Add to room objects list - #
-        if len(self.objects) == 0:
-            self.objects.append(room_object)
+        if self._defer_object_changes:
+            self._pending_adds[room_object] = None
         else:
-            for index, item in enumerate(self.objects):
-                if item.depth >= room_object.depth:
-                    self.objects.insert(index, room_object)
-                    break
-                elif index == len(self.objects) - 1:
-                    self.objects.append(room_object)
-                    break
-
-        # - Add objects that handle key events to array - #
+            self._attach_object(room_object)
+
+    def _attach_object(self, room_object: RoomObject):
+        """
+        Puts an object into the level's object, event and collision lists.
+
+        Args:
+            room_object (RoomObject): The object to add.
+        """
+        # - Add to room objects, and to the drawing order by depth - #
+        self.objects[room_object] = None
+        self.render_list.add(room_object)
+
+        # - Add objects that handle key events - #
         if room_object.handle_key_events:
-            self.keyboard_objects.append(room_object)
+            self.keyboard_objects[room_object] = None
 
-        # - Add objects that handle mouse events to array - #
+        # - Add objects that handle mouse events - #
         if room_object.handle_mouse_events:
-            self.mouse_objects.append(room_object)
+            self.mouse_objects[room_object] = None
+
+        # - Index by class name, tag and the types it collides with - #
+        self._index(self._by_type, type(room_object).__name__, room_object)
+        for tag in room_object.tags:
+            self._index(self._by_tag, tag, room_object)
+        for obj_name in room_object.collision_object_types:
+            self._index(self._collision_interest, obj_name, room_object)
+        for key in room_object.key_subscriptions:
+            self._index(self._key_subscribers, key, room_object)
+
+        if self.spatial_hash is not None:
+            self.spatial_hash.insert(room_object)
+
+        if self.entity_store is not None and self.entity_store.can_store(room_object):
+            self.entity_store.add(room_object)
 
         if self.running:
             self.dynamic_init_collision_list(room_object)
+        # - Joins the end of its hook lists, as it comes last in every list they follow - #
+        if not self._dispatch_dirty:
+            self._dispatch_object(room_object)
+            if room_object in self.keyboard_objects:
+                self._dispatch_keyboard(room_object)
+            if room_object in self.mouse_objects:
+                self._dispatch_mouse(room_object)
+
+    @staticmethod
+    def _index(index: dict, key, room_object: RoomObject):
+        """
+        Adds an object to one entry of an object index.
+
+        Args:
+            index (dict): The index to add to.
+            key: The class name, tag or collision type to file the object under.
+            room_object (RoomObject): The object to add.
+        """
+        entry = index.get(key)
+        if entry is None:
+            entry = index[key] = {}
+        entry[room_object] = None
+
+    @staticmethod
+    def _unindex(index: dict, key, room_object: RoomObject):
+        """
+        Removes an object from one entry of an object index.
+
+        Args:
+            index (dict): The index to remove from.
+            key: The class name, tag or collision type the object is filed under.
+            room_object (RoomObject): The object to remove.
+        """
+        entry = index.get(key)
+        if entry is not None:
+            entry.pop(room_object, None)
+            if not entry:
+                del index[key]
+
+    def _is_attached(self, room_object: RoomObject) -> bool:
+        """
+        Checks whether an object is currently part of the level.
+
+        Args:
+            room_object (RoomObject): The object to check.
+
+        Returns:
+            bool: True if the object has been added and not yet removed.
+        """
+        return room_object in self._by_type.get(type(room_object).__name__, ())
+
+    def tag_object(self, room_object: RoomObject, tag: str):
+        """
+        Files an object in the level under a tag. Called by RoomObject.add_tag.
+
+        Args:
+            room_object (RoomObject): The tagged object.
+            tag (str): The tag.
+        """
+        if self._is_attached(room_object):
+            self._index(self._by_tag, tag, room_object)
+
+    def untag_object(self, room_object: RoomObject, tag: str):
+        """
+        Removes an object from a tag in the level. Called by RoomObject.remove_tag.
+
+        Args:
+            room_object (RoomObject): The object.
+            tag (str): The tag.
+        """
+        self._unindex(self._by_tag, tag, room_object)
+
+    def collision_type_registered(self, room_object: RoomObject, collision_object: str):
+        """
+        Records that an object has registered for collisions with a type.
+        Called by RoomObject.register_collision_object.
+
+        Args:
+            room_object (RoomObject): The object checking for collisions.
+            collision_object (str): The class name it checks against.
+        """
+        if self._is_attached(room_object):
+            self._index(self._collision_interest, collision_object, room_object)
+            if room_object not in self._dispatch.get('check_collisions', ()):
+                self._dispatch_dirty = True
+        self._wake_object(room_object)
+
+    def depth_changed(self, room_object: RoomObject):
+        """
+        Moves an object in the drawing order after its depth changed. Called by RoomObject.set_depth.
+
+        Args:
+            room_object (RoomObject): The object.
+        """
+        if room_object in self.render_list:
+            self.render_list.update_depth(room_object)
+            # - Its area is redrawn as if it had just been added - #
+            self._drawn_rects.pop(room_object, None)
+
+    def start_text_input(self, room_object: RoomObject):
+        """
+        Turns on pygame text input for an object, such as a focused EntryTextObject.
+
+        Text input stays on until every object that asked for it has called
+        stop_text_input or been deleted, or the level ends.
+
+        Args:
+            room_object (RoomObject): The object reading text.
+        """
+        self._text_input_objects[room_object] = None
+        pygame.key.start_text_input()
+
+    def stop_text_input(self, room_object: RoomObject):
+        """
+        Records that an object no longer reads text, turning text input off when none do.
+
+        Args:
+            room_object (RoomObject): The object.
+        """
+        if room_object in self._text_input_objects:
+            del self._text_input_objects[room_object]
+            if not self._text_input_objects:
+                pygame.key.stop_text_input()
+
+    def key_subscribed(self, room_object: RoomObject, key: int):
+        """
+        Records that an object wants events for a key. Called by RoomObject.subscribe_key.
+
+        Args:
+            room_object (RoomObject): The subscribing object.
+            key (int): The pygame key constant.
+        """
+        if self._is_attached(room_object):
+            if room_object not in self.keyboard_objects:
+                self.keyboard_objects[room_object] = None
+            self._index(self._key_subscribers, key, room_object)
+            self._dispatch_dirty = True
+
+    def key_unsubscribed(self, room_object: RoomObject, key: int):
+        """
+        Records that an object no longer wants events for a key.
+        Called by RoomObject.unsubscribe_key.
+
+        Args:
+            room_object (RoomObject): The object.
+            key (int): The pygame key constant.
+        """
+        self._unindex(self._key_subscribers, key, room_object)
+        self._dispatch_dirty = True
+
+    def _key_edge(self, key: int, hook: str):
+        """
+        Calls key_down or key_up on the objects that want it for a key.
+
+        Args:
+            key (int): The pressed or released key.
+            hook (str): 'key_down' or 'key_up'.
+        """
+        if self._dispatch_dirty:
+            self._build_dispatch()
+        dispatch = self._dispatch
+        targets = dispatch[hook]
+        subscribers = self._key_subscribers.get(key)
+        if subscribers:
+            targets = sorted([*targets, *subscribers], key=dispatch['key_order'].__getitem__)
+        for obj in targets:
+            getattr(obj, hook)(key)
 
     def load_sound(self, sound_file: str) -> Sound:
         """
@@ -294,9 +1286,9 @@ class Level:
         """
         # - Initialise collision list for object - #
         for obj_name in room_object.collision_object_types:
-            for obj_instance in self.objects:
-                if type(obj_instance).__name__ == obj_name and obj_instance is not room_object:
-                    room_object.collision_objects.append(obj_instance)
+            for obj_instance in self._by_type.get(obj_name, ()):
+                if obj_instance is not room_object:
+                    self._add_collision_target(room_object, obj_instance)
 
     def dynamic_init_collision_list(self, room_object: RoomObject):
         """
@@ -307,10 +1299,24 @@ class Level:
         """
         self.init_collision_list(room_object)
         obj_type = type(room_object).__name__
-        for obj in self.objects:
+        for obj in self._collision_interest.get(obj_type, ()):
             if obj is not room_object:
-                if obj_type in obj.collision_object_types:
-                    obj.collision_objects.append(room_object)
+                self._add_collision_target(obj, room_object)
+
+    def _add_collision_target(self, room_object: RoomObject, target: RoomObject):
+        """
+        Adds target to an object's collision list, remembering the link so that
+        deleting target only touches the lists that hold it.
+
+        Args:
+            room_object (RoomObject): The object checking for collisions.
+            target (RoomObject): The object to check against.
+        """
+        room_object.collision_objects.append(target)
+        watchers = self._collision_watchers.get(target)
+        if watchers is None:
+            watchers = self._collision_watchers[target] = {}
+        watchers[room_object] = None
 
     def catch_events(self, events):
         """
@@ -325,46 +1331,129 @@ class Level:
         """
         Removes an object from the level and all event/collision lists.
 
+        While the level is running, the object is queued and removed when the
+        frame's object changes are applied. Until then it is skipped by
+        collision checks.
+
         Args:
             obj (RoomObject): The object to remove.
         """
-        for index, list_obj in self.enumerate_backwards(self.objects):
-            if list_obj is obj:
-                self.objects.pop(index)
-            else:
-                list_obj.remove_object(obj)
-        for index, list_obj in self.enumerate_backwards(self.keyboard_objects):
-            if list_obj is obj:
-                self.keyboard_objects.pop(index)
-        for index, list_obj in self.enumerate_backwards(self.mouse_objects):
-            if list_obj is obj:
-                self.mouse_objects.pop(index)
-        # Remove any timed function calls for the deleted object
-        for index, event_method in self.enumerate_backwards(self.user_events):
-            obj_inst = event_method[1].__self__
-            if obj_inst is obj:
-                self.user_events.pop(index)
-
-    def set_timer(self, ticks: int, function_call: Callable):
+        if obj in self._pending_adds:
+            del self._pending_adds[obj]
+        elif self._defer_object_changes:
+            self._pending_deletes[obj] = None
+        else:
+            self._detach_objects({obj: None})
+
+    def is_deleted(self, obj: RoomObject) -> bool:
+        """
+        Checks whether an object has been deleted during the current frame.
+
+        Args:
+            obj (RoomObject): The object to check.
+
+        Returns:
+            bool: True if the object is waiting to be removed from the level.
+        """
+        return obj in self._pending_deletes
+
+    def apply_object_changes(self):
+        """
+        Applies the object additions and deletions queued during the frame.
+
+        Deletions are applied first, as one batch, then additions in the order
+        they were made. The game loop calls this once per frame, after
+        collisions and before drawing.
+        """
+        if self._pending_deletes:
+            deleted = self._pending_deletes
+            self._pending_deletes = {}
+            self._detach_objects(deleted)
+        while self._pending_adds:
+            added = list(self._pending_adds)
+            self._pending_adds.clear()
+            for room_object in added:
+                self._attach_object(room_object)
+
+    def _detach_objects(self, deleted: dict):
+        """
+        Removes a batch of objects from the level's object, event and collision lists.
+
+        Each object is popped from the level's dictionaries, so the cost
+        depends on the size of the batch, not of the level, and only the
+        collision lists known to hold a deleted object are touched.
+
+        Args:
+            deleted (dict): The objects to remove, as dictionary keys.
+        """
+        objects = self.objects
+        keyboard_objects = self.keyboard_objects
+        mouse_objects = self.mouse_objects
+        render_list = self.render_list
+        for obj in deleted:
+            objects.pop(obj, None)
+            keyboard_objects.pop(obj, None)
+            mouse_objects.pop(obj, None)
+            render_list.remove(obj)
+        if not self._dispatch_dirty:
+            for obj in deleted:
+                self._undispatch(obj)
+
+        affected = {}
+        for obj in deleted:
+            watchers = self._collision_watchers.pop(obj, None)
+            if watchers:
+                affected.update(watchers)
+            # - Forget the links from this object to its own targets - #
+            for target in obj.collision_objects:
+                target_watchers = self._collision_watchers.get(target)
+                if target_watchers is not None:
+                    target_watchers.pop(obj, None)
+        for watcher in affected:
+            if watcher not in deleted:
+                watcher.collision_objects = [item for item in watcher.collision_objects
+                                             if item not in deleted]
+
+        for obj in deleted:
+            self._unindex(self._by_type, type(obj).__name__, obj)
+            for tag in obj.tags:
+                self._unindex(self._by_tag, tag, obj)
+            for obj_name in obj.collision_object_types:
+                self._unindex(self._collision_interest, obj_name, obj)
+            for key in obj.key_subscriptions:
+                self._unindex(self._key_subscribers, key, obj)
+            if self.spatial_hash is not None:
+                self.spatial_hash.remove(obj)
+            if obj._entity_store is not None:
+                obj._entity_store.remove(obj)
+            if self._sleeping.pop(obj, None) is not None:
+                self._forget_sleeper(obj)
+            if obj in self._text_input_objects:
+                self.stop_text_input(obj)
+            # Remove any timed function calls for the deleted object
+            self.scheduler.cancel_owner(obj)
+
+    def set_timer(self, ticks: int, function_call: Callable, repeat: bool = False) -> TimerHandle:
         """
         Sets a timed event to call a function after a number of ticks.
 
+        Timers due on the same frame are called most recently set first.
+
         Args:
             ticks (int): Number of frames to wait before calling the function.
             function_call (Callable): The function to call.
+            repeat (bool, optional): Call the function every ticks frames until cancelled. Defaults to False.
+
+        Returns:
+            TimerHandle: A handle whose cancel() method stops the timer.
         """
-        self.user_events.append([ticks, function_call])
+        return self.scheduler.schedule(ticks, function_call, repeat)
 
     def process_user_events(self):
         """
         Processes and triggers any timed user events.
         """
-        for index, user_event in self.enumerate_backwards(self.user_events):
-            user_event[0] -= 1
-            if user_event[0] <= 0:
-                event = user_event[1]
-                self.user_events.pop(index)
-                event()
+        self.scheduler.tick()
                 
     def count_object(self, object_name):
         """
@@ -376,12 +1465,49 @@ class Level:
         Returns:
             int: The number of objects of the specified type.
         """
-        total = 0
-        for item in self.objects:
-            item_type = type(item).__name__
-            if object_name == item_type:
-                total += 1            
-        return total
+        return len(self._by_type.get(object_name, ()))
+
+    def objects_of_type(self, object_type) -> List[RoomObject]:
+        """
+        Returns every object of a given type in the level.
+
+        Args:
+            object_type (str | type): The class, or class name, of the objects to find.
+
+        Returns:
+            List[RoomObject]: The objects, in the order they were added.
+        """
+        if isinstance(object_type, type):
+            object_type = object_type.__name__
+        return list(self._by_type.get(object_type, ()))
+
+    def first_of_type(self, object_type):
+        """
+        Returns the first object of a given type added to the level.
+
+        Args:
+            object_type (str | type): The class, or class name, of the object to find.
+
+        Returns:
+            RoomObject: The object, or None if there is no object of that type.
+        """
+        if isinstance(object_type, type):
+            object_type = object_type.__name__
+        for obj in self._by_type.get(object_type, ()):
+            return obj
+        return None
+
+    def objects_with_tag(self, tag: str) -> List[RoomObject]:
+        """
+        Returns every object in the level with the given tag.
+
+        Args:
+            tag (str): The tag to look for.
+
+        Returns:
+            List[RoomObject]: The objects, in the order they were tagged.
+        """
+        return list(self._by_tag.get(tag, ()))
 
     # Iterate backwards over a list, using an index and item iterator
     def enumerate_backwards(self, object_list: List):
@@ -0,0 +1,324 @@
+import random
+import numpy as np
+import pygame
+from typing import List, Optional, Tuple
+from GameFrame.WallMap import WallMap
+
+Cell = Tuple[int, int]
+
+
+class MazeGenerator:
+    """
+    Carves a random maze from a seed, and places the start, the exit and the coins in it.
+
+    The maze is a grid of square cells with walls between them, carved with
+    a recursive backtracker: a walk that moves to a random unvisited
+    neighbour, knocking down the wall between, and backs up when it gets
+    stuck. Every cell is reached by exactly one route, and the long winding
+    corridors suit a maze game. The same seed always gives the same maze.
+
+    The walk keeps its state in flat byte arrays with a border of visited
+    cells, so it never checks bounds or builds per-cell objects, and mazes
+    of a million cells are carved in about a second.
+
+    The start is the bottom left cell and the exit is the cell furthest from
+    it along the corridors. Coins go in dead ends picked with the same seed.
+
+    The maze can be turned into:
+
+    - a walkability grid with one entry per cell and per wall between cells
+      (see walkable), small enough for mazes of any size;
+    - wall pixels and a WallMap for rooms drawn at full size (see wall_map);
+    - a background surface, drawn in chunks straight from the walkability
+      grid so any part can be drawn on its own (see render and render_chunk).
+
+    Cells are cell_size pixels apart, with a wall_width pixel wall line at
+    the top and left of each cell and along the right and bottom edges.
+
+    Attributes:
+        columns (int): Number of columns of cells.
+        rows (int): Number of rows of cells.
+        seed (int): The seed the maze was carved from.
+        cell_size (int): Distance in pixels from one cell to the next.
+        wall_width (int): Thickness of the walls in pixels.
+        width (int): Width of the maze in pixels.
+        height (int): Height of the maze in pixels.
+        passages (bytearray): Per cell, EAST if it opens to the cell on its right and
+            SOUTH if it opens to the cell below, numbered column by column.
+        start (tuple): (column, row) of the start cell.
+        end (tuple): (column, row) of the exit cell, the furthest from the start.
+        length (int): Number of moves from the start to the exit.
+        coins (list): (column, row) of each coin's cell.
+        floor_color (tuple): RGB color of the corridors.
+        wall_color (tuple): RGB color of the walls.
+    """
+
+    EAST = 1
+    SOUTH = 2
+
+    def __init__(self, columns: int, rows: int, seed: int = None, cell_size: int = 72, wall_width: int = 8,
+                 coins: int = 3, floor_color: Tuple[int, int, int] = (255, 255, 255),
+                 wall_color: Tuple[int, int, int] = (70, 72, 74)):
+        """
+        Initializes the generator and carves the maze.
+
+        Args:
+            columns (int): Number of columns of cells.
+            rows (int): Number of rows of cells.
+            seed (int, optional): The seed to carve from, a random one when not given.
+            cell_size (int, optional): Distance in pixels from one cell to the next. Defaults to 72.
+            wall_width (int, optional): Thickness of the walls in pixels. Defaults to 8.
+            coins (int, optional): Number of coins to place. Defaults to 3.
+            floor_color (tuple, optional): RGB color of the corridors. Defaults to white.
+            wall_color (tuple, optional): RGB color of the walls. Defaults to dark grey.
+        """
+        if columns < 1 or rows < 1:
+            raise ValueError(f"A maze needs at least one cell, not {columns}x{rows}")
+        if not 0 < wall_width < cell_size:
+            raise ValueError(f"wall_width must be between 0 and cell_size ({cell_size}), not {wall_width}")
+        self.columns = columns
+        self.rows = rows
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.cell_size = cell_size
+        self.wall_width = wall_width
+        self.width = columns * cell_size + wall_width
+        self.height = rows * cell_size + wall_width
+        self.floor_color = floor_color
+        self.wall_color = wall_color
+        self._walkable: Optional[np.ndarray] = None
+
+        generator = random.Random(self.seed)
+        self.start = (0, rows - 1)
+        self.passages, self.end, self.length, dead_ends = self._carve(generator)
+        dead_ends = [cell for cell in dead_ends if cell != self.start and cell != self.end]
+        self.coins: List[Cell] = generator.sample(dead_ends, min(coins, len(dead_ends)))
+
+    def _carve(self, generator: random.Random) -> Tuple[bytearray, Cell, int, List[Cell]]:
+        """
+        Carves the maze with a recursive backtracker, walked with a stack.
+
+        The walk's stack always holds the route back to the start, so its
+        length gives each cell's distance from the start for free, and a cell
+        the walk backs out of as soon as it arrives is a dead end.
+
+        Args:
+            generator (random.Random): The seeded random number generator.
+
+        Returns:
+            tuple: The passages, the cell furthest from the start, its distance and the dead ends.
+        """
+        columns, rows = self.columns, self.rows
+        # - Cells are numbered column by column with a border of visited cells, - #
+        # - so neighbours are plain offsets and never need a bounds check - #
+        stride = rows + 2
+        visited = bytearray(b'\x01' * stride) + (b'\x01' + b'\x00' * rows + b'\x01') * columns \
+            + bytearray(b'\x01' * stride)
+        passages = bytearray(len(visited))
+        east, south = self.EAST, self.SOUTH
+        rand = generator.random
+
+        start = (self.start[0] + 1) * stride + self.start[1] + 1
+        visited[start] = 1
+        stack = [start]
+        far, far_depth = start, 0
+        dead_ends = []
+        fresh = True
+        while stack:
+            cell = stack[-1]
+            # - Up to four unvisited neighbours, above, below, left and right - #
+            options = []
+            if not visited[cell - 1]:
+                options.append(cell - 1)
+            if not visited[cell + 1]:
+                options.append(cell + 1)
+            if not visited[cell - stride]:
+                options.append(cell - stride)
+            if not visited[cell + stride]:
+                options.append(cell + stride)
+            if not options:
+                if fresh:
+                    dead_ends.append(cell)
+                    if len(stack) > far_depth:
+                        far, far_depth = cell, len(stack)
+                    fresh = False
+                stack.pop()
+                continue
+            step = options[int(rand() * len(options))] if len(options) > 1 else options[0]
+            visited[step] = 1
+            # - Each opening is stored on the cell above or to the left of it - #
+            offset = step - cell
+            if offset == 1:
+                passages[cell] |= south
+            elif offset == -1:
+                passages[step] |= south
+            elif offset > 0:
+                passages[cell] |= east
+            else:
+                passages[step] |= east
+            stack.append(step)
+            fresh = True
+
+        # - Drop the border, leaving the cells numbered column by column - #
+        inner = np.frombuffer(passages, dtype=np.uint8).reshape(columns + 2, stride)[1:-1, 1:-1]
+        cells = [divmod(index, stride) for index in dead_ends]
+        return (bytearray(inner.tobytes()), (far // stride - 1, far % stride - 1), max(far_depth - 1, 0),
+                [(column - 1, row - 1) for column, row in cells])
+
+    def walkable(self) -> np.ndarray:
+        """
+        Returns the walkability grid: an entry for each cell, each wall between cells, and each corner.
+
+        Cell (column, row) is at [2 * column + 1, 2 * row + 1] and the
+        walls around it at the entries either side. Corners and the
+        outside edge are always walls.
+
+        Returns:
+            numpy.ndarray: True where the maze can be walked, indexed [x, y].
+                Do not modify it, it is shared by the other methods.
+        """
+        if self._walkable is None:
+            passages = np.frombuffer(self.passages, dtype=np.uint8).reshape(self.columns, self.rows)
+            grid = np.zeros((2 * self.columns + 1, 2 * self.rows + 1), dtype=bool)
+            grid[1::2, 1::2] = True
+            grid[2:-1:2, 1::2] = (passages[:-1] & self.EAST) != 0
+            grid[1::2, 2:-1:2] = (passages[:, :-1] & self.SOUTH) != 0
+            self._walkable = grid
+        return self._walkable
+
+    def wall_pixels(self, area: pygame.Rect = None) -> np.ndarray:
+        """
+        Returns which pixels are walls, for the whole maze or part of it.
+
+        Args:
+            area (pygame.Rect, optional): The part of the maze to return, the whole maze when not given.
+                Pixels outside the maze are not walls.
+
+        Returns:
+            numpy.ndarray: True for each wall pixel, indexed [x, y].
+        """
+        whole = pygame.Rect(0, 0, self.width, self.height)
+        if area is None:
+            area = whole
+        walls = np.zeros(area.size, dtype=bool)
+        inside = area.clip(whole)
+        if not inside.width or not inside.height:
+            return walls
+
+        # - Each grid entry covering the area is stretched to the pixels it - #
+        # - covers: the wall line at the start of each cell, then its floor - #
+        columns, x = self._entries(inside.left, inside.right)
+        rows, y = self._entries(inside.top, inside.bottom)
+        blocked = ~self.walkable()[columns, rows]
+        blocked = np.repeat(blocked, self._sizes(columns), axis=0)
+        blocked = np.repeat(blocked, self._sizes(rows), axis=1)
+        left = inside.left - area.left
+        top = inside.top - area.top
+        walls[left:left + inside.width, top:top + inside.height] = \
+            blocked[x:x + inside.width, y:y + inside.height]
+        return walls
+
+    def _entries(self, start: int, end: int) -> Tuple[slice, int]:
+        """
+        Finds the walkability grid entries along one axis that cover a run of pixels.
+
+        Args:
+            start (int): The first pixel.
+            end (int): The pixel after the last.
+
+        Returns:
+            tuple: The slice of entries, and how far into the first entry start is.
+        """
+        cell_size, wall_width = self.cell_size, self.wall_width
+        first = 2 * (start // cell_size) + (start % cell_size >= wall_width)
+        last = 2 * ((end - 1) // cell_size) + ((end - 1) % cell_size >= wall_width)
+        offset = start - (first // 2) * cell_size - (wall_width if first % 2 else 0)
+        return slice(first, last + 1), offset
+
+    def _sizes(self, entries: slice) -> np.ndarray:
+        """
+        Args:
+            entries (slice): A run of walkability grid entries along one axis.
+
+        Returns:
+            numpy.ndarray: The number of pixels each entry covers.
+        """
+        odd = np.arange(entries.start, entries.stop) % 2
+        return np.where(odd, self.cell_size - self.wall_width, self.wall_width)
+
+    def wall_map(self, cell_size: int = 8) -> WallMap:
+        """
+        Returns the walls of the whole maze as a WallMap, for collisions and path finding.
+
+        Args:
+            cell_size (int, optional): Width and height of each cell of the WallMap's grid. Defaults to 8.
+
+        Returns:
+            WallMap: The walls.
+        """
+        return WallMap(self.wall_pixels(), cell_size)
+
+    def render_chunk(self, area: pygame.Rect) -> pygame.Surface:
+        """
+        Draws part of the maze.
+
+        Args:
+            area (pygame.Rect): The part of the maze to draw, in pixels.
+
+        Returns:
+            pygame.Surface: The drawing, the size of area, as an 8-bit surface with the two colors as its palette.
+        """
+        # - One byte per pixel straight from the wall pixels, the palette turns them into colors - #
+        surface = pygame.Surface(area.size, depth=8)
+        surface.set_palette([self.floor_color, self.wall_color])
+        pygame.surfarray.blit_array(surface, self.wall_pixels(area).view(np.uint8))
+        return surface
+
+    def render(self, chunk_size: int = 512) -> pygame.Surface:
+        """
+        Draws the whole maze, a chunk at a time so the pixel arrays stay small.
+
+        Args:
+            chunk_size (int, optional): Width and height of each chunk in pixels. Defaults to 512.
+
+        Returns:
+            pygame.Surface: The background, width by height pixels, in the screen's format once there is a screen.
+        """
+        # - The chunks are copied as they are and the colors looked up once, in the final convert - #
+        surface = pygame.Surface((self.width, self.height), depth=8)
+        surface.set_palette([self.floor_color, self.wall_color])
+        for x in range(0, self.width, chunk_size):
+            for y in range(0, self.height, chunk_size):
+                area = pygame.Rect(x, y, chunk_size, chunk_size).clip(surface.get_rect())
+                surface.blit(self.render_chunk(area), area)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def is_open(self, cell: Cell, direction: int) -> bool:
+        """
+        Checks whether a cell opens to a neighbour.
+
+        Args:
+            cell (tuple): (column, row) of the cell.
+            direction (int): EAST or SOUTH.
+
+        Returns:
+            bool: True if there is no wall between the cell and the one to its right or below it.
+        """
+        column, row = cell
+        return bool(self.passages[column * self.rows + row] & direction)
+
+    def position_of(self, cell: Cell, size: Tuple[int, int] = (0, 0)) -> Tuple[int, int]:
+        """
+        Returns where to put something so it sits in the middle of a cell's floor.
+
+        Args:
+            cell (tuple): (column, row) of the cell.
+            size (tuple, optional): (width, height) of the thing in pixels. Defaults to a point.
+
+        Returns:
+            tuple: (x, y) of its top left corner in pixels.
+        """
+        middle = self.wall_width + (self.cell_size - self.wall_width) // 2
+        return (cell[0] * self.cell_size + middle - size[0] // 2,
+                cell[1] * self.cell_size + middle - size[1] // 2)
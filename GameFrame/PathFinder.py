@@ -0,0 +1,474 @@
+import heapq
+import numpy as np
+import pygame
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+Cell = Tuple[int, int]
+
+
+class PathFinder:
+    """
+    Finds routes through a grid of free and blocked cells, such as a WallMap's grid.
+
+    The grid is shrunk to the cells an object of a given size can stand on,
+    taking a cell to be where the top left of its hitbox is, so routes never
+    squeeze it through gaps narrower than itself. Cells are (column, row)
+    pairs and moves are up, down, left and right.
+
+    Two kinds of query are offered:
+
+    - Named goals, such as the exit, get a distance field: the number of
+      moves from every cell to the goal, worked out once with a breadth-first
+      search. After that the distance, the next move and the whole route
+      from anywhere are read straight off the field.
+    - Routes between any two cells are found with A*.
+
+    Routes are kept in a least recently used cache keyed by (start, goal), so
+    asking for the same route every frame costs one dictionary lookup.
+
+    Attributes:
+        columns (int): Number of columns in the grid.
+        rows (int): Number of rows in the grid.
+        cell_size (int): Width and height of each cell in pixels.
+        agent_size (tuple): (columns, rows) of cells the object covers from the cell it stands on.
+        max_paths (int): Maximum number of routes kept in the cache.
+        fields (dict): Maps each goal name to its distance field.
+        hits (int): Number of routes answered from the cache.
+        misses (int): Number of routes that had to be searched for.
+    """
+
+    def __init__(self, grid: np.ndarray, cell_size: int = 8, max_paths: int = 256,
+                 agent_size: Tuple[int, int] = (1, 1)):
+        """
+        Initializes the path finder over a grid.
+
+        Args:
+            grid (numpy.ndarray): True for each cell that can be stood on, indexed [column, row].
+            cell_size (int, optional): Width and height of each cell in pixels. Defaults to 8.
+            max_paths (int, optional): Maximum number of routes to cache. Defaults to 256.
+            agent_size (tuple, optional): (columns, rows) the object covers, used by add_goal_rect.
+                Defaults to (1, 1).
+        """
+        self.columns, self.rows = grid.shape
+        self.cell_size = cell_size
+        self.agent_size = agent_size
+        self.max_paths = max_paths
+        self.fields: Dict[str, array] = {}
+        self.hits = 0
+        self.misses = 0
+        self._paths = OrderedDict()
+        # - Cells are numbered column by column over the grid with a blocked border, - #
+        # - so neighbours are plain offsets and never need a bounds check - #
+        self._stride = self.rows + 2
+        self._open = np.pad(grid, 1).astype(np.uint8).tobytes()
+
+    @classmethod
+    def from_wall_map(cls, wall_map, width: int, height: int, max_paths: int = 256) -> 'PathFinder':
+        """
+        Builds a path finder for objects of a given size over a WallMap.
+
+        Args:
+            wall_map (WallMap): The walls.
+            width (int): Width in pixels of the object's hitbox.
+            height (int): Height in pixels of the object's hitbox.
+            max_paths (int, optional): Maximum number of routes to cache. Defaults to 256.
+
+        Returns:
+            PathFinder: The path finder.
+        """
+        agent_size = (-(-width // wall_map.cell_size), -(-height // wall_map.cell_size))
+        return cls(cls.standable(wall_map.grid, *agent_size), wall_map.cell_size, max_paths, agent_size)
+
+    @staticmethod
+    def standable(grid: np.ndarray, columns: int, rows: int) -> np.ndarray:
+        """
+        Finds the cells where a block of columns by rows cells, starting there, is all free.
+
+        Args:
+            grid (numpy.ndarray): True for each free cell, indexed [column, row].
+            columns (int): Width of the block in cells.
+            rows (int): Height of the block in cells.
+
+        Returns:
+            numpy.ndarray: True for each cell the block fits at, the same shape as grid.
+        """
+        # - Count the blocked cells under every block at once with a summed-area table - #
+        blocked = np.zeros((grid.shape[0] + 1, grid.shape[1] + 1), dtype=np.int32)
+        blocked[1:, 1:] = (~grid).cumsum(axis=0, dtype=np.int32).cumsum(axis=1)
+        counts = (blocked[columns:, rows:] - blocked[:-columns, rows:]
+                  - blocked[columns:, :-rows] + blocked[:-columns, :-rows])
+        fits = np.zeros(grid.shape, dtype=bool)
+        fits[:counts.shape[0], :counts.shape[1]] = counts == 0
+        return fits
+
+    def index_of(self, cell: Cell) -> int:
+        """
+        Returns the number of a cell, its position in distance fields.
+
+        Args:
+            cell (tuple): (column, row) of a cell.
+
+        Returns:
+            int: The cell's number, or 0 (always blocked) for cells outside the grid.
+        """
+        column, row = cell
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return (column + 1) * self._stride + row + 1
+        return 0
+
+    def cell_from_index(self, index: int) -> Cell:
+        """
+        Returns the cell with a number given by index_of.
+
+        Args:
+            index (int): A cell's number.
+
+        Returns:
+            tuple: (column, row) of the cell.
+        """
+        column, row = divmod(index, self._stride)
+        return column - 1, row - 1
+
+    def cell_at(self, x: float, y: float) -> Cell:
+        """
+        Returns the cell holding a point.
+
+        Args:
+            x (float): X-coordinate in pixels.
+            y (float): Y-coordinate in pixels.
+
+        Returns:
+            tuple: (column, row) of the cell.
+        """
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def position_of(self, cell: Cell) -> Tuple[int, int]:
+        """
+        Returns the top left corner of a cell in pixels.
+
+        Args:
+            cell (tuple): (column, row) of the cell.
+
+        Returns:
+            tuple: (x, y) in pixels.
+        """
+        return cell[0] * self.cell_size, cell[1] * self.cell_size
+
+    def is_open(self, cell: Cell) -> bool:
+        """
+        Args:
+            cell (tuple): (column, row) of a cell.
+
+        Returns:
+            bool: True if the cell can be stood on.
+        """
+        return self._open[self.index_of(cell)] == 1
+
+    def nearest_open(self, cell: Cell, reach: int = 2) -> Optional[Cell]:
+        """
+        Returns the cell itself if it can be stood on, otherwise the closest one that can nearby.
+
+        An object pressed up against a wall can be on a cell the grid counts
+        as blocked, because a cell is blocked by any wall pixel inside it.
+
+        Args:
+            cell (tuple): (column, row) of the cell.
+            reach (int, optional): How many cells away to look. Defaults to 2.
+
+        Returns:
+            tuple: (column, row) of an open cell, or None if there is none within reach.
+        """
+        column, row = cell
+        for distance in range(reach + 1):
+            for d_column in range(-distance, distance + 1):
+                for d_row in range(-distance, distance + 1):
+                    if max(abs(d_column), abs(d_row)) == distance:
+                        near = (column + d_column, row + d_row)
+                        if self.is_open(near):
+                            return near
+        return None
+
+    def add_goal(self, name: str, cells: List[Cell]) -> array:
+        """
+        Works out the distance field to a goal, replacing any goal with the same name.
+
+        Args:
+            name (str): Name to ask for routes to the goal by.
+            cells (list): The cells that count as reaching the goal.
+
+        Returns:
+            array: The goal's distance field, see distances_from.
+        """
+        self.fields[name] = self.distances_from(cells)
+        self._forget_paths(name)
+        return self.fields[name]
+
+    def distances_from(self, cells: List[Cell]) -> array:
+        """
+        Counts the moves from every cell to the nearest of some cells, with a breadth-first search.
+
+        Only reads the grid, so it can run on another thread.
+
+        Args:
+            cells (list): The cells to measure from.
+
+        Returns:
+            array: Moves to the nearest of cells, -1 where none can be reached, by cell number (see index_of).
+        """
+        for distances, reached in self.distance_rings(cells):
+            pass
+        return distances
+
+    def distance_rings(self, cells: List[Cell]) -> Iterator[Tuple[array, int]]:
+        """
+        Runs the search of distances_from one ring of cells at a time, so it can be spread over several frames.
+
+        Args:
+            cells (list): The cells to measure from.
+
+        Yields:
+            tuple: The distances so far, and the number of cells the last ring reached.
+                The distances are complete once the iterator is exhausted.
+        """
+        stride = self._stride
+        unvisited = bytearray(self._open)
+        distances = array('i', [-1]) * len(unvisited)
+        frontier = []
+        for cell in cells:
+            index = self.index_of(cell)
+            if unvisited[index]:
+                unvisited[index] = 0
+                distances[index] = 0
+                frontier.append(index)
+        yield distances, len(frontier)
+        # - Breadth first, one ring of equal distance at a time, with the - #
+        # - neighbours written out since this loop visits every open cell - #
+        distance = 0
+        while frontier:
+            distance += 1
+            ring = []
+            append = ring.append
+            for index in frontier:
+                near = index - 1
+                if unvisited[near]:
+                    unvisited[near] = 0
+                    append(near)
+                near = index + 1
+                if unvisited[near]:
+                    unvisited[near] = 0
+                    append(near)
+                near = index - stride
+                if unvisited[near]:
+                    unvisited[near] = 0
+                    append(near)
+                near = index + stride
+                if unvisited[near]:
+                    unvisited[near] = 0
+                    append(near)
+            for index in ring:
+                distances[index] = distance
+            frontier = ring
+            yield distances, len(ring)
+
+    def add_goal_rect(self, name: str, rect: pygame.Rect) -> array:
+        """
+        Adds a goal reached by standing anywhere the object would overlap an area, such as another object's rect.
+
+        Args:
+            name (str): Name to ask for routes to the goal by.
+            rect (pygame.Rect): The area in pixels.
+
+        Returns:
+            array: The goal's distance field, see add_goal.
+        """
+        return self.add_goal(name, self.cells_overlapping(rect))
+
+    def cells_overlapping(self, rect: pygame.Rect) -> List[Cell]:
+        """
+        Returns the cells where an object standing there would overlap an area.
+
+        Args:
+            rect (pygame.Rect): The area in pixels.
+
+        Returns:
+            list: (column, row) of each cell, including ones that cannot be stood on.
+        """
+        size = self.cell_size
+        columns, rows = self.agent_size
+        return [(column, row)
+                for column in range(rect.left // size - columns + 1, (rect.right - 1) // size + 1)
+                for row in range(rect.top // size - rows + 1, (rect.bottom - 1) // size + 1)]
+
+    def remove_goal(self, name: str):
+        """
+        Forgets a goal and the routes to it.
+
+        Args:
+            name (str): The goal's name.
+        """
+        self.fields.pop(name, None)
+        self._forget_paths(name)
+
+    def _forget_paths(self, goal: Union[str, Cell]):
+        """
+        Drops the cached routes to a goal.
+
+        Args:
+            goal: A goal name or cell.
+        """
+        for key in [key for key in self._paths if key[1] == goal]:
+            del self._paths[key]
+
+    def distance(self, start: Cell, goal: str) -> int:
+        """
+        Returns the number of moves from a cell to a named goal.
+
+        Args:
+            start (tuple): (column, row) to start from.
+            goal (str): Name of the goal.
+
+        Returns:
+            int: The number of moves, or -1 if the goal cannot be reached.
+        """
+        return self.fields[goal][self.index_of(start)]
+
+    def next_cell(self, start: Cell, goal: str) -> Optional[Cell]:
+        """
+        Returns the cell to move to next on the way to a named goal.
+
+        Args:
+            start (tuple): (column, row) to start from.
+            goal (str): Name of the goal.
+
+        Returns:
+            tuple: The next cell, start itself at the goal, or None if the goal cannot be reached.
+        """
+        distances = self.fields[goal]
+        index = self.index_of(start)
+        distance = distances[index]
+        if distance < 0:
+            return None
+        if distance == 0:
+            return start
+        stride = self._stride
+        for near in (index - 1, index + 1, index - stride, index + stride):
+            if distances[near] == distance - 1:
+                return self.cell_from_index(near)
+        return None
+
+    def path(self, start: Cell, goal: Union[str, Cell]) -> Optional[List[Cell]]:
+        """
+        Returns the shortest route from a cell to a named goal or another cell.
+
+        Args:
+            start (tuple): (column, row) to start from.
+            goal: Name of a goal added with add_goal, or the (column, row) of a cell.
+
+        Returns:
+            list: The cells of the route, from start to goal, or None if it cannot be reached.
+                Shared with the cache, so do not modify it.
+        """
+        key = (start, goal)
+        paths = self._paths
+        if key in paths:
+            self.hits += 1
+            paths.move_to_end(key)
+            return paths[key]
+        self.misses += 1
+        if isinstance(goal, str):
+            route = self._descend(start, self.fields[goal])
+        else:
+            route = self._search(start, goal)
+        paths[key] = route
+        if len(paths) > self.max_paths:
+            paths.popitem(last=False)
+        return route
+
+    def _descend(self, start: Cell, distances: array) -> Optional[List[Cell]]:
+        """
+        Follows a distance field downhill from a cell to its goal.
+
+        Args:
+            start (tuple): (column, row) to start from.
+            distances (array): The goal's distance field.
+
+        Returns:
+            list: The cells of the route, or None if the goal cannot be reached.
+        """
+        index = self.index_of(start)
+        distance = distances[index]
+        if distance < 0:
+            return None
+        stride = self._stride
+        route = [index]
+        while distance > 0:
+            distance -= 1
+            for near in (index - 1, index + 1, index - stride, index + stride):
+                if distances[near] == distance:
+                    index = near
+                    break
+            route.append(index)
+        return [self.cell_from_index(index) for index in route]
+
+    def _search(self, start: Cell, goal: Cell) -> Optional[List[Cell]]:
+        """
+        Finds the shortest route between two cells with A*, guided by the Manhattan distance.
+
+        Args:
+            start (tuple): (column, row) to start from.
+            goal (tuple): (column, row) to reach.
+
+        Returns:
+            list: The cells of the route, or None if the goal cannot be reached.
+        """
+        open_cells = self._open
+        stride = self._stride
+        start_index = self.index_of(start)
+        goal_index = self.index_of(goal)
+        if not (open_cells[start_index] and open_cells[goal_index]):
+            return None
+        goal_column, goal_row = divmod(goal_index, stride)
+        came_from = {start_index: -1}
+        cost = {start_index: 0}
+        # - Ties on the estimate go to the cell furthest along, so on open - #
+        # - ground the search heads for the goal instead of filling the area - #
+        heap = [(0, 0, start_index)]
+        while heap:
+            estimate, depth, index = heapq.heappop(heap)
+            moves = -depth
+            if index == goal_index:
+                route = []
+                while index != -1:
+                    route.append(self.cell_from_index(index))
+                    index = came_from[index]
+                route.reverse()
+                return route
+            if moves > cost[index]:
+                continue
+            moves += 1
+            for near in (index - 1, index + 1, index - stride, index + stride):
+                if open_cells[near] and moves < cost.get(near, moves + 1):
+                    cost[near] = moves
+                    came_from[near] = index
+                    column, row = divmod(near, stride)
+                    heapq.heappush(heap, (moves + abs(column - goal_column) + abs(row - goal_row), -moves, near))
+        return None
+
+    def stats(self) -> dict:
+        """
+        Returns how well the route cache is doing.
+
+        Returns:
+            dict: Cached routes, hits, misses, hit rate and number of goals.
+        """
+        requests = self.hits + self.misses
+        return {
+            'paths': len(self._paths),
+            'max_paths': self.max_paths,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'goals': len(self.fields),
+        }
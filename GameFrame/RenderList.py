@@ -0,0 +1,123 @@
+from bisect import insort
+from itertools import chain
+from typing import Dict, List
+
+
+class RenderList:
+    """
+    Keeps RoomObjects in drawing order, in one bucket per depth.
+
+    Lower depths are drawn first. Within a depth the most recently added
+    object is drawn first, so it ends up underneath the objects added before
+    it. Adding, removing and changing the depth of an object only touches its
+    own bucket, plus a binary search of the depths when a depth gains its
+    first object or loses its last, so filling a room with thousands of
+    objects costs no more per object than adding the first.
+
+    The flat drawing order is rebuilt at most once between changes, when it
+    is next asked for.
+
+    Attributes:
+        depths (list): The depths that hold objects, lowest first.
+        buckets (dict): Maps each depth to its objects, as dictionary keys in the order they were added.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty RenderList.
+        """
+        self.depths: List[int] = []
+        self.buckets: Dict[int, Dict] = {}
+        self._depth_of: Dict[object, int] = {}
+        self._ordered: List = []
+        self._changed = False
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of objects in the list.
+        """
+        return len(self._depth_of)
+
+    def __contains__(self, obj) -> bool:
+        """
+        Args:
+            obj (RoomObject): The object to look for.
+
+        Returns:
+            bool: True if the object is in the list.
+        """
+        return obj in self._depth_of
+
+    def __iter__(self):
+        """
+        Returns:
+            iterator: The objects in drawing order.
+        """
+        return iter(self.ordered())
+
+    def add(self, obj):
+        """
+        Adds an object at its depth, to be drawn before the other objects at that depth.
+
+        Objects already in the list are ignored.
+
+        Args:
+            obj (RoomObject): The object to add.
+        """
+        if obj in self._depth_of:
+            return
+        depth = obj.depth
+        bucket = self.buckets.get(depth)
+        if bucket is None:
+            bucket = self.buckets[depth] = {}
+            insort(self.depths, depth)
+        bucket[obj] = None
+        self._depth_of[obj] = depth
+        self._changed = True
+
+    def remove(self, obj):
+        """
+        Removes an object. Objects not in the list are ignored.
+
+        Args:
+            obj (RoomObject): The object to remove.
+        """
+        depth = self._depth_of.pop(obj, None)
+        if depth is None:
+            return
+        bucket = self.buckets[depth]
+        del bucket[obj]
+        if not bucket:
+            del self.buckets[depth]
+            self.depths.remove(depth)
+        self._changed = True
+
+    def update_depth(self, obj):
+        """
+        Moves an object to the bucket for its current depth.
+
+        The object is drawn as if it had just been added at that depth. Does
+        nothing if its depth has not changed or it is not in the list.
+
+        Args:
+            obj (RoomObject): The object whose depth was changed.
+        """
+        depth = self._depth_of.get(obj)
+        if depth is None or depth == obj.depth:
+            return
+        self.remove(obj)
+        self.add(obj)
+
+    def ordered(self) -> list:
+        """
+        Returns every object in drawing order.
+
+        Returns:
+            list: The objects, lowest depth first. Do not modify it, it is reused until the list changes.
+        """
+        if self._changed:
+            buckets = self.buckets
+            self._ordered = list(chain.from_iterable(reversed(buckets[depth]) for depth in self.depths))
+            self._changed = False
+        return self._ordered
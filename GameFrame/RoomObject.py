@@ -2,6 +2,7 @@ import os
 import math
 import pygame
 from GameFrame import Level
+from GameFrame.AssetCache import AssetCache
 from typing import List, Tuple, Callable
 
 
@@ -33,8 +34,15 @@ class RoomObject:
         angle (int): Current angle for movement or rotation.
         collision_object_types (set): Set of object type names to check collisions against.
         collision_objects (list): List of objects to check for collisions.
+        tags (set): Labels the room indexes this object under, see Level.objects_with_tag.
+        key_subscriptions (set): Keys this object wants key_pressed, key_down and key_up for.
+        hitbox (pygame.Rect): The part of the image stopped by walls, relative to (x, y), None for all of it.
+        fixed (bool): Drawn at (x, y) on the screen wherever the room's camera is, for scores and other overlays.
     """
 
+    # - Set by Level.enable_entity_store when the motion state lives in an EntityStore - #
+    _entity_store = None
+
     def __init__(self, room: Level, x: int, y: int):
         """
         Initializes a RoomObject with position and default properties.
@@ -65,6 +73,10 @@ class RoomObject:
 
         self.collision_object_types = set()
         self.collision_objects = []
+        self.tags = set()
+        self.key_subscriptions = set()
+        self.hitbox = None
+        self.fixed = False
 
     @staticmethod
     def load_image(file_name: str) -> str:
@@ -83,17 +95,22 @@ class RoomObject:
         """
         Loads and sets the object's image, scaling to the given width and height.
 
+        Images come from the shared AssetCache, so calling this every frame is
+        cheap. The surface is shared with other objects using the same image
+        and size, so copy it before drawing on it.
+
         Args:
             image (str): Path to the image file.
             width (int): Width to scale the image to.
             height (int): Height to scale the image to.
         """
-        self.image_orig = pygame.image.load(image).convert_alpha()
-        self.image_orig = pygame.transform.scale(self.image_orig, (width, height))
+        self.image_orig = AssetCache.shared().get_image(image, width, height)
         self.width = width
         self.height = height
-        self.image = self.image_orig.copy()
+        self.image = self.image_orig
         self.rect = pygame.Rect(self.x, self.y, width, height)
+        if self.room.spatial_hash is not None:
+            self.room.spatial_hash.move(self)
 
     def register_collision_object(self, collision_object: str):
         """
@@ -103,6 +120,67 @@ class RoomObject:
             collision_object (str): The class name of the object type to check collisions with.
         """
         self.collision_object_types.add(collision_object)
+        self.room.collision_type_registered(self, collision_object)
+
+    def add_tag(self, tag: str):
+        """
+        Labels this object with a tag, so it can be found with Level.objects_with_tag.
+
+        Args:
+            tag (str): The tag to add.
+        """
+        self.tags.add(tag)
+        self.room.tag_object(self, tag)
+
+    def remove_tag(self, tag: str):
+        """
+        Removes a tag from this object.
+
+        Args:
+            tag (str): The tag to remove.
+        """
+        self.tags.discard(tag)
+        self.room.untag_object(self, tag)
+
+    def set_depth(self, depth: int):
+        """
+        Changes this object's drawing order depth while it is in the room.
+
+        Lower depths are drawn first. The object is drawn before the other
+        objects already at the new depth.
+
+        Args:
+            depth (int): The new depth.
+        """
+        self.depth = depth
+        self.room.depth_changed(self)
+
+    def subscribe_key(self, *keys: int):
+        """
+        Asks for key events for particular keys only.
+
+        Once subscribed, key_pressed is called only in frames where one of the
+        subscribed keys is held, and key_down and key_up only for those keys.
+        Objects that do not subscribe keep getting key_pressed every frame.
+
+        Args:
+            *keys (int): pygame key constants, such as pygame.K_SPACE.
+        """
+        self.handle_key_events = True
+        for key in keys:
+            self.key_subscriptions.add(key)
+            self.room.key_subscribed(self, key)
+
+    def unsubscribe_key(self, *keys: int):
+        """
+        Stops key events for particular keys.
+
+        Args:
+            *keys (int): pygame key constants.
+        """
+        for key in keys:
+            self.key_subscriptions.discard(key)
+            self.room.key_unsubscribed(self, key)
 
     def update(self):
         """
@@ -113,6 +191,8 @@ class RoomObject:
         self.y += self.y_speed
         self.rect.x = self.x
         self.rect.y = self.y
+        if self.room.spatial_hash is not None:
+            self.room.spatial_hash.move(self)
 
     def delete_object(self, obj: 'RoomObject'):
         """
@@ -151,9 +231,24 @@ class RoomObject:
     def check_collisions(self):
         """
         Checks for collisions with registered collision objects and handles them.
-        """
+
+        When the room has a spatial hash, only objects in neighbouring cells are tested.
+        Objects deleted earlier in the frame are skipped.
+        """
+        spatial_hash = self.room.spatial_hash
+        if spatial_hash is not None:
+            if not self.collision_object_types:
+                return
+            for item in spatial_hash.query(self.rect):
+                if item is not self and self.rect.colliderect(item.rect):
+                    item_type = type(item).__name__
+                    if item_type in self.collision_object_types and not self.room.is_deleted(item):
+                        self.handle_collision(item, item_type)
+            return
         for item in self.collision_objects:
             if self.rect.colliderect(item.rect):
+                if self.room.is_deleted(item):
+                    continue
                 item_type = type(item).__name__
                 self.handle_collision(item, item_type)
 
@@ -172,13 +267,109 @@ class RoomObject:
         """
         check_rect = obj.rect.move(x, y)
         collision_found = False
-        for item in self.collision_objects:
-            if check_rect.colliderect(item.rect):
-                if type(item).__name__ == collision_type:
+        if collision_type not in self.collision_object_types:
+            return collision_found
+        spatial_hash = self.room.spatial_hash
+        if spatial_hash is not None:
+            candidates = spatial_hash.query(check_rect)
+        else:
+            candidates = self.room.objects_of_type(collision_type)
+        for item in candidates:
+            if item is not obj and type(item).__name__ == collision_type:
+                if check_rect.colliderect(item.rect) and not self.room.is_deleted(item):
                     collision_found = True
                     break
         return collision_found
 
+    def hitbox_at(self, x: float, y: float) -> pygame.Rect:
+        """
+        Returns the area of the room the object's hitbox would cover at a position.
+
+        Args:
+            x (float): X-coordinate of the object.
+            y (float): Y-coordinate of the object.
+
+        Returns:
+            pygame.Rect: The hitbox in room coordinates.
+        """
+        if self.hitbox is None:
+            return pygame.Rect(x, y, self.width, self.height)
+        return self.hitbox.move(x, y)
+
+    def hits_wall_at(self, x: float, y: float) -> bool:
+        """
+        Checks, to the pixel, whether the object's hitbox would touch a wall at a position.
+
+        Args:
+            x (float): X-coordinate to test.
+            y (float): Y-coordinate to test.
+
+        Returns:
+            bool: True if a wall is in the way, always False in a room without a wall map.
+        """
+        wall_map = self.room.wall_map
+        if wall_map is None:
+            return False
+        return wall_map.hits(self.hitbox_at(x, y))
+
+    def move_within_walls(self, x_step: int, y_step: int) -> bool:
+        """
+        Moves the object by a step, or as far along it as it can go before touching a wall.
+
+        Args:
+            x_step (int): Pixels to move along x.
+            y_step (int): Pixels to move along y.
+
+        Returns:
+            bool: True if the whole step was made.
+        """
+        steps = max(abs(x_step), abs(y_step))
+        for taken in range(steps, 0, -1):
+            x = self.x + x_step * taken // steps
+            y = self.y + y_step * taken // steps
+            if not self.hits_wall_at(x, y):
+                self.x = x
+                self.y = y
+                return taken == steps
+        return steps == 0
+
+    def follow_flow_field(self, flow_field, speed: int) -> bool:
+        """
+        Points the object along a FlowField towards its target, using set_direction.
+
+        Reading the direction costs the same however many objects follow the
+        field. When a wall is in the way the object lines up with its cell
+        first, where its hitbox fits the way ahead, so it never moves into a
+        wall. The object stops once it reaches the target or if there is no
+        way to it.
+
+        Args:
+            flow_field (FlowField): The field to follow, see Level.add_flow_field.
+            speed (int): The speed to move at.
+
+        Returns:
+            bool: True if the object is moving towards the target.
+        """
+        hitbox = self.hitbox_at(self.x, self.y)
+        cell = flow_field.cell_at(hitbox.x, hitbox.y)
+        angle = None if cell is None else flow_field.direction_from(cell)
+        if angle is None:
+            self.x_speed = 0
+            self.y_speed = 0
+            return False
+        self.set_direction(angle, speed)
+        corner_x, corner_y = flow_field.path_finder.position_of(cell)
+        align_x = max(-speed, min(speed, corner_x - hitbox.x))
+        align_y = max(-speed, min(speed, corner_y - hitbox.y))
+        for x_speed, y_speed in ((self.x_speed, self.y_speed), (align_x, align_y), (align_x, 0), (0, align_y)):
+            if not self.hits_wall_at(self.x + x_speed, self.y + y_speed):
+                self.x_speed = x_speed
+                self.y_speed = y_speed
+                return True
+        self.x_speed = 0
+        self.y_speed = 0
+        return False
+
     def handle_collision(self, other, other_type):
         """
         Handles a collision with another object.
@@ -200,6 +391,36 @@ class RoomObject:
         """
         pass
 
+    def key_down(self, key: int):
+        """
+        Handles a key being pressed, once per press.
+        Override in subclasses to react to key presses rather than held keys.
+
+        Args:
+            key (int): The pygame key constant of the pressed key.
+        """
+        pass
+
+    def key_up(self, key: int):
+        """
+        Handles a key being released, once per release.
+        Override in subclasses to react to key releases.
+
+        Args:
+            key (int): The pygame key constant of the released key.
+        """
+        pass
+
+    def text_input(self, text: str):
+        """
+        Handles typed text, from pygame TEXTINPUT events.
+        Override in subclasses that take text entry.
+
+        Args:
+            text (str): The characters typed.
+        """
+        pass
+
     def joy_pad_signal(self, p1_buttons: List[int], p2_buttons: List[int]):
         """
         Handles joystick/gamepad input.
@@ -263,15 +484,21 @@ class RoomObject:
         self.x_speed = 0
         self.y_speed = 0
 
-    def set_timer(self, ticks: int, function_call: Callable):
+    def set_timer(self, ticks: int, function_call: Callable, repeat: bool = False):
         """
         Sets a timed event to call a function after a number of ticks.
 
+        Timers bound to this object are cancelled when it is deleted.
+
         Args:
             ticks (int): Number of frames to wait before calling the function.
             function_call (Callable): The function to call.
+            repeat (bool, optional): Call the function every ticks frames until cancelled. Defaults to False.
+
+        Returns:
+            TimerHandle: A handle whose cancel() method stops the timer.
         """
-        self.room.set_timer(ticks, function_call)
+        return self.room.set_timer(ticks, function_call, repeat)
 
     def set_direction(self, angle: int, speed: int):
         """
@@ -397,6 +624,8 @@ class RoomObject:
 
         self.rect.x = self.x
         self.rect.y = self.y
+        if self.room.spatial_hash is not None:
+            self.room.spatial_hash.move(self)
 
     def rotate_to_coordinate(self, mouse_x: int, mouse_y: int):
         """
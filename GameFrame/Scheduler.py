@@ -0,0 +1,190 @@
+import heapq
+import itertools
+from typing import Callable
+
+
+class TimerHandle:
+    """
+    A handle to a timer set with a Scheduler, used to cancel it.
+
+    Attributes:
+        due (int): The frame number the timer will next fire on.
+        interval (int): The number of frames between firings of a repeating timer.
+        function_call (Callable): The function the timer calls.
+        owner: The object the function is bound to, or None for plain functions.
+        repeat (bool): Whether the timer is set again each time it fires.
+        active (bool): False once the timer has fired for the last time or been cancelled.
+    """
+
+    __slots__ = ('_scheduler', 'due', 'interval', 'function_call', 'owner', 'repeat', 'active')
+
+    def __init__(self, scheduler: 'Scheduler', due: int, interval: int,
+                 function_call: Callable, repeat: bool):
+        """
+        Initializes a TimerHandle. Handles are created by Scheduler.schedule.
+
+        Args:
+            scheduler (Scheduler): The scheduler that owns the timer.
+            due (int): The frame number the timer first fires on.
+            interval (int): The number of frames between firings.
+            function_call (Callable): The function to call.
+            repeat (bool): Whether the timer repeats.
+        """
+        self._scheduler = scheduler
+        self.due = due
+        self.interval = interval
+        self.function_call = function_call
+        self.owner = getattr(function_call, '__self__', None)
+        self.repeat = repeat
+        self.active = True
+
+    def cancel(self):
+        """
+        Stops the timer from firing again. Cancelling twice does nothing.
+        """
+        self._scheduler.cancel(self)
+
+
+class Scheduler:
+    """
+    Fires timed function calls after a number of frames.
+
+    Timers are kept in a min-heap ordered by the absolute frame they are due,
+    then most recently set first, so setting a timer costs O(log n) and a frame with nothing due costs O(1).
+    Timers are also indexed by the object their function is bound to, so all
+    of an object's timers can be dropped when it is deleted without scanning
+    every timer. Cancelled timers are skipped when they reach the top of the
+    heap, and the heap is compacted when they make up most of it.
+
+    Attributes:
+        frame (int): The number of frames processed so far.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty Scheduler.
+        """
+        self.frame = 0
+        self._heap = []
+        self._sequence = itertools.count()
+        self._by_owner = {}
+        self._cancelled = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of timers still waiting to fire.
+        """
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, ticks: int, function_call: Callable, repeat: bool = False) -> TimerHandle:
+        """
+        Sets a timer to call a function after a number of frames.
+
+        Args:
+            ticks (int): Number of frames to wait before calling the function.
+            function_call (Callable): The function to call.
+            repeat (bool, optional): Call the function every ticks frames until cancelled. Defaults to False.
+
+        Returns:
+            TimerHandle: A handle that can cancel the timer.
+        """
+        interval = max(ticks, 1)
+        handle = TimerHandle(self, self.frame + interval, interval, function_call, repeat)
+        heapq.heappush(self._heap, (handle.due, -next(self._sequence), handle))
+        if handle.owner is not None:
+            owned = self._by_owner.get(id(handle.owner))
+            if owned is None:
+                owned = self._by_owner[id(handle.owner)] = {}
+            owned[handle] = None
+        return handle
+
+    def cancel(self, handle: TimerHandle):
+        """
+        Stops a timer from firing again.
+
+        Args:
+            handle (TimerHandle): The timer to cancel.
+        """
+        if not handle.active:
+            return
+        handle.active = False
+        self._cancelled += 1
+        self._forget_owner(handle)
+        self._compact()
+
+    def cancel_owner(self, owner):
+        """
+        Cancels every timer whose function is bound to the given object.
+
+        Args:
+            owner: The object whose timers should be cancelled.
+        """
+        owned = self._by_owner.pop(id(owner), None)
+        if owned is None:
+            return
+        for handle in owned:
+            if handle.active:
+                handle.active = False
+                self._cancelled += 1
+        self._compact()
+
+    def tick(self):
+        """
+        Advances one frame and calls every timer that is now due.
+
+        Timers due on the same frame fire most recently set first, the order
+        Level has always used. A repeating timer counts as set again each time
+        it fires.
+        """
+        self.frame += 1
+        heap = self._heap
+        while heap and heap[0][0] <= self.frame:
+            handle = heapq.heappop(heap)[2]
+            if not handle.active:
+                self._cancelled -= 1
+                continue
+            if handle.repeat:
+                handle.due = self.frame + handle.interval
+                heapq.heappush(heap, (handle.due, -next(self._sequence), handle))
+            else:
+                handle.active = False
+                self._forget_owner(handle)
+            handle.function_call()
+
+    def clear(self):
+        """
+        Cancels every timer.
+        """
+        for entry in self._heap:
+            entry[2].active = False
+        self._heap.clear()
+        self._by_owner.clear()
+        self._cancelled = 0
+
+    def _forget_owner(self, handle: TimerHandle):
+        """
+        Removes a timer from its owner's index.
+
+        Args:
+            handle (TimerHandle): The timer to remove.
+        """
+        if handle.owner is None:
+            return
+        owned = self._by_owner.get(id(handle.owner))
+        if owned is not None:
+            owned.pop(handle, None)
+            if not owned:
+                del self._by_owner[id(handle.owner)]
+
+    def _compact(self):
+        """
+        Rebuilds the heap without cancelled timers once they make up most of it.
+
+        The heap is rebuilt in place, as tick may be working through it when a
+        timer's function cancels other timers.
+        """
+        heap = self._heap
+        if self._cancelled > 64 and self._cancelled * 2 > len(heap):
+            heap[:] = [entry for entry in heap if entry[2].active]
+            heapq.heapify(heap)
+            self._cancelled = 0
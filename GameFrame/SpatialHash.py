@@ -0,0 +1,137 @@
+import pygame
+from typing import Dict, List, Tuple
+
+
+class SpatialHash:
+    """
+    A uniform grid that buckets RoomObjects by the cells their rect covers.
+
+    Used by a Level as an optional broad phase for collision checks, so that an
+    object only tests against objects in the cells it overlaps rather than
+    against every object it has registered for.
+
+    Attributes:
+        cell_size (int): The width and height of each grid cell in pixels.
+        cells (dict): Maps a (column, row) cell to the objects in that cell.
+        bounds (dict): Maps each tracked object to the cell range it currently covers.
+    """
+
+    def __init__(self, cell_size: int = 128):
+        """
+        Initializes an empty SpatialHash.
+
+        Args:
+            cell_size (int, optional): Width and height of each cell in pixels. Defaults to 128.
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Dict] = {}
+        self.bounds: Dict[object, Tuple[int, int, int, int]] = {}
+
+    def _cell_range(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        """
+        Returns the first and last column and row covered by a rect.
+
+        Args:
+            rect (pygame.Rect): The rect to look up.
+
+        Returns:
+            tuple: (first column, first row, last column, last row).
+        """
+        size = self.cell_size
+        return (int(rect.left // size), int(rect.top // size),
+                int((rect.right - 1) // size), int((rect.bottom - 1) // size))
+
+    def insert(self, obj):
+        """
+        Adds an object to every cell its rect covers.
+
+        Objects without a rect yet (no image set) are tracked but not filed
+        under any cell until they move.
+
+        Args:
+            obj (RoomObject): The object to add.
+        """
+        if not isinstance(obj.rect, pygame.Rect):
+            self.bounds[obj] = None
+            return
+        cell_range = self._cell_range(obj.rect)
+        self.bounds[obj] = cell_range
+        x1, y1, x2, y2 = cell_range
+        cells = self.cells
+        for col in range(x1, x2 + 1):
+            for row in range(y1, y2 + 1):
+                bucket = cells.get((col, row))
+                if bucket is None:
+                    bucket = cells[(col, row)] = {}
+                bucket[obj] = None
+
+    def remove(self, obj):
+        """
+        Removes an object from every cell it was filed under.
+
+        Args:
+            obj (RoomObject): The object to remove.
+        """
+        cell_range = self.bounds.pop(obj, None)
+        if cell_range is None:
+            return
+        x1, y1, x2, y2 = cell_range
+        cells = self.cells
+        for col in range(x1, x2 + 1):
+            for row in range(y1, y2 + 1):
+                bucket = cells.get((col, row))
+                if bucket is not None:
+                    bucket.pop(obj, None)
+                    if not bucket:
+                        del cells[(col, row)]
+
+    def move(self, obj):
+        """
+        Refiles an object after its rect has changed.
+
+        Does nothing when the object is still inside the same cells, which is
+        the common case for objects moving a few pixels per frame, or when the
+        object has not been added to the grid.
+
+        Args:
+            obj (RoomObject): The object that moved.
+        """
+        if obj not in self.bounds or not isinstance(obj.rect, pygame.Rect):
+            return
+        if self.bounds[obj] == self._cell_range(obj.rect):
+            return
+        self.remove(obj)
+        self.insert(obj)
+
+    def query(self, rect: pygame.Rect) -> List:
+        """
+        Returns the objects filed in any cell the given rect covers.
+
+        The result is a broad phase only: callers still need to test the rects
+        themselves. Each object appears once, in the order it was filed.
+
+        Args:
+            rect (pygame.Rect): The area to search.
+
+        Returns:
+            List: Candidate objects near the rect.
+        """
+        x1, y1, x2, y2 = self._cell_range(rect)
+        cells = self.cells
+        if x1 == x2 and y1 == y2:
+            bucket = cells.get((x1, y1))
+            return list(bucket) if bucket else []
+        found = {}
+        for col in range(x1, x2 + 1):
+            for row in range(y1, y2 + 1):
+                bucket = cells.get((col, row))
+                if bucket:
+                    found.update(bucket)
+        return list(found)
+
+    def clear(self):
+        """
+        Removes every object from the grid.
+        """
+        self.cells.clear()
+        self.bounds.clear()
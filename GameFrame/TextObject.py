@@ -1,5 +1,7 @@
 import pygame
 from GameFrame import RoomObject, Level
+from GameFrame.FontCache import FontCache
+from GameFrame.GlyphAtlas import GlyphAtlas
 
 
 class TextObject(RoomObject):
@@ -18,10 +20,11 @@ class TextObject(RoomObject):
         font (str): Font name.
         colour (tuple): RGB color of the text.
         bold (bool): Whether the font is bold.
+        atlas (bool): Whether text is drawn from a GlyphAtlas rather than rendered with the font.
     """
 
     def __init__(self, room: Level, x: int, y: int, text='Not Set', size=60,
-                 font='Comic Sans MS', colour=(0, 0, 0), bold=False):
+                 font='Comic Sans MS', colour=(0, 0, 0), bold=False, atlas=False):
         """
         Initializes a TextObject with the given properties.
 
@@ -34,6 +37,8 @@ class TextObject(RoomObject):
             font (str, optional): Font name. Defaults to 'Comic Sans MS'.
             colour (tuple, optional): RGB color of the text. Defaults to (0, 0, 0).
             bold (bool, optional): Whether the font is bold. Defaults to False.
+            atlas (bool, optional): Draw text from a GlyphAtlas, for text that changes often
+                such as scores and timers. Defaults to False.
         """
         RoomObject.__init__(self, room, x, y)
 
@@ -45,14 +50,32 @@ class TextObject(RoomObject):
         self.font = font
         self.colour = colour
         self.bold = bold
+        self.atlas = atlas
+        self._drawn = None
         self.update_text()
 
     def update_text(self):
         """
         Updates the rendered text surface and its rectangle based on current properties.
+
+        Fonts and rendered text come from the shared FontCache. In atlas mode
+        the text is composed from cached glyphs instead, and nothing is done
+        when the text and style have not changed since it was last drawn.
         """
-        self.built_font = pygame.font.SysFont(self.font, self.size, self.bold)
-        self.rendered_text = self.built_font.render(self.text, False, self.colour)
+        font_cache = FontCache.shared()
+        if self.atlas:
+            drawn = (self.text, self.font, self.size, self.bold, tuple(self.colour))
+            if drawn == self._drawn:
+                return
+            self._drawn = drawn
+            self.built_font = font_cache.get_font(self.font, self.size, self.bold)
+            atlas = GlyphAtlas.get(self.font, self.size, self.bold, self.colour)
+            self.rendered_text = atlas.render(str(self.text) if self.text is not None else '')
+        else:
+            self.built_font = font_cache.get_font(self.font, self.size, self.bold)
+            self.rendered_text = font_cache.render(self.text, self.font, self.size, self.bold, self.colour)
         self.image = self.rendered_text
-        self.width, self.height = self.built_font.size(self.text)
+        self.width, self.height = self.rendered_text.get_size()
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        if self.room.spatial_hash is not None:
+            self.room.spatial_hash.move(self)
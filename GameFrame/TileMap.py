@@ -0,0 +1,160 @@
+import pygame
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+
+
+class TileMap:
+    """
+    A room-sized background drawn from fixed-size chunks, for rooms larger than the screen.
+
+    The background is split into square chunks, each drawn once when it first
+    comes into view and kept as a surface in the screen's format. Each frame
+    only the chunks overlapping the view are blitted, so a room many screens
+    across costs the same to draw as one screen. Chunks further than margin
+    chunks from the view are dropped from the cache, keeping memory bounded
+    however far the camera travels, while the ones just out of view are kept
+    for when the camera turns back.
+
+    Chunks are drawn by a function given the chunk's area of the room, such as
+    MazeGenerator.render_chunk, or from a grid of tiles with from_tiles.
+
+    Attributes:
+        width (int): Width of the map in pixels.
+        height (int): Height of the map in pixels.
+        chunk_size (int): Width and height of each chunk in pixels.
+        margin (int): Number of chunks around the view kept in the cache.
+        chunks (dict): The cached chunk surfaces, by (column, row).
+        rendered (int): Number of chunks drawn so far.
+        evicted (int): Number of chunks dropped from the cache so far.
+    """
+
+    def __init__(self, width: int, height: int, render_chunk: Callable[[pygame.Rect], pygame.Surface],
+                 chunk_size: int = 512, margin: int = 1):
+        """
+        Initializes the map. No chunks are drawn until they are shown.
+
+        Args:
+            width (int): Width of the map in pixels.
+            height (int): Height of the map in pixels.
+            render_chunk (callable): Draws the given rect of the map, returning a surface of its size.
+            chunk_size (int, optional): Width and height of each chunk in pixels. Defaults to 512.
+            margin (int, optional): Number of chunks around the view kept in the cache. Defaults to 1.
+        """
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.margin = margin
+        self.chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        self.rendered = 0
+        self.evicted = 0
+        self._render_chunk = render_chunk
+        self._visible = None
+
+    @classmethod
+    def from_tiles(cls, tiles: np.ndarray, images: List[pygame.Surface], tile_size: int,
+                   chunk_size: int = 512, margin: int = 1) -> 'TileMap':
+        """
+        Builds a map from a grid of tiles, each an index into a list of tile images.
+
+        Args:
+            tiles (numpy.ndarray): The image index of each tile, -1 for none, indexed [column, row].
+            images (list): The tile images, each tile_size pixels square.
+            tile_size (int): Width and height of each tile in pixels.
+            chunk_size (int, optional): Width and height of each chunk in pixels,
+                best a multiple of tile_size. Defaults to 512.
+            margin (int, optional): Number of chunks around the view kept in the cache. Defaults to 1.
+
+        Returns:
+            TileMap: The map.
+        """
+        def render_chunk(area: pygame.Rect) -> pygame.Surface:
+            surface = pygame.Surface(area.size, pygame.SRCALPHA)
+            first_column, first_row = area.left // tile_size, area.top // tile_size
+            last_column = min(-(-area.right // tile_size), tiles.shape[0])
+            last_row = min(-(-area.bottom // tile_size), tiles.shape[1])
+            batch = []
+            for column in range(first_column, last_column):
+                for row in range(first_row, last_row):
+                    index = tiles[column, row]
+                    if index >= 0:
+                        batch.append((images[index],
+                                      (column * tile_size - area.left, row * tile_size - area.top)))
+            surface.blits(batch, doreturn=False)
+            return surface
+
+        columns, rows = tiles.shape
+        return cls(columns * tile_size, rows * tile_size, render_chunk, chunk_size, margin)
+
+    def chunk(self, column: int, row: int) -> pygame.Surface:
+        """
+        Returns a chunk's surface, drawing it if it is not cached.
+
+        Args:
+            column (int): Column of the chunk.
+            row (int): Row of the chunk.
+
+        Returns:
+            pygame.Surface: The chunk, in the screen's format once there is a screen.
+        """
+        surface = self.chunks.get((column, row))
+        if surface is None:
+            size = self.chunk_size
+            area = pygame.Rect(column * size, row * size, size, size).clip(0, 0, self.width, self.height)
+            surface = self._render_chunk(area)
+            # - Converted once here rather than on every blit - #
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+            self.chunks[(column, row)] = surface
+            self.rendered += 1
+        return surface
+
+    def visible_range(self, view: pygame.Rect) -> Tuple[int, int, int, int]:
+        """
+        Finds the chunks overlapping a view.
+
+        Args:
+            view (pygame.Rect): The area shown, in map coordinates.
+
+        Returns:
+            tuple: The first column, first row, and the column and row after the last, inside the map.
+        """
+        size = self.chunk_size
+        return (max(view.left // size, 0), max(view.top // size, 0),
+                min(-(-view.right // size), -(-self.width // size)),
+                min(-(-view.bottom // size), -(-self.height // size)))
+
+    def draw(self, surface: pygame.Surface, view: pygame.Rect):
+        """
+        Blits the chunks overlapping a view, shifted so the view's top left is drawn at the surface's.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on, usually the screen.
+            view (pygame.Rect): The area to show, in map coordinates, usually Camera.view.
+        """
+        first_column, first_row, end_column, end_row = visible = self.visible_range(view)
+        size = self.chunk_size
+        left, top = view.topleft
+        surface.blits([(self.chunk(column, row), (column * size - left, row * size - top))
+                       for column in range(first_column, end_column)
+                       for row in range(first_row, end_row)], doreturn=False)
+        if visible != self._visible:
+            self._visible = visible
+            self._evict(*visible)
+
+    def _evict(self, first_column: int, first_row: int, end_column: int, end_row: int):
+        """
+        Drops cached chunks further than margin chunks from the visible ones.
+
+        Args:
+            first_column (int): First visible column.
+            first_row (int): First visible row.
+            end_column (int): The column after the last visible one.
+            end_row (int): The row after the last visible one.
+        """
+        margin = self.margin
+        far = [key for key in self.chunks
+               if not (first_column - margin <= key[0] < end_column + margin
+                       and first_row - margin <= key[1] < end_row + margin)]
+        for key in far:
+            del self.chunks[key]
+        self.evicted += len(far)
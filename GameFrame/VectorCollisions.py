@@ -0,0 +1,156 @@
+import itertools
+import numpy as np
+import pygame
+from typing import Dict, Iterable
+
+
+class VectorCollisions:
+    """
+    A collision backend that tests every registered pair of objects at once with NumPy.
+
+    Each frame the rects of all objects taking part in collisions are packed
+    into arrays. For each class name that objects have registered for, the
+    rects of the registered objects are tested against the rects of every
+    object of that class with one broadcast overlap test, done in chunks to
+    bound memory. handle_collision(other, other_type) is then called for the
+    hits only, in a fixed order: by the checking object's place in the level,
+    then by class name, alphabetically, then by the order the other objects
+    were added. The per-object loop instead follows
+    each object's collision_objects list, which is in the same order only
+    while no types are registered and no objects added after the list was
+    built, so games should not rely on the order of collisions within a frame.
+
+    Objects that override check_collisions are left to their own method,
+    which is called after the hits are handled, whether or not they have
+    registered any class names.
+
+    Attributes:
+        max_block (int): The largest number of pairs tested in one NumPy operation.
+        tests (int): The number of pairs tested in the last frame.
+        hits (int): The number of colliding pairs found in the last frame.
+    """
+
+    def __init__(self, max_block: int = 1 << 22):
+        """
+        Initializes the backend.
+
+        Args:
+            max_block (int, optional): The largest number of pairs tested in one NumPy operation.
+        """
+        self.max_block = max_block
+        self.tests = 0
+        self.hits = 0
+        self._overrides = {}
+
+    def check(self, objects: Iterable, colliding: Iterable, collision_interest: Dict[str, dict],
+              by_type: Dict[str, dict], deleted: dict):
+        """
+        Finds and handles all collisions between registered objects for one frame.
+
+        Args:
+            objects (Iterable): The level's objects, in update order.
+            colliding (Iterable): The objects the level calls check_collisions on, in update order.
+            collision_interest (Dict[str, dict]): Class name to the objects registered for it.
+            by_type (Dict[str, dict]): Class name to the objects of that class.
+            deleted (dict): Objects deleted this frame, which are skipped.
+        """
+        from GameFrame.RoomObject import RoomObject
+        self.tests = 0
+        self.hits = 0
+
+        # - Objects with their own check_collisions are run the usual way - #
+        overrides = self._overrides
+        custom = []
+        for obj in colliding:
+            cls = type(obj)
+            override = overrides.get(cls)
+            if override is None:
+                override = overrides[cls] = cls.check_collisions is not RoomObject.check_collisions
+            if override:
+                custom.append(obj)
+        watchers = {}
+        for watching in collision_interest.values():
+            watchers.update(watching)
+        for obj in custom:
+            watchers.pop(obj, None)
+
+        # - Class names are ranked alphabetically, so the order does not depend on set order - #
+        target_types = sorted(name for name in collision_interest if name in by_type)
+        involved = [obj for obj in objects
+                    if obj.rect.__class__ is pygame.Rect
+                    and (obj in watchers or type(obj).__name__ in collision_interest)]
+        position = {obj: index for index, obj in enumerate(involved)}
+
+        hits = []
+        if involved and watchers and target_types:
+            rects = np.fromiter(itertools.chain.from_iterable(obj.rect for obj in involved),
+                                dtype=np.int64, count=4 * len(involved)).reshape(-1, 4)
+            left = rects[:, 0]
+            top = rects[:, 1]
+            right = left + rects[:, 2]
+            bottom = top + rects[:, 3]
+            solid = (rects[:, 2] > 0) & (rects[:, 3] > 0)
+            for rank, name in enumerate(target_types):
+                checking = [obj for obj in collision_interest[name]
+                            if obj in position and obj in watchers]
+                targets = np.array([position[obj] for obj in by_type[name] if obj in position],
+                                   dtype=np.int64)
+                if checking and len(targets):
+                    checkers = np.array([position[obj] for obj in checking], dtype=np.int64)
+                    type_rank = np.full(len(checking), rank, dtype=np.int64)
+                    self._overlaps(checkers, type_rank, targets, left, top, right, bottom, solid,
+                                   name, hits)
+
+        if hits:
+            # - Dispatch by checking object, then class name, then the order the others were added - #
+            checker_index = np.concatenate([hit[0] for hit in hits])
+            type_rank = np.concatenate([hit[1] for hit in hits])
+            target_rank = np.concatenate([hit[2] for hit in hits])
+            target_index = np.concatenate([hit[3] for hit in hits])
+            names = list(itertools.chain.from_iterable(
+                itertools.repeat(hit[4], len(hit[0])) for hit in hits))
+            order = np.lexsort((target_rank, type_rank, checker_index)).tolist()
+            checker_index = checker_index.tolist()
+            target_index = target_index.tolist()
+            self.hits = len(order)
+            for hit in order:
+                obj = involved[checker_index[hit]]
+                other = involved[target_index[hit]]
+                if obj in deleted or other in deleted:
+                    continue
+                obj.handle_collision(other, names[hit])
+
+        for obj in custom:
+            if obj not in deleted:
+                obj.check_collisions()
+
+    def _overlaps(self, checkers, type_rank, targets, left, top, right, bottom, solid, name, hits):
+        """
+        Broadcast-tests checker rects against target rects, appending the overlapping pairs.
+
+        Args:
+            checkers: Indices of the objects registered for the class.
+            type_rank: The class name's alphabetical rank, once per checker.
+            targets: Indices of the objects of the class, in the order they were added.
+            left, top, right, bottom, solid: Per-object rect edges and non-empty flags.
+            name (str): The class name, handed to handle_collision.
+            hits (list): Receives (checker indices, type ranks, target ranks, target indices,
+                name) tuples.
+        """
+        target_left = left[targets]
+        target_top = top[targets]
+        target_right = right[targets]
+        target_bottom = bottom[targets]
+        target_solid = solid[targets]
+        step = max(1, self.max_block // len(targets))
+        for start in range(0, len(checkers), step):
+            block = checkers[start:start + step]
+            block_rank = type_rank[start:start + step]
+            overlap = ((left[block, None] < target_right) & (target_left < right[block, None]) &
+                       (top[block, None] < target_bottom) & (target_top < bottom[block, None]) &
+                       solid[block, None] & target_solid &
+                       (block[:, None] != targets))
+            self.tests += overlap.size
+            rows, cols = np.nonzero(overlap)
+            if len(rows):
+                hits.append((block[rows], block_rank[rows], cols, targets[cols], name))
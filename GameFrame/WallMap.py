@@ -0,0 +1,217 @@
+import os
+import zipfile
+import hashlib
+import tempfile
+import numpy as np
+import pygame
+from typing import Dict, Tuple
+from GameFrame.Globals import Globals
+
+
+class WallMap:
+    """
+    The walls of a room, read once from its background image or a separate mask image.
+
+    A pixel is a wall when it is opaque and dark, so the maze lines of a
+    background drawn on a light floor are found without any extra image, and
+    a mask image can mark walls in black on a transparent or white
+    background. The walls are kept two ways:
+
+    - a pygame Mask with one bit per wall pixel, for pixel-accurate tests of
+      an object's hitbox (see hits);
+    - a coarse grid of cells, each free unless a wall pixel falls inside it,
+      for constant-time lookups and path finding (see is_free).
+
+    Working these out means reading every pixel of the image, so the result
+    is saved in Globals.WALL_MAP_CACHE under the hash of the image files and
+    settings, and loaded from there while the images stay the same.
+
+    Attributes:
+        width (int): Width of the map in pixels.
+        height (int): Height of the map in pixels.
+        cell_size (int): Width and height of each grid cell in pixels.
+        mask (pygame.mask.Mask): The wall pixels.
+        grid (numpy.ndarray): True for each free cell, indexed [column, row].
+        key (str): Hash of the images and settings the map was made from, None if made directly.
+    """
+
+    # - Bump when the cache file layout changes - #
+    CACHE_VERSION = 1
+
+    _maps: Dict[str, 'WallMap'] = {}
+
+    def __init__(self, walls: np.ndarray, cell_size: int = 8, grid: np.ndarray = None, key: str = None):
+        """
+        Initializes the map from an array of wall pixels.
+
+        Args:
+            walls (numpy.ndarray): True for each wall pixel, indexed [x, y].
+            cell_size (int, optional): Width and height of each grid cell in pixels. Defaults to 8.
+            grid (numpy.ndarray, optional): The free cells, worked out from walls when not given.
+            key (str, optional): Hash of what the map was made from.
+        """
+        self.width, self.height = walls.shape
+        self.cell_size = cell_size
+        self.key = key
+
+        # - An 8-bit surface with a colorkey of 0 turns into a mask of the non-zero pixels - #
+        surface = pygame.Surface((self.width, self.height), depth=8)
+        pygame.surfarray.blit_array(surface, walls.astype(np.uint8))
+        surface.set_colorkey(0)
+        self.mask = pygame.mask.from_surface(surface)
+
+        if grid is None:
+            columns = -(-self.width // cell_size)
+            rows = -(-self.height // cell_size)
+            padded = np.zeros((columns * cell_size, rows * cell_size), dtype=bool)
+            padded[:self.width, :self.height] = walls
+            if cell_size in (1, 2, 4, 8):
+                # - Each cell's row of pixels read as one integer, non-zero if any pixel is a wall - #
+                grid = ~padded.view(f'u{cell_size}').reshape(columns, cell_size, rows).any(axis=1)
+            else:
+                grid = ~padded.reshape(columns, cell_size, rows, cell_size).any(axis=(1, 3))
+        self.grid = grid
+        self._boxes: Dict[Tuple[int, int], pygame.mask.Mask] = {}
+
+    @classmethod
+    def load(cls, image_path: str, mask_path: str = None, cell_size: int = 8,
+             threshold: int = 128) -> 'WallMap':
+        """
+        Returns the walls of an image, from memory or the disk cache when they were worked out before.
+
+        Args:
+            image_path (str): Path to the background image.
+            mask_path (str, optional): Path to an image marking the walls, used instead of the background.
+            cell_size (int, optional): Width and height of each grid cell in pixels. Defaults to 8.
+            threshold (int, optional): Pixels darker than this brightness (0-255) are walls. Defaults to 128.
+
+        Returns:
+            WallMap: The shared map for the image and settings.
+        """
+        source = mask_path or image_path
+        digest = hashlib.sha1()
+        with open(source, 'rb') as image_file:
+            digest.update(image_file.read())
+        digest.update(f'{cell_size}:{threshold}:{cls.CACHE_VERSION}'.encode())
+        key = digest.hexdigest()
+
+        wall_map = cls._maps.get(key)
+        if wall_map is not None:
+            return wall_map
+        cache_file = os.path.join(Globals.WALL_MAP_CACHE, f'walls-{key}.npz')
+        try:
+            with np.load(cache_file) as cached:
+                width, height = cached['size']
+                walls = np.unpackbits(cached['walls'], count=width * height).reshape(width, height)
+                grid = np.unpackbits(cached['grid'], count=cached['grid_size'].prod())
+                wall_map = cls(walls.astype(bool), cell_size,
+                               grid.reshape(cached['grid_size']).astype(bool), key)
+        # - A missing, truncated or empty cache file is just worked out again - #
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+            walls = cls.wall_pixels(pygame.image.load(source), threshold)
+            wall_map = cls(walls, cell_size, key=key)
+            wall_map.save(cache_file)
+        cls._maps[key] = wall_map
+        return wall_map
+
+    @staticmethod
+    def wall_pixels(image: pygame.Surface, threshold: int = 128) -> np.ndarray:
+        """
+        Finds the wall pixels of an image: those that are opaque and darker than threshold.
+
+        Args:
+            image (pygame.Surface): The image.
+            threshold (int, optional): Brightness (0-255) below which a pixel is a wall. Defaults to 128.
+
+        Returns:
+            numpy.ndarray: True for each wall pixel, indexed [x, y].
+        """
+        rgb = pygame.surfarray.array3d(image).astype(np.uint32)
+        brightness = (rgb[:, :, 0] * 299 + rgb[:, :, 1] * 587 + rgb[:, :, 2] * 114) // 1000
+        walls = brightness < threshold
+        if image.get_flags() & pygame.SRCALPHA:
+            walls &= pygame.surfarray.array_alpha(image) >= 128
+        return walls
+
+    def save(self, path: str):
+        """
+        Writes the map to a cache file. Failing to write it is not an error, the map is just worked out again.
+
+        The file is written under a temporary name and then renamed, so an
+        interrupted write never leaves a broken cache file behind.
+
+        Args:
+            path (str): The file to write.
+        """
+        walls = self._wall_array()
+        directory = os.path.dirname(path)
+        temporary = None
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=directory or '.', suffix='.tmp', delete=False) as cache_file:
+                temporary = cache_file.name
+                np.savez_compressed(cache_file, size=np.array((self.width, self.height)),
+                                    walls=np.packbits(walls),
+                                    grid_size=np.array(self.grid.shape), grid=np.packbits(self.grid))
+            os.replace(temporary, path)
+        except OSError:
+            if temporary is not None:
+                try:
+                    os.remove(temporary)
+                except OSError:
+                    pass
+
+    def _wall_array(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: True for each wall pixel, indexed [x, y].
+        """
+        surface = self.mask.to_surface(setcolor=(255, 255, 255), unsetcolor=(0, 0, 0))
+        return pygame.surfarray.pixels_red(surface) > 0
+
+    def hits(self, rect: pygame.Rect) -> bool:
+        """
+        Checks whether any wall pixel lies inside a rect. Anything outside the map is open.
+
+        Args:
+            rect (pygame.Rect): The area to test, in room coordinates.
+
+        Returns:
+            bool: True if the rect touches a wall.
+        """
+        size = rect.size
+        box = self._boxes.get(size)
+        if box is None:
+            box = self._boxes[size] = pygame.mask.Mask(size, fill=True)
+        return self.mask.overlap(box, rect.topleft) is not None
+
+    def is_free(self, x: float, y: float) -> bool:
+        """
+        Checks whether the grid cell holding a point has no walls in it.
+
+        Args:
+            x (float): X-coordinate in pixels.
+            y (float): Y-coordinate in pixels.
+
+        Returns:
+            bool: True if the cell is free, False if it holds a wall or is outside the map.
+        """
+        column = int(x // self.cell_size)
+        row = int(y // self.cell_size)
+        if column < 0 or row < 0 or column >= self.grid.shape[0] or row >= self.grid.shape[1]:
+            return False
+        return bool(self.grid[column, row])
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Returns the grid cell holding a point.
+
+        Args:
+            x (float): X-coordinate in pixels.
+            y (float): Y-coordinate in pixels.
+
+        Returns:
+            tuple: (column, row) of the cell.
+        """
+        return int(x // self.cell_size), int(y // self.cell_size)
@@ -4,3 +4,18 @@ from GameFrame.RoomObject import RoomObject
 from GameFrame.TextObject import TextObject
 from GameFrame.EntryTextObject import EntryTextObject
 from GameFrame.DataBaseController import DataBaseController
+from GameFrame.SpatialHash import SpatialHash
+from GameFrame.RenderList import RenderList
+from GameFrame.WallMap import WallMap
+from GameFrame.PathFinder import PathFinder
+from GameFrame.FlowField import FlowField
+from GameFrame.MazeGenerator import MazeGenerator
+from GameFrame.TileMap import TileMap
+from GameFrame.Camera import Camera
+from GameFrame.AssetCache import AssetCache
+from GameFrame.FontCache import FontCache
+from GameFrame.GlyphAtlas import GlyphAtlas
+from GameFrame.Scheduler import Scheduler, TimerHandle
+from GameFrame.InputState import InputState, KeyState
+from GameFrame.JoystickInput import JoystickInput
+from GameFrame.FrameProfiler import FrameProfiler
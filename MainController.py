@@ -1,9 +1,37 @@
 #!/usr/bin/python3
 
+import os
 import sys
+import argparse
+
+parser = argparse.ArgumentParser(description='Runs the game.')
+parser.add_argument('--headless', action='store_true',
+                    help='run without a window, as fast as possible')
+parser.add_argument('--frames', type=int, default=0,
+                    help='end each room after this many frames')
+parser.add_argument('--profile', metavar='FILE', nargs='?', const='profile_{room}.csv',
+                    help='time each frame phase and write the timings to FILE '
+                         '(.csv or .jsonl, {room} is replaced by the room name); press F3 for an overlay')
+parser.add_argument('--maze', metavar='SEED', type=int, nargs='?', const=-1,
+                    help='play a generated maze instead of the drawn one, from SEED or a new one each game')
+args = parser.parse_args()
+
+# - Headless runs use SDL's dummy drivers so no window or sound device is needed - #
+if args.headless:
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
 import pygame
 from GameFrame import Globals
 
+Globals.headless = args.headless
+Globals.max_room_frames = args.frames
+Globals.profile_frames = args.profile is not None
+Globals.profile_output = args.profile
+if args.maze is not None:
+    Globals.maze_seed = args.maze if args.maze >= 0 else None
+    Globals.levels = ['GeneratedMaze' if level == 'GamePlay' else level for level in Globals.levels]
+
 pygame.mixer.pre_init(44100, -16, 2, 2048)
 pygame.mixer.init()
 pygame.init()
@@ -44,4 +72,8 @@ while Globals.running:
     if Globals.exiting:
         break
 
+    # - Headless runs go through the room sequence once - #
+    if Globals.headless and curr_level == len(levels) - 1:
+        break
+
 sys.exit()
@@ -6,35 +6,38 @@ class Character(RoomObject):
         RoomObject.__init__(self, room, x, y)
         image = self.load_image("Character_right.png")
         self.set_image(image,64,64)
-        self.handle_key_events = True
+        # - Only the body is stopped by walls, so the character fits the corridors - #
+        self.hitbox = pygame.Rect(16, 12, 32, 44)
+        self.area = pygame.Rect(275, 10, 650, 690)
+        self.subscribe_key(pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
 
     def key_pressed(self, key):
         if key[pygame.K_w]:
-            self.y -= 8
+            self.move_within_walls(0, -8)
             image = self.load_image("Character_forward.png")
             self.set_image(image,64,64)
         elif key[pygame.K_s]:
-            self.y += 8
+            self.move_within_walls(0, 8)
             image = self.load_image("Character_back.png")
             self.set_image(image,64,64)
         elif key[pygame.K_a]:
-            self.x -= 8
+            self.move_within_walls(-8, 0)
             image = self.load_image("Character_left.png")
             self.set_image(image,64,64)
         elif key[pygame.K_d]:
-            self.x += 8
+            self.move_within_walls(8, 0)
             image = self.load_image("Character_right.png")
             self.set_image(image,64,64)
 
     def keep_in_room(self):
-        if self.y < 10:
-            self.y = 10
-        elif self.y > 700:
-            self.y = 700
-        if self.x < 275:
-            self.x = 275
-        elif self.x > 925:
-            self.x = 925
+        if self.y < self.area.top:
+            self.y = self.area.top
+        elif self.y > self.area.bottom:
+            self.y = self.area.bottom
+        if self.x < self.area.left:
+            self.x = self.area.left
+        elif self.x > self.area.right:
+            self.x = self.area.right
             
     def step(self):
         self.keep_in_room()
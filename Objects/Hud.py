@@ -2,7 +2,7 @@ from GameFrame import TextObject, Globals
 
 class Score(TextObject):
     def __init__(self, room, x: int, y: int, text=None):
-        TextObject.__init__(self, room, x, y, text)
+        TextObject.__init__(self, room, x, y, text, atlas=True)
              
         self.size = 60
         self.font = 'Arial Black'
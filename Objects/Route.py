@@ -0,0 +1,65 @@
+from GameFrame import RoomObject
+import pygame
+
+class Route(RoomObject):
+    def __init__(self, room, character):
+        RoomObject.__init__(self, room, 0, 0)
+        self.character = character
+        self.showing = False
+        self.cell = None
+        self.hide()
+
+        self.subscribe_key(pygame.K_h)
+
+    def key_down(self, key):
+        self.showing = not self.showing
+        self.cell = None
+        if not self.showing:
+            self.hide()
+
+    def hide(self):
+        self.image = pygame.Surface((1, 1), pygame.SRCALPHA)
+        self.width = 1
+        self.height = 1
+        self.rect = pygame.Rect(self.x, self.y, 1, 1)
+
+    def goal(self, finder, cell):
+        # - The nearest coin still in the room, then the exit - #
+        distances = []
+        for name in ('Goldcoin1', 'Goldcoin2', 'Goldcoin3'):
+            if self.room.objects_of_type(name) and finder.distance(cell, name) >= 0:
+                distances.append((finder.distance(cell, name), name))
+        if distances:
+            return min(distances)[1]
+        return 'End'
+
+    def step(self):
+        if not self.showing:
+            return
+        finder = self.room.path_finder
+        hitbox = self.character.hitbox_at(self.character.x, self.character.y)
+        cell = finder.nearest_open(finder.cell_at(hitbox.x, hitbox.y))
+        # - Only redrawn when the character reaches another cell - #
+        if cell is None or cell == self.cell:
+            return
+        self.cell = cell
+        path = finder.path(cell, self.goal(finder, cell))
+        if not path:
+            self.hide()
+            return
+
+        # - A dot every few cells, where the middle of the character would pass - #
+        dots = []
+        for x, y in (finder.position_of(step) for step in path[4::4]):
+            dots.append((x + hitbox.width // 2, y + hitbox.height // 2))
+        if not dots:
+            self.hide()
+            return
+        self.x = min(x for x, y in dots) - 4
+        self.y = min(y for x, y in dots) - 4
+        self.width = max(x for x, y in dots) - self.x + 5
+        self.height = max(y for x, y in dots) - self.y + 5
+        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        for x, y in dots:
+            pygame.draw.circle(self.image, (230, 160, 20), (x - self.x, y - self.y), 4)
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
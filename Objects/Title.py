@@ -8,7 +8,7 @@ class Title(RoomObject):
         image = self.load_image("Title.png")
         self.set_image(image, 440, 440)
 
-        self.handle_key_events = True
+        self.subscribe_key(pygame.K_SPACE)
 
     def key_pressed(self, key):
 
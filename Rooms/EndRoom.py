@@ -5,3 +5,4 @@ class EndRoom(Level):
         Level.__init__(self, screen, joysticks)
 
         self.set_background_image("EndRoom_background.png")
+        self.set_dirty_rect_rendering()
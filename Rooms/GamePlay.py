@@ -1,4 +1,4 @@
-from GameFrame import Level, Globals
+from GameFrame import Level, Globals, TextObject
 from Objects.Character import Character
 from Objects.End import End
 from Objects.Startflag import Startflag
@@ -7,14 +7,18 @@ from Objects.Goldcoin2 import Goldcoin2
 from Objects.Goldcoin3 import Goldcoin3
 from Objects.Hud import Score
 from Objects.Hint import Hint
+from Objects.Route import Route
 
 class GamePlay(Level):
     def __init__(self, screen, joysticks):
         Level.__init__(self, screen, joysticks)
 
         self.set_background_image("Background.png")
+        self.set_wall_map("Background.png")
+        self.set_dirty_rect_rendering()
 
-        self.add_room_object(Character(self,280,700))
+        character = Character(self,280,700)
+        self.add_room_object(character)
 
         self.add_room_object(End(self,920,30))
 
@@ -25,6 +29,14 @@ class GamePlay(Level):
         self.add_room_object(Goldcoin3(self, 923, 415))
 
         self.add_room_object(Hint(self, 50, 350))
+        self.add_room_object(TextObject(self, 50, 460, 'Press H for the way', size=24))
+
+        # - Routes for the hint, to the exit and each coin - #
+        self.enable_path_finding(*character.hitbox.size)
+        for goal in self.objects:
+            if type(goal).__name__ in ('End', 'Goldcoin1', 'Goldcoin2', 'Goldcoin3'):
+                self.path_finder.add_goal_rect(type(goal).__name__, goal.rect)
+        self.add_room_object(Route(self, character))
 
         self.score = Score(self, 
                            Globals.SCREEN_WIDTH/8 - 20, 20, 
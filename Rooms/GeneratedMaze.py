@@ -0,0 +1,44 @@
+from GameFrame import Level, Globals, MazeGenerator
+from Objects.Character import Character
+from Objects.End import End
+from Objects.Startflag import Startflag
+from Objects.Goldcoin1 import Goldcoin1
+from Objects.Goldcoin2 import Goldcoin2
+from Objects.Goldcoin3 import Goldcoin3
+from Objects.Hud import Score
+from Objects.Route import Route
+import pygame
+
+class GeneratedMaze(Level):
+    def __init__(self, screen, joysticks):
+        Level.__init__(self, screen, joysticks)
+
+        # - A new maze each game, or the same one every time when a seed is set - #
+        # - It is larger than the screen, so the camera follows the character - #
+        maze = MazeGenerator(40, 25, Globals.maze_seed)
+        self.set_maze(maze)
+        self.set_dirty_rect_rendering()
+
+        character = Character(self, *maze.position_of(maze.start, (64, 64)))
+        character.area = pygame.Rect(0, 0, maze.width, maze.height)
+        self.add_room_object(character)
+        self.enable_camera(character)
+
+        self.add_room_object(End(self, *maze.position_of(maze.end, (64, 64))))
+
+        self.add_room_object(Startflag(self, *maze.position_of(maze.start, (64, 64))))
+
+        for coin, cell in zip((Goldcoin1, Goldcoin2, Goldcoin3), maze.coins):
+            self.add_room_object(coin(self, *maze.position_of(cell, (48, 48))))
+
+        self.enable_path_finding(*character.hitbox.size)
+        for goal in self.objects:
+            if type(goal).__name__ in ('End', 'Goldcoin1', 'Goldcoin2', 'Goldcoin3'):
+                self.path_finder.add_goal_rect(type(goal).__name__, goal.rect)
+        self.add_room_object(Route(self, character))
+
+        self.score = Score(self, 
+                           Globals.SCREEN_WIDTH/8 - 20, 20, 
+                           str(Globals.SCORE))
+        self.score.fixed = True
+        self.add_room_object(self.score)
@@ -6,5 +6,6 @@ class WelcomeScreen(Level):
         Level.__init__(self, screen, joysticks)
 
         self.set_background_image("Welcomepage_Background.png")
+        self.set_dirty_rect_rendering()
 
         self.add_room_object(Title(self,420,10))
\ No newline at end of file
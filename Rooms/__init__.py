@@ -1,3 +1,4 @@
 from Rooms.WelcomeScreen import WelcomeScreen
 from Rooms.GamePlay import GamePlay
-from Rooms.EndRoom import EndRoom
\ No newline at end of file
+from Rooms.EndRoom import EndRoom
+from Rooms.GeneratedMaze import GeneratedMaze
\ No newline at end of file
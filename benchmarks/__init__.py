@@ -0,0 +1,9 @@
+"""
+Benchmarks for the GameFrame engine.
+
+    python -m benchmarks                      frame rate and latency of the synthetic scenes
+    python -m benchmarks.collision_scaling    brute-force vs spatial hash collision checks
+    python -m benchmarks.maze_generation      carving and drawing mazes of growing size
+    python -m benchmarks.camera_scrolling     a large scrolling room drawn through a camera
+    python -m benchmarks.path_finding         A* routes and distance fields on large grids
+"""
@@ -0,0 +1,99 @@
+"""
+Times drawing generated mazes of growing size through a TileMap and a scrolling Camera.
+
+Run from the repository root:
+
+    python -m benchmarks.camera_scrolling
+
+The camera pans around each maze for --frames frames, drawing the tile map
+and a fixed number of objects spread over the maze. Only the chunks and
+objects in view are drawn, so the frame time stays about the same however
+many screens the maze covers. Worst frames include drawing chunks that come
+into view for the first time.
+"""
+import os
+import sys
+import math
+import time
+import random
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from GameFrame import Globals, Level, RoomObject, MazeGenerator, TileMap
+
+OBJECT_SIZE = 48
+PAN_SPEED = 24
+
+
+class Marker(RoomObject):
+    def __init__(self, room, x, y, image):
+        RoomObject.__init__(self, room, x, y)
+        self.image = image
+        self.width = self.height = OBJECT_SIZE
+        self.rect = pygame.Rect(x, y, OBJECT_SIZE, OBJECT_SIZE)
+
+
+def build_room(screen, screens: int, objects: int, seed: int) -> Level:
+    # - A maze covering about screens windows, screens being a square number - #
+    side = int(math.sqrt(screens))
+    maze = MazeGenerator(side * Globals.SCREEN_WIDTH // 72, side * Globals.SCREEN_HEIGHT // 72, seed)
+    room = Level(screen, [])
+    room.set_tile_map(TileMap(maze.width, maze.height, maze.render_chunk))
+    room.enable_camera()
+    image = pygame.Surface((OBJECT_SIZE, OBJECT_SIZE)).convert()
+    image.fill((230, 160, 20))
+    generator = random.Random(seed)
+    for _ in range(objects):
+        room.add_room_object(Marker(room, generator.randrange(maze.width - OBJECT_SIZE),
+                                    generator.randrange(maze.height - OBJECT_SIZE), image))
+    return room
+
+
+def time_frames(room: Level, frames: int):
+    camera = room.camera
+    tile_map = room.tile_map
+    times = []
+    x = y = 0.0
+    angle = 0.3
+    with room:
+        for frame in range(frames):
+            # - Wander around the maze, turning back at the edges - #
+            angle += 0.02
+            x = min(max(x + PAN_SPEED * math.cos(angle), 0), tile_map.width)
+            y = min(max(y + PAN_SPEED * math.sin(angle * 0.7), 0), tile_map.height)
+            camera.move_to(x, y)
+            start = time.perf_counter()
+            room.step()
+            times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2], times[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--screens', type=int, nargs='+', default=[1, 4, 16, 64],
+                        help='size of each maze in windows, square numbers')
+    parser.add_argument('--objects', type=int, default=500)
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode((Globals.SCREEN_WIDTH, Globals.SCREEN_HEIGHT))
+
+    print(f"{'screens':>8} {'maze px':>12} {'median ms':>10} {'worst ms':>9} {'rendered':>9} "
+          f"{'cached':>7} {'drawn':>6}")
+    for screens in args.screens:
+        room = build_room(screen, screens, args.objects, args.seed)
+        median, worst = time_frames(room, args.frames)
+        tile_map = room.tile_map
+        print(f"{screens:>8} {f'{tile_map.width}x{tile_map.height}':>12} {median * 1000:>10.2f} "
+              f"{worst * 1000:>9.2f} {tile_map.rendered:>9} {len(tile_map.chunks):>7} {room.drawn_objects:>6}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
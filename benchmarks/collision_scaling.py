@@ -0,0 +1,88 @@
+"""
+Compares the brute-force collision pass against the spatial hash broad phase.
+
+Run from the repository root:
+
+    python -m benchmarks.collision_scaling
+
+Objects are spread at a constant density, so the brute-force pass grows with
+the square of the object count while the spatial hash pass stays close to linear.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from GameFrame import Level, RoomObject
+
+OBJECT_SIZE = 32
+AREA_PER_OBJECT = 96 * 96
+
+
+class Ball(RoomObject):
+    def __init__(self, room, x, y):
+        RoomObject.__init__(self, room, x, y)
+        self.image = pygame.Surface((OBJECT_SIZE, OBJECT_SIZE))
+        self.width = self.height = OBJECT_SIZE
+        self.rect = pygame.Rect(x, y, OBJECT_SIZE, OBJECT_SIZE)
+        self.x_speed = random.choice((-2, -1, 1, 2))
+        self.y_speed = random.choice((-2, -1, 1, 2))
+        self.hits = 0
+        self.register_collision_object('Ball')
+
+    def handle_collision(self, other, other_type):
+        self.hits += 1
+
+
+def build_room(screen, count: int, use_hash: bool) -> Level:
+    room = Level(screen, [])
+    if use_hash:
+        room.enable_spatial_hash(OBJECT_SIZE * 4)
+    side = int((count * AREA_PER_OBJECT) ** 0.5)
+    for _ in range(count):
+        room.add_room_object(Ball(room, random.randrange(side), random.randrange(side)))
+    for obj in room.objects:
+        room.init_collision_list(obj)
+    return room
+
+
+def time_frames(room: Level, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        for obj in room.objects:
+            obj.update()
+        for obj in room.objects:
+            obj.check_collisions()
+    return (time.perf_counter() - start) / frames
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--frames', type=int, default=5)
+    parser.add_argument('--max-brute', type=int, default=2000,
+                        help='skip the brute-force pass above this many objects')
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode((1, 1))
+    random.seed(1)
+
+    print(f"{'objects':>8} {'brute ms':>10} {'hashed ms':>10} {'speedup':>8}")
+    for count in args.counts:
+        hashed = time_frames(build_room(screen, count, True), args.frames)
+        if count <= args.max_brute:
+            brute = time_frames(build_room(screen, count, False), args.frames)
+            print(f"{count:>8} {brute * 1000:>10.2f} {hashed * 1000:>10.2f} {brute / hashed:>7.1f}x")
+        else:
+            print(f"{count:>8} {'skipped':>10} {hashed * 1000:>10.2f} {'-':>8}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Times building generated mazes of growing size.
+
+Run from the repository root:
+
+    python -m benchmarks.maze_generation
+
+For each size the maze is carved and its walkability grid and one 512x512
+background chunk are worked out. Mazes small enough to be drawn whole are
+also turned into a full background and WallMap, which is what a room built
+on the maze pays for. Every time is the best of --repeats runs.
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from GameFrame import MazeGenerator
+
+CHUNK_SIZE = 512
+
+
+def best_time(function, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[16, 64, 256, 512, 1024],
+                        help='width and height of each maze in cells')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--max-room', type=int, default=32,
+                        help='skip the full background and WallMap above this many cells across')
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    chunk = pygame.Rect(0, 0, CHUNK_SIZE, CHUNK_SIZE)
+
+    print(f"{'cells':>9} {'carve ms':>10} {'grid ms':>9} {'chunk ms':>9} {'room ms':>9} {'us/cell':>8}")
+    for size in args.sizes:
+        carve = best_time(lambda: MazeGenerator(size, size, args.seed), args.repeats)
+        maze = MazeGenerator(size, size, args.seed)
+        # - The grid is kept once worked out, so only the first call is timed - #
+        start = time.perf_counter()
+        maze.walkable()
+        grid = time.perf_counter() - start
+        drawn = best_time(lambda: maze.render_chunk(chunk), args.repeats)
+        if size <= args.max_room:
+            room = best_time(lambda: (maze.render(), maze.wall_map()), args.repeats)
+            room_text = f"{room * 1000:>9.2f}"
+        else:
+            room_text = f"{'skipped':>9}"
+        cells = size * size
+        print(f"{cells:>9} {carve * 1000:>10.2f} {grid * 1000:>9.2f} {drawn * 1000:>9.2f} {room_text} "
+              f"{carve / cells * 1e6:>8.2f}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Times path finding across grids of growing size.
+
+Run from the repository root:
+
+    python -m benchmarks.path_finding
+
+For each size an A* route is found from one corner to the other, once over
+an open grid with no walls and once through a generated maze of about the
+same size, and a distance field is worked out for the maze's far corner.
+Each route is found by a new PathFinder, so the route cache never answers.
+Every time is the best of --repeats runs.
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+from GameFrame import MazeGenerator, PathFinder
+
+
+def best_route_time(grid: np.ndarray, repeats: int) -> float:
+    best = float('inf')
+    columns, rows = grid.shape
+    for _ in range(repeats):
+        finder = PathFinder(grid)
+        start = time.perf_counter()
+        route = finder.path((1, 1), (columns - 2, rows - 2))
+        best = min(best, time.perf_counter() - start)
+        assert route is not None
+    return best
+
+
+def best_field_time(grid: np.ndarray, repeats: int) -> float:
+    best = float('inf')
+    columns, rows = grid.shape
+    finder = PathFinder(grid)
+    for _ in range(repeats):
+        start = time.perf_counter()
+        finder.distances_from([(columns - 2, rows - 2)])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 250, 500, 1000],
+                        help='width and height of each grid in cells')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"{'cells':>9} {'open ms':>9} {'maze ms':>9} {'field ms':>9}")
+    for size in args.sizes:
+        open_grid = np.ones((size, size), dtype=bool)
+        # - A maze of n cells is 2n + 1 grid entries across - #
+        maze_grid = MazeGenerator(size // 2, size // 2, args.seed).walkable()
+        open_time = best_route_time(open_grid, args.repeats)
+        maze_time = best_route_time(maze_grid, args.repeats)
+        field_time = best_field_time(maze_grid, args.repeats)
+        print(f"{size * size:>9} {open_time * 1000:>9.2f} {maze_time * 1000:>9.2f} {field_time * 1000:>9.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
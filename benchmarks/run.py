@@ -0,0 +1,136 @@
+"""
+Runs the GameFrame benchmark scenes and reports frame rate and frame latency.
+
+Run from the repository root:
+
+    python -m benchmarks
+    python -m benchmarks --scenes moving collision --frames 600
+    python -m benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks --baseline benchmarks/baseline.json
+    python -m benchmarks --engine entity-store spatial-hash
+
+Each scene prints one JSON object per line. With --baseline, each result is
+compared against the stored result for the same scene and object count, and
+scenes whose median frame time got worse by more than --tolerance are
+reported as regressions.
+"""
+import os
+import json
+import time
+import random
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from GameFrame import Globals, InputState
+from benchmarks.scenes import SCENES
+
+
+# - Optional engine features that can be switched on for a run - #
+ENGINE_OPTIONS = {
+    'spatial-hash': lambda room: room.enable_spatial_hash(),
+    'entity-store': lambda room: room.enable_entity_store(),
+    'dirty-rects': lambda room: room.set_dirty_rect_rendering(),
+    'vector-collisions': lambda room: room.enable_vectorized_collisions(),
+}
+
+
+def percentile(values, fraction):
+    """
+    Returns the value at the given fraction of a sorted list.
+    """
+    return values[round((len(values) - 1) * fraction)]
+
+
+def run_scene(screen, name, count, frames, warmup, render, engine=()):
+    """
+    Builds a scene and steps it, returning its frame rate and latency percentiles.
+    """
+    random.seed(name)
+    scene_class = SCENES[name][0]
+    Globals.headless = not render
+    room = scene_class(screen, count)
+    for option in engine:
+        ENGINE_OPTIONS[option](room)
+    inputs = InputState()
+    with room:
+        for _ in range(warmup):
+            room.step(inputs)
+
+        times = []
+        start = time.perf_counter()
+        for _ in range(frames):
+            frame_start = time.perf_counter()
+            room.step(inputs)
+            times.append(time.perf_counter() - frame_start)
+        total = time.perf_counter() - start
+
+    times.sort()
+    return {
+        'scene': name,
+        'count': count,
+        'frames': frames,
+        'render': render,
+        'engine': sorted(engine),
+        'fps': round(frames / total, 1),
+        'p50_ms': round(percentile(times, 0.50) * 1000, 4),
+        'p95_ms': round(percentile(times, 0.95) * 1000, 4),
+        'p99_ms': round(percentile(times, 0.99) * 1000, 4),
+        'max_ms': round(times[-1] * 1000, 4),
+    }
+
+
+def compare(result, baseline, tolerance):
+    """
+    Adds the change against the matching baseline result, if there is one.
+    """
+    for old in baseline:
+        if all(old.get(key) == result[key] for key in ('scene', 'count', 'render', 'engine')):
+            change = result['p50_ms'] / old['p50_ms'] - 1 if old['p50_ms'] else 0.0
+            result['baseline_p50_ms'] = old['p50_ms']
+            result['p50_change'] = round(change, 3)
+            result['regression'] = change > tolerance
+            return
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Runs the GameFrame benchmark scenes.')
+    parser.add_argument('--scenes', nargs='+', choices=sorted(SCENES), default=list(SCENES))
+    parser.add_argument('--count', type=int, help='objects per scene, instead of each scene\'s default')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--no-render', action='store_true', help='skip drawing, timing game logic only')
+    parser.add_argument('--engine', nargs='+', choices=sorted(ENGINE_OPTIONS), default=[],
+                        help='optional engine features to switch on')
+    parser.add_argument('--baseline', metavar='FILE', help='compare against results saved in FILE')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='median slow-down counted as a regression (default 0.10)')
+    parser.add_argument('--save-baseline', metavar='FILE', help='save the results to FILE')
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode((Globals.SCREEN_WIDTH, Globals.SCREEN_HEIGHT))
+
+    baseline = []
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    results = []
+    for name in args.scenes:
+        count = args.count or SCENES[name][1]
+        result = run_scene(screen, name, count, args.frames, args.warmup, not args.no_render, args.engine)
+        if baseline:
+            compare(result, baseline, args.tolerance)
+        results.append(result)
+        print(json.dumps(result), flush=True)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+            baseline_file.write('\n')
+
+    pygame.quit()
+    return 1 if any(result.get('regression') for result in results) else 0
@@ -0,0 +1,290 @@
+"""
+Synthetic rooms for benchmarking the GameFrame engine.
+
+Each scene is a Level subclass built from generated surfaces, so no image,
+font or sound files are needed. The number of objects is set by count.
+"""
+import random
+import numpy as np
+import pygame
+from GameFrame import Level, RoomObject, TextObject, Globals, WallMap
+
+
+class Sprite(RoomObject):
+    """
+    A plain coloured square that wanders around the screen.
+    """
+
+    def __init__(self, room, x, y, size=16):
+        RoomObject.__init__(self, room, x, y)
+        self.image = pygame.Surface((size, size))
+        self.image.fill((random.randrange(256), random.randrange(256), random.randrange(256)))
+        self.width = self.height = size
+        self.rect = pygame.Rect(x, y, size, size)
+        self.x_speed = random.choice((-3, -2, -1, 1, 2, 3))
+        self.y_speed = random.choice((-3, -2, -1, 1, 2, 3))
+
+    def step(self):
+        if self.x < 0 or self.x > Globals.SCREEN_WIDTH - self.width:
+            self.x_speed *= -1
+        if self.y < 0 or self.y > Globals.SCREEN_HEIGHT - self.height:
+            self.y_speed *= -1
+
+
+class Block(Sprite):
+    """
+    A still square that Movers collide with.
+    """
+
+    def __init__(self, room, x, y):
+        Sprite.__init__(self, room, x, y, 24)
+        self.x_speed = 0
+        self.y_speed = 0
+
+
+class Mover(Sprite):
+    """
+    A moving square that counts collisions with Blocks and other Movers.
+    """
+
+    def __init__(self, room, x, y):
+        Sprite.__init__(self, room, x, y)
+        self.hits = 0
+        self.register_collision_object('Block')
+        self.register_collision_object('Mover')
+
+    def handle_collision(self, other, other_type):
+        self.hits += 1
+
+
+class Pickup(RoomObject):
+    """
+    A still square that never moves and counts Movers touching it, like a coin.
+    """
+
+    def __init__(self, room, x, y):
+        RoomObject.__init__(self, room, x, y)
+        self.image = pygame.Surface((12, 12))
+        self.image.fill((230, 190, 40))
+        self.width = self.height = 12
+        self.rect = pygame.Rect(x, y, 12, 12)
+        self.hits = 0
+        self.register_collision_object('Mover')
+
+    def handle_collision(self, other, other_type):
+        self.hits += 1
+
+
+class Counter(TextObject):
+    """
+    A text object whose text changes every frame.
+    """
+
+    def __init__(self, room, x, y):
+        TextObject.__init__(self, room, x, y, '0', size=20)
+        self.value = 0
+
+    def step(self):
+        self.value = (self.value + 1) % 1000
+        self.text = str(self.value)
+        self.update_text()
+
+
+class Ticker(RoomObject):
+    """
+    An object with a repeating timer and a stream of one-shot timers.
+    """
+
+    def __init__(self, room, x, y):
+        RoomObject.__init__(self, room, x, y)
+        self.image = pygame.Surface((1, 1))
+        self.rect = pygame.Rect(x, y, 1, 1)
+        self.fired = 0
+        self.set_timer(random.randint(1, 30), self.tick, repeat=True)
+        self.set_timer(random.randint(1, 60), self.one_shot)
+
+    def tick(self):
+        self.fired += 1
+
+    def one_shot(self):
+        self.fired += 1
+        self.set_timer(random.randint(1, 60), self.one_shot)
+
+
+class Particle(Sprite):
+    """
+    A short-lived square that deletes itself after a few frames.
+    """
+
+    def __init__(self, room, x, y):
+        Sprite.__init__(self, room, x, y, 4)
+        self.life = random.randint(5, 20)
+
+    def step(self):
+        self.life -= 1
+        if self.life <= 0:
+            self.room.delete_object(self)
+
+
+class Spawner(RoomObject):
+    """
+    Keeps the room topped up with Particles.
+    """
+
+    def __init__(self, room, population):
+        RoomObject.__init__(self, room, 0, 0)
+        self.image = pygame.Surface((1, 1))
+        self.rect = pygame.Rect(0, 0, 1, 1)
+        self.population = population
+
+    def step(self):
+        missing = self.population - self.room.count_object('Particle')
+        for _ in range(missing):
+            self.room.add_room_object(Particle(self.room,
+                                               random.randrange(Globals.SCREEN_WIDTH),
+                                               random.randrange(Globals.SCREEN_HEIGHT)))
+
+
+class Runner(Sprite):
+    """
+    A square running back and forth across the screen, ignoring walls, for Chasers to follow.
+    """
+
+    def __init__(self, room, x, y):
+        Sprite.__init__(self, room, x, y, 12)
+        self.x_speed = 4
+        self.y_speed = 0
+
+
+class Chaser(Sprite):
+    """
+    A square following the room's flow field towards the Runner.
+    """
+
+    def __init__(self, room, x, y):
+        Sprite.__init__(self, room, x, y, 12)
+        self.x_speed = 0
+        self.y_speed = 0
+
+    def step(self):
+        self.follow_flow_field(self.room.chase, 2)
+
+
+class BenchScene(Level):
+    """
+    Base class for benchmark rooms: a plain background and count objects.
+    """
+
+    def __init__(self, screen, count):
+        Level.__init__(self, screen, [])
+        self.background_color = (40, 40, 40)
+        self.populate(count)
+
+    def populate(self, count):
+        pass
+
+    def random_position(self):
+        return random.randrange(Globals.SCREEN_WIDTH - 24), random.randrange(Globals.SCREEN_HEIGHT - 24)
+
+
+class MovingScene(BenchScene):
+    """
+    Objects moving and bouncing off the screen edges.
+    """
+
+    def populate(self, count):
+        for _ in range(count):
+            self.add_room_object(Sprite(self, *self.random_position()))
+
+
+class CollisionScene(BenchScene):
+    """
+    Moving objects checking collisions against still blocks and each other.
+    """
+
+    def populate(self, count):
+        for _ in range(count // 2):
+            self.add_room_object(Block(self, *self.random_position()))
+        for _ in range(count - count // 2):
+            self.add_room_object(Mover(self, *self.random_position()))
+
+
+class StaticScene(BenchScene):
+    """
+    Mostly still pickups with a few Movers running over them.
+    """
+
+    def populate(self, count):
+        movers = max(1, count // 100)
+        for _ in range(count - movers):
+            self.add_room_object(Pickup(self, *self.random_position()))
+        for _ in range(movers):
+            self.add_room_object(Mover(self, *self.random_position()))
+
+
+class TextScene(BenchScene):
+    """
+    Text objects changing their text every frame.
+    """
+
+    def populate(self, count):
+        for _ in range(count):
+            self.add_room_object(Counter(self, *self.random_position()))
+
+
+class TimerScene(BenchScene):
+    """
+    Objects with repeating and one-shot timers.
+    """
+
+    def populate(self, count):
+        for _ in range(count):
+            self.add_room_object(Ticker(self, *self.random_position()))
+
+
+class ChurnScene(BenchScene):
+    """
+    Short-lived particles being spawned and deleted every frame.
+    """
+
+    def populate(self, count):
+        self.add_room_object(Spawner(self, count))
+
+
+class ChaseScene(BenchScene):
+    """
+    Objects chasing a moving target through walls, all following one flow field.
+    """
+
+    def populate(self, count):
+        # - Vertical walls with gaps at alternating ends, so routes snake across the room - #
+        walls = np.zeros((Globals.SCREEN_WIDTH, Globals.SCREEN_HEIGHT), dtype=bool)
+        self.background_image = pygame.Surface((Globals.SCREEN_WIDTH, Globals.SCREEN_HEIGHT))
+        self.background_image.fill(self.background_color)
+        for number, x in enumerate(range(100, Globals.SCREEN_WIDTH - 50, 100)):
+            top, bottom = (80, Globals.SCREEN_HEIGHT) if number % 2 else (0, Globals.SCREEN_HEIGHT - 80)
+            walls[x:x + 8, top:bottom] = True
+            self.background_image.fill((90, 90, 120), (x, top, 8, bottom - top))
+        self.background_set = True
+        self.wall_map = WallMap(walls)
+        self.enable_path_finding(12, 12)
+
+        runner = Runner(self, 20, Globals.SCREEN_HEIGHT // 2)
+        self.add_room_object(runner)
+        self.chase = self.add_flow_field(runner)
+        for _ in range(count):
+            x, y = self.random_position()
+            while self.wall_map.hits(pygame.Rect(x, y, 12, 12)):
+                x, y = self.random_position()
+            self.add_room_object(Chaser(self, x, y))
+
+
+SCENES = {
+    'moving': (MovingScene, 1000),
+    'collision': (CollisionScene, 300),
+    'static': (StaticScene, 2000),
+    'text': (TextScene, 100),
+    'timers': (TimerScene, 5000),
+    'churn': (ChurnScene, 500),
+    'chase': (ChaseScene, 500),
+}
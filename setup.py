@@ -57,7 +57,7 @@ setup(
     {
         "build_exe": 
         {
-            "packages":["pygame"],
+            "packages":["pygame", "numpy"],
             "include_files":include_files,
             "include_msvcr": True
         },